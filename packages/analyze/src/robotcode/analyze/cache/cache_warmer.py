@@ -0,0 +1,141 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from robotcode.core.concurrent import RLock
+from robotcode.core.lsp.types import Diagnostic, DiagnosticSeverity
+from robotcode.core.text_document import TextDocument
+from robotcode.plugin import Application
+from robotcode.robot.config.model import RobotBaseProfile
+from robotcode.robot.diagnostics.data_cache import CacheSection
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.imports_manager import ImportsManager
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
+from robotcode.robot.diagnostics.workspace_config import WorkspaceAnalysisConfig
+
+from ..code.code_analyzer import CodeAnalyzer
+from ..code.robot_framework_language_provider import RobotFrameworkLanguageProvider
+
+
+@dataclass
+class CacheEntryResult:
+    section: str
+    name: str
+    source: Optional[str]
+    cached: bool
+    elapsed: float
+    errors: int = 0
+
+
+@dataclass
+class ImportFailure:
+    source: str
+    line: int
+    code: Optional[str]
+    message: str
+
+
+@dataclass
+class CacheWarmResult:
+    documents: int = 0
+    resources: int = 0
+    elapsed: float = 0.0
+    entries: List[CacheEntryResult] = field(default_factory=list)
+    failures: List[ImportFailure] = field(default_factory=list)
+
+    @property
+    def built(self) -> int:
+        # entries with errors are not usable, they are reported as failures of the importing documents
+        return sum(1 for e in self.entries if not e.cached and not e.errors)
+
+    @property
+    def reused(self) -> int:
+        return sum(1 for e in self.entries if e.cached and not e.errors)
+
+
+class CacheWarmer:
+    def __init__(
+        self,
+        app: Application,
+        analysis_config: WorkspaceAnalysisConfig,
+        robot_profile: RobotBaseProfile,
+        root_folder: Optional[Path],
+    ):
+        self.app = app
+
+        self._analyzer = CodeAnalyzer(app, analysis_config, robot_profile, root_folder)
+        self._lock = RLock(default_timeout=120, name="CacheWarmer.lock")
+        self._entries: List[CacheEntryResult] = []
+
+    @property
+    def document_cache(self) -> DocumentsCacheHelper:
+        return next(
+            h.document_cache for h in self._analyzer.language_handlers if isinstance(h, RobotFrameworkLanguageProvider)
+        )
+
+    def _on_library_doc_loaded(
+        self, sender: Any, section: CacheSection, doc: LibraryDoc, cached: bool, elapsed: float
+    ) -> None:
+        with self._lock:
+            self._entries.append(
+                CacheEntryResult(section.value, doc.name, doc.source, cached, elapsed, len(doc.errors or []))
+            )
+
+    def _warm_document(self, document: TextDocument) -> Tuple[List[Diagnostic], Set[str]]:
+        # initializing the namespace loads all imports, the same way as `analyze code` does, but without analyzing
+        namespace = self.document_cache.get_namespace(document)
+
+        diagnostics = namespace.get_import_diagnostics()
+
+        return [d for d in diagnostics if d.severity == DiagnosticSeverity.ERROR], set(namespace.get_resources().keys())
+
+    def run(self, paths: Iterable[Path] = {}, filter: Iterable[str] = {}, jobs: int = 1) -> CacheWarmResult:
+        start = time.monotonic()
+        result = CacheWarmResult()
+        resources: Set[str] = set()
+
+        for folder in self._analyzer.workspace.workspace_folders:
+            imports_manager: ImportsManager = self.document_cache.get_imports_manager_for_workspace_folder(folder)
+            imports_manager.library_doc_loaded.add(self._on_library_doc_loaded)
+            try:
+                documents = self._analyzer.collect_documents(folder, paths=paths, filter=filter)
+                result.documents += len(documents)
+
+                self.app.verbose(f"Loading the imports of {len(documents)} documents with {jobs} threads")
+
+                with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+                    futures = [(d, executor.submit(self._warm_document, d)) for d in documents]
+
+                    for document, future in futures:
+                        source = str(document.uri.to_path())
+                        try:
+                            diagnostics, document_resources = future.result()
+                        except (SystemExit, KeyboardInterrupt):
+                            raise
+                        except BaseException as e:
+                            result.failures.append(ImportFailure(source, 1, type(e).__qualname__, str(e)))
+                            continue
+
+                        resources.update(document_resources)
+                        result.failures.extend(
+                            ImportFailure(
+                                source,
+                                d.range.start.line + 1,
+                                str(d.code) if d.code is not None else None,
+                                d.message,
+                            )
+                            for d in diagnostics
+                        )
+            finally:
+                imports_manager.library_doc_loaded.remove(self._on_library_doc_loaded)
+
+        with self._lock:
+            result.entries = sorted(self._entries, key=lambda e: (e.section, e.name, e.source or ""))
+            self._entries = []
+
+        result.resources = len(resources)
+        result.elapsed = time.monotonic() - start
+
+        return result
@@ -0,0 +1,200 @@
+from pathlib import Path
+from typing import Optional, Tuple
+
+import click
+
+from robotcode.core.utils.path import try_get_relative_path
+from robotcode.plugin import Application, OutputFormat, pass_application
+from robotcode.robot.config.loader import (
+    load_robot_config_from_path,
+)
+from robotcode.robot.config.utils import get_config_files
+
+from ..__version__ import __version__
+from ..code.code_analyzer import resolve_jobs
+from ..config import AnalyzeConfig
+from .cache_warmer import CacheWarmer, CacheWarmResult
+
+
+@click.group(
+    add_help_option=True,
+    invoke_without_command=False,
+)
+@click.version_option(
+    version=__version__,
+    package_name="robotcode.analyze",
+    prog_name="RobotCode Analyze",
+)
+def cache() -> None:
+    """\
+    Commands to manage the cache of libraries, variables and resources used by the analysis.
+    """
+
+
+@cache.command(
+    add_help_option=True,
+)
+@click.option(
+    "-f",
+    "--filter",
+    "filter",
+    metavar="PATTERN",
+    type=str,
+    multiple=True,
+    help="""\
+        Glob pattern to filter files whose imports are loaded. Can be specified multiple times.
+        """,
+)
+@click.option(
+    "-v",
+    "--variable",
+    metavar="name:value",
+    type=str,
+    multiple=True,
+    help="Set variables in the test data. see `robot --variable` option.",
+)
+@click.option(
+    "-V",
+    "--variablefile",
+    metavar="PATH",
+    type=str,
+    multiple=True,
+    help="Python or YAML file file to read variables from. see `robot --variablefile` option.",
+)
+@click.option(
+    "-P",
+    "--pythonpath",
+    metavar="PATH",
+    type=str,
+    multiple=True,
+    help="Additional locations where to search test libraries"
+    " and other extensions when they are imported. see `robot --pythonpath` option.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    metavar="N",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Number of threads used to load the imports of the documents. 0 means one per CPU.",
+)
+@click.option(
+    "--strict",
+    is_flag=True,
+    default=False,
+    help="Exit with a non-zero return code if an import could not be loaded.",
+)
+@click.argument(
+    "paths", nargs=-1, type=click.Path(exists=True, dir_okay=True, file_okay=True, readable=True, path_type=Path)
+)
+@pass_application
+def warm(
+    app: Application,
+    filter: Tuple[str, ...],
+    variable: Tuple[str, ...],
+    variablefile: Tuple[str, ...],
+    pythonpath: Tuple[str, ...],
+    jobs: int,
+    strict: bool,
+    paths: Tuple[Path],
+) -> None:
+    """\
+        Loads all libraries, resources and variables files imported by the documents in the specified *PATHS*
+        and writes them to the cache, so that a later analysis or the language server can use them directly.
+        Useful e.g. for building container images or in CI pipelines.
+
+        The files and the configuration are resolved the same way as in `analyze code`.
+
+        \b
+        *Examples*:
+        ```
+        robotcode analyze cache warm
+        robotcode analyze cache warm --strict --jobs 4
+        robotcode --profile ci analyze cache warm tests
+        robotcode --format json analyze cache warm
+        ```
+    """
+
+    config_files, root_folder, _ = get_config_files(
+        paths,
+        app.config.config_files,
+        root_folder=app.config.root,
+        no_vcs=app.config.no_vcs,
+        verbose_callback=app.verbose,
+    )
+
+    try:
+        robot_config = load_robot_config_from_path(
+            *config_files, extra_tools={"robotcode-analyze": AnalyzeConfig}, verbose_callback=app.verbose
+        )
+
+        analyzer_config = robot_config.tool.get("robotcode-analyze", None) if robot_config.tool is not None else None
+        if analyzer_config is None:
+            analyzer_config = AnalyzeConfig()
+
+        robot_profile = robot_config.combine_profiles(
+            *(app.config.profiles or []), verbose_callback=app.verbose, error_callback=app.error
+        ).evaluated_with_env()
+
+        if variable:
+            if robot_profile.variables is None:
+                robot_profile.variables = {}
+            for v in variable:
+                name, value = v.split(":", 1) if ":" in v else (v, "")
+                robot_profile.variables.update({name: value})
+
+        if pythonpath:
+            if robot_profile.python_path is None:
+                robot_profile.python_path = []
+            robot_profile.python_path.extend(pythonpath)
+
+        if variablefile:
+            if robot_profile.variable_files is None:
+                robot_profile.variable_files = []
+            for vf in variablefile:
+                robot_profile.variable_files.append(vf)
+
+        result = CacheWarmer(
+            app=app,
+            analysis_config=analyzer_config.to_workspace_analysis_config(),
+            robot_profile=robot_profile,
+            root_folder=root_folder,
+        ).run(paths=paths, filter=filter, jobs=resolve_jobs(jobs))
+
+        if app.config.output_format is None or app.config.output_format == OutputFormat.TEXT:
+            _print_result(app, root_folder, result)
+        else:
+            app.print_data(result, remove_defaults=False)
+
+        app.exit(1 if strict and result.failures else 0)
+
+    except (TypeError, ValueError) as e:
+        raise click.ClickException(str(e)) from e
+
+
+def _print_result(app: Application, root_folder: Optional[Path], result: CacheWarmResult) -> None:
+    for entry in result.entries:
+        if entry.errors:
+            continue
+
+        app.echo(
+            click.style(f"[{'reused' if entry.cached else 'built'}] ", fg="blue" if entry.cached else "green")
+            + f"{entry.section} {entry.name} ({entry.elapsed:.3f}s)"
+        )
+
+    for failure in result.failures:
+        app.echo(
+            f"{try_get_relative_path(Path(failure.source), root_folder)}:{failure.line}: "
+            + click.style(f"[E] {failure.code}", fg="red")
+            + f": {failure.message.splitlines()[0] if failure.message else ''}"
+        )
+
+    summary = (
+        f"Documents: {result.documents}, Resources: {result.resources}, Entries built: {result.built}, "
+        f"Entries reused: {result.reused}, Failures: {len(result.failures)}, Time: {result.elapsed:.3f}s"
+    )
+    if result.failures:
+        summary = click.style(summary, fg="red")
+
+    app.echo(summary)
@@ -3,6 +3,7 @@ import click
 from robotcode.plugin import Application, pass_application
 
 from .__version__ import __version__
+from .cache.cli import cache
 from .code.cli import code
 
 
@@ -24,3 +25,4 @@ def analyze(app: Application) -> None:
 
 
 analyze.add_command(code)
+analyze.add_command(cache)
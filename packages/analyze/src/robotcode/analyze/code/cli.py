@@ -18,7 +18,7 @@ from robotcode.robot.config.utils import get_config_files
 
 from ..__version__ import __version__
 from ..config import AnalyzeConfig, ExitCodeMask, ModifiersConfig
-from .code_analyzer import CodeAnalyzer, DocumentDiagnosticReport, FolderDiagnosticReport
+from .code_analyzer import CodeAnalyzer, DocumentDiagnosticReport, FolderDiagnosticReport, resolve_jobs
 
 SEVERITY_COLORS = {
     DiagnosticSeverity.ERROR: "red",
@@ -216,6 +216,16 @@ def _split_comma(ctx: click.Context, param: click.Option, value: Optional[List[s
     help="Extend the exit code mask with the specified values. This appends to the default mask, defined in the config"
     " file.",
 )
+@click.option(
+    "-j",
+    "--jobs",
+    metavar="N",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Number of worker processes used to analyze the documents. 0 means one per CPU."
+    " If not given, the `jobs` setting of the config file is used, otherwise all documents are analyzed"
+    " in a single process.",
+)
 @click.argument(
     "paths", nargs=-1, type=click.Path(exists=True, dir_okay=True, file_okay=True, readable=True, path_type=Path)
 )
@@ -233,6 +243,7 @@ def code(
     modifiers_hint: Tuple[str, ...],
     exit_code_mask: ExitCodeMask,
     extend_exit_code_mask: ExitCodeMask,
+    jobs: Optional[int],
     paths: Tuple[Path],
 ) -> None:
     """\
@@ -257,6 +268,7 @@ def code(
         robotcode analyze code --filter **/*.robot
         robotcode analyze code tests/acceptance/first.robot
         robotcode analyze code -mi DuplicateKeyword tests/acceptance/first.robot
+        robotcode analyze code --jobs 4
         robotcode --format json analyze code
         ```
     """
@@ -335,13 +347,16 @@ def code(
         )
         mask = default_mask | extend_exit_code_mask
 
+        if jobs is None and analyzer_config.code is not None:
+            jobs = analyzer_config.code.jobs
+
         statistics = Statistic(mask)
         for e in CodeAnalyzer(
             app=app,
             analysis_config=analyzer_config.to_workspace_analysis_config(),
             robot_profile=robot_profile,
             root_folder=root_folder,
-        ).run(paths=paths, filter=filter):
+        ).run(paths=paths, filter=filter, jobs=resolve_jobs(jobs)):
             statistics.add_diagnostics_report(e)
 
             if isinstance(e, FolderDiagnosticReport):
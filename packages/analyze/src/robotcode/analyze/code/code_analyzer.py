@@ -1,6 +1,9 @@
-from dataclasses import dataclass
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Iterable, List, Optional, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 from robotcode.core.ignore_spec import IgnoreSpec
 from robotcode.core.lsp.types import Diagnostic
@@ -79,7 +82,7 @@ class CodeAnalyzer(DiagnosticsContext):
         return self._dispatcher
 
     def run(
-        self, paths: Iterable[Path] = {}, filter: Iterable[str] = {}
+        self, paths: Iterable[Path] = {}, filter: Iterable[str] = {}, jobs: int = 1
     ) -> Iterable[Union[DocumentDiagnosticReport, FolderDiagnosticReport]]:
         for folder in self.workspace.workspace_folders:
             self.app.verbose(f"Initialize folder {folder.uri.to_path()}")
@@ -98,20 +101,16 @@ class CodeAnalyzer(DiagnosticsContext):
 
             documents = self.collect_documents(folder, paths=paths, filter=filter)
 
-            self.app.verbose(f"Analyzing {len(documents)} documents")
-            for document in documents:
-                analyze_result = self.diagnostics.analyze_document(document)
-                if analyze_result is not None:
-                    diagnostics = []
-                    for item in analyze_result:
-                        if item is None:
-                            continue
-                        elif isinstance(item, BaseException):
-                            self.app.error(f"Error analyzing {document.uri.to_path()}: {item}")
-                        else:
-                            diagnostics.extend(item)
+            if jobs > 1 and len(documents) > 1:
+                yield from self._analyze_documents_in_workers(documents, jobs)
+            else:
+                self.app.verbose(f"Analyzing {len(documents)} documents")
+                for document in documents:
+                    items, errors = self.analyze_document(document)
+                    for error in errors:
+                        self.app.error(error)
 
-                    yield DocumentDiagnosticReport(document, diagnostics)
+                    yield DocumentDiagnosticReport(document, items)
 
             self.app.verbose(f"Collect Diagnostics for {len(documents)} documents")
             for document in documents:
@@ -128,6 +127,44 @@ class CodeAnalyzer(DiagnosticsContext):
 
                     yield DocumentDiagnosticReport(document, diagnostics)
 
+    def analyze_document(self, document: TextDocument) -> Tuple[List[Diagnostic], List[str]]:
+        diagnostics: List[Diagnostic] = []
+        errors: List[str] = []
+        for item in self.diagnostics.analyze_document(document):
+            if isinstance(item, BaseException):
+                errors.append(f"Error analyzing {document.uri.to_path()}: {item}")
+            elif item is not None:
+                diagnostics.extend(item)
+
+        return diagnostics, errors
+
+    def _analyze_documents_in_workers(
+        self, documents: List[TextDocument], jobs: int
+    ) -> Iterable[DocumentDiagnosticReport]:
+        jobs = min(jobs, len(documents))
+
+        self.app.verbose(f"Analyzing {len(documents)} documents in {jobs} worker processes")
+
+        # every worker builds its own namespaces, the library and variables docs are shared via the on-disk cache,
+        # results are yielded in document order, so the output is the same as with a single process
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=mp.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(worker_analysis_config(self.analysis_config), self.profile, self.root_folder),
+        ) as executor:
+            results = executor.map(
+                _analyze_document_in_worker,
+                [str(document.uri.to_path()) for document in documents],
+                chunksize=max(1, min(16, len(documents) // (jobs * 4))),
+            )
+
+            for document, (items, errors) in zip(documents, results):
+                for error in errors:
+                    self.app.error(error)
+
+                yield DocumentDiagnosticReport(document, items)
+
     def collect_documents(
         self, folder: WorkspaceFolder, paths: Iterable[Path] = {}, filter: Iterable[str] = {}
     ) -> List[TextDocument]:
@@ -159,3 +196,44 @@ class CodeAnalyzer(DiagnosticsContext):
                     continue
 
         return documents
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    if jobs is None:
+        return 1
+
+    if jobs <= 0:
+        return os.cpu_count() or 1
+
+    return jobs
+
+
+def worker_analysis_config(analysis_config: WorkspaceAnalysisConfig) -> WorkspaceAnalysisConfig:
+    # the analysis workers already run in parallel, every worker loads its libraries in a single library worker,
+    # otherwise n jobs would start n times the configured library workers
+    return replace(analysis_config, cache=replace(analysis_config.cache, library_workers=1))
+
+
+_worker_analyzer: Optional[CodeAnalyzer] = None
+
+
+def _initialize_worker(
+    analysis_config: WorkspaceAnalysisConfig, robot_profile: RobotBaseProfile, root_folder: Path
+) -> None:
+    global _worker_analyzer
+
+    _worker_analyzer = CodeAnalyzer(Application(), analysis_config, robot_profile, root_folder)
+
+
+def _analyze_document_in_worker(path: str) -> Tuple[List[Diagnostic], List[str]]:
+    if _worker_analyzer is None:
+        raise RuntimeError("Worker is not initialized.")
+
+    try:
+        document = _worker_analyzer.workspace.documents.get_or_open_document(Path(path))
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except Exception as e:
+        return [], [f"Error reading {path}: {e}"]
+
+    return _worker_analyzer.analyze_document(document)
@@ -50,6 +50,10 @@ class RobotFrameworkLanguageProvider(LanguageProvider):
         self.diagnostics_context.diagnostics.folder_analyzers.add(self.analyze_folder)
         self.diagnostics_context.diagnostics.document_analyzers.add(self.analyze_document)
 
+    @property
+    def document_cache(self) -> DocumentsCacheHelper:
+        return self._document_cache
+
     def _update_python_path(self) -> None:
         root_path = (
             self.diagnostics_context.workspace.root_uri.to_path()
@@ -4,6 +4,7 @@ from enum import IntFlag
 from typing import Iterable, List, Literal, Optional, Union
 
 from robotcode.robot.config.model import BaseOptions, field
+from robotcode.robot.diagnostics.data_cache import CacheStorage
 from robotcode.robot.diagnostics.workspace_config import (
     AnalysisDiagnosticModifiersConfig,
     AnalysisRobotConfig,
@@ -197,6 +198,44 @@ class CacheConfig(BaseOptions):
         description="Extend the ignore arguments for library settings."
     )
 
+    library_workers: Optional[int] = field(
+        description="""\
+            Specifies the number of worker processes used to load libraries and variables files.
+            If not set or `0`, the number of workers is calculated from the number of CPUs.
+            """,
+    )
+    library_worker_max_jobs: Optional[int] = field(
+        description="""\
+            Specifies the number of libraries a worker process loads before it is restarted.
+            `0` disables the restart.
+            """,
+    )
+    library_worker_max_memory: Optional[int] = field(
+        description="""\
+            Specifies the memory usage in MB after which a worker process is restarted.
+            `0` disables the memory limit.
+            """,
+    )
+    storage: Optional[Literal["pickle", "json", "sqlite"]] = field(
+        description="""\
+            Specifies how the library and variables cache is stored.
+            `pickle` and `json` write a file per entry, `sqlite` stores all entries
+            compressed in a single database file.
+            If not set, `pickle` is used.
+
+            On network file systems like NFS or SMB, `sqlite` can't use write-ahead logging,
+            because it needs shared memory on one host. The database then uses a rollback journal,
+            so readers wait while another process writes to the cache.
+            """,
+    )
+    shared_cache: Optional[bool] = field(
+        description="""\
+            Enables a second cache in the user cache directory for libraries of installed distributions,
+            like the standard libraries or libraries installed with pip. It is shared between all projects
+            that use the same Python environment, Python version and Robot Framework version.
+            """,
+    )
+
 
 class ExitCodeMask(IntFlag):
     NONE = 0
@@ -246,6 +285,19 @@ class CodeConfig(BaseOptions):
             """,
     )
     extend_exit_code_mask: Optional[ExitCodeMaskList] = field(description="Extend the exit code mask setting.")
+    jobs: Optional[int] = field(
+        description="""\
+            Specifies the number of worker processes used to analyze the documents.
+            If not set or `1`, all documents are analyzed in the current process.
+            `0` uses one worker process per CPU.
+
+            Examples:
+            ```toml
+            [tool.robotcode-analyze.code]
+            jobs = 4
+            ```
+            """,
+    )
 
 
 @dataclass
@@ -327,6 +379,11 @@ class AnalyzeConfig(BaseOptions):
                     ignored_libraries=self.cache.ignored_libraries or [],
                     ignored_variables=self.cache.ignored_variables or [],
                     ignore_arguments_for_library=self.cache.ignore_arguments_for_library or [],
+                    library_workers=self.cache.library_workers,
+                    library_worker_max_jobs=self.cache.library_worker_max_jobs,
+                    library_worker_max_memory=self.cache.library_worker_max_memory,
+                    storage=CacheStorage(self.cache.storage) if self.cache.storage is not None else None,
+                    shared_cache=self.cache.shared_cache,
                 )
                 if self.cache is not None
                 else WorkspaceCacheConfig()
@@ -1,8 +1,13 @@
 import contextlib
+import enum
+import functools
+import heapq
 import inspect
+import itertools
 import os
 import threading
-from concurrent.futures import CancelledError, Future
+import time
+from concurrent.futures import CancelledError, Future, wait
 from types import TracebackType
 from typing import (
     Any,
@@ -11,8 +16,10 @@ from typing import (
     Generic,
     Iterator,
     List,
+    NamedTuple,
     Optional,
     Protocol,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -105,9 +112,16 @@ _TResult = TypeVar("_TResult")
 __THREADED_MARKER = "__robotcode_threaded"
 
 
+class TaskPriority(enum.IntEnum):
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
 class Task(Future, Generic[_TResult]):  # type: ignore[type-arg]
-    def __init__(self) -> None:
+    def __init__(self, priority: TaskPriority = TaskPriority.NORMAL) -> None:
         super().__init__()
+        self.priority = priority
         self.cancelation_requested_event = threading.Event()
 
     @property
@@ -205,7 +219,7 @@ def check_current_task_canceled(at_least_seconds: Optional[float] = None, raise_
 
 
 _running_tasks_lock = RLock()
-_running_tasks: Dict[Task[Any], threading.Thread] = {}
+_running_tasks: Dict[Task[Any], Optional[threading.Thread]] = {}
 
 
 def _remove_future_from_running_tasks(future: Task[Any]) -> None:
@@ -216,10 +230,243 @@ def _remove_future_from_running_tasks(future: Task[Any]) -> None:
 _P = ParamSpec("_P")
 
 
+class TaskPoolStatistics(NamedTuple):
+    workers: int
+    busy_workers: int
+    queue_depth: int
+    submitted: int
+    completed: int
+    average_wait_time: float
+    max_wait_time: float
+    interactive_tasks: int
+    average_interactive_latency: float
+    max_interactive_latency: float
+
+
+class _WorkItem:
+    __slots__ = ("args", "callable", "enqueued", "future", "kwargs", "priority", "sequence")
+
+    def __init__(
+        self,
+        priority: TaskPriority,
+        sequence: int,
+        future: Task[Any],
+        callable: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.priority = priority
+        self.sequence = sequence
+        self.future = future
+        self.callable = callable
+        self.args = args
+        self.kwargs = kwargs
+        self.enqueued = time.monotonic()
+
+    def __lt__(self, other: "_WorkItem") -> bool:
+        return (self.priority, self.sequence) < (other.priority, other.sequence)
+
+
+class TaskPool:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_overflow_workers: int = 128,
+        starvation_timeout: float = 0.5,
+        idle_timeout: float = 60,
+    ) -> None:
+        self.max_workers = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) + 4)
+        self.max_overflow_workers = max_overflow_workers
+        self.starvation_timeout = starvation_timeout
+        self.idle_timeout = idle_timeout
+
+        self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
+        self._starving = threading.Condition(self._lock)
+        self._queue: List[_WorkItem] = []
+        self._sequence = itertools.count()
+        self._workers: Set[threading.Thread] = set()
+        self._worker_counter = itertools.count(1)
+        self._idle_workers = 0
+        self._busy_workers = 0
+        self._supervisor: Optional[threading.Thread] = None
+        self._is_shutdown = False
+
+        self._submitted = 0
+        self._completed = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+        self._interactive_tasks = 0
+        self._no_interactive_tasks = threading.Condition(self._lock)
+        self._interactive_completed = 0
+        self._total_interactive_latency = 0.0
+        self._max_interactive_latency = 0.0
+
+    @property
+    def statistics(self) -> TaskPoolStatistics:
+        with self._lock:
+            started = self._completed + self._busy_workers
+            return TaskPoolStatistics(
+                len(self._workers),
+                self._busy_workers,
+                len(self._queue),
+                self._submitted,
+                self._completed,
+                self._total_wait_time / started if started else 0.0,
+                self._max_wait_time,
+                self._interactive_tasks,
+                (self._total_interactive_latency / self._interactive_completed if self._interactive_completed else 0.0),
+                self._max_interactive_latency,
+            )
+
+    @property
+    def has_interactive_tasks(self) -> bool:
+        return self._interactive_tasks > 0
+
+    def wait_for_interactive_tasks(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            return self._no_interactive_tasks.wait_for(lambda: self._interactive_tasks == 0, timeout)
+
+    def _interactive_task_done(self, submitted: float, future: Task[Any]) -> None:
+        latency = time.monotonic() - submitted
+
+        with self._lock:
+            self._interactive_tasks -= 1
+            self._interactive_completed += 1
+            self._total_interactive_latency += latency
+            self._max_interactive_latency = max(self._max_interactive_latency, latency)
+
+            if self._interactive_tasks == 0:
+                self._no_interactive_tasks.notify_all()
+
+    def submit(
+        self,
+        priority: TaskPriority,
+        callable: Callable[_P, _TResult],
+        *args: _P.args,
+        **kwargs: _P.kwargs,
+    ) -> Task[_TResult]:
+        future: Task[_TResult] = Task(priority)
+
+        with _running_tasks_lock:
+            _running_tasks[future] = None
+            future.add_done_callback(_remove_future_from_running_tasks)
+
+        with self._lock:
+            if self._is_shutdown:
+                raise RuntimeError("Cannot schedule new tasks after shutdown.")
+
+            heapq.heappush(self._queue, _WorkItem(priority, next(self._sequence), future, callable, args, kwargs))
+            self._submitted += 1
+
+            if priority == TaskPriority.INTERACTIVE:
+                self._interactive_tasks += 1
+                future.add_done_callback(functools.partial(self._interactive_task_done, time.monotonic()))
+
+            if self._idle_workers >= len(self._queue):
+                self._work_available.notify()
+            elif len(self._workers) < self.max_workers:
+                self._start_worker()
+            else:
+                self._start_supervisor()
+                self._starving.notify()
+
+        return future
+
+    def _start_worker(self) -> None:
+        worker = threading.Thread(
+            target=self._run_worker, name=f"robotcode task pool worker {next(self._worker_counter)}", daemon=True
+        )
+        self._workers.add(worker)
+        worker.start()
+
+    def _start_supervisor(self) -> None:
+        if self._supervisor is None:
+            self._supervisor = threading.Thread(
+                target=self._supervise, name="robotcode task pool supervisor", daemon=True
+            )
+            self._supervisor.start()
+
+    def _run_worker(self) -> None:
+        current_thread = threading.current_thread()
+        worker_name = current_thread.name
+
+        with self._lock:
+            try:
+                while True:
+                    while not self._queue:
+                        if self._is_shutdown:
+                            return
+
+                        self._idle_workers += 1
+                        try:
+                            notified = self._work_available.wait(self.idle_timeout)
+                        finally:
+                            self._idle_workers -= 1
+
+                        if not notified and not self._queue:
+                            return
+
+                    item = heapq.heappop(self._queue)
+
+                    wait_time = time.monotonic() - item.enqueued
+                    self._total_wait_time += wait_time
+                    self._max_wait_time = max(self._max_wait_time, wait_time)
+                    self._busy_workers += 1
+
+                    self._lock.release()
+                    try:
+                        with _running_tasks_lock:
+                            if item.future in _running_tasks:
+                                _running_tasks[item.future] = current_thread
+
+                        current_thread.name = str(item.callable)
+                        _run_task_in_thread_handler(item.future, item.callable, item.args, item.kwargs)
+                    finally:
+                        current_thread.name = worker_name
+                        self._lock.acquire()
+                        self._busy_workers -= 1
+                        self._completed += 1
+            finally:
+                self._workers.discard(current_thread)
+
+    def _supervise(self) -> None:
+        # a task can wait for other tasks, if all workers are blocked, start additional workers to avoid deadlocks
+        with self._lock:
+            while not self._is_shutdown:
+                if not self._queue or self._idle_workers:
+                    self._starving.wait()
+                    continue
+
+                waited = time.monotonic() - min(item.enqueued for item in self._queue)
+                if waited < self.starvation_timeout:
+                    self._starving.wait(self.starvation_timeout - waited)
+                    continue
+
+                if len(self._workers) < self.max_workers + self.max_overflow_workers:
+                    self._start_worker()
+
+                self._starving.wait(self.starvation_timeout)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._is_shutdown = True
+            self._work_available.notify_all()
+            self._starving.notify_all()
+
+
+_task_pool = TaskPool()
+
+
+def get_task_pool() -> TaskPool:
+    return _task_pool
+
+
 def _create_task_in_thread(
     callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs
 ) -> Tuple[Task[_TResult], threading.Thread]:
-    future: Task[_TResult] = Task()
+    future: Task[_TResult] = Task(_get_current_task_priority())
     with _running_tasks_lock:
         thread = threading.Thread(
             target=_run_task_in_thread_handler,
@@ -234,7 +481,24 @@ def _create_task_in_thread(
     return future, thread
 
 
+def _get_current_task_priority() -> TaskPriority:
+    local_future = _local_storage._local_future
+    return local_future.priority if local_future is not None else TaskPriority.NORMAL
+
+
 def run_as_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
+    return _task_pool.submit(_get_current_task_priority(), callable, *args, **kwargs)
+
+
+def run_as_interactive_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
+    return _task_pool.submit(TaskPriority.INTERACTIVE, callable, *args, **kwargs)
+
+
+def run_as_background_task(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
+    return _task_pool.submit(TaskPriority.BACKGROUND, callable, *args, **kwargs)
+
+
+def run_in_thread(callable: Callable[_P, _TResult], *args: _P.args, **kwargs: _P.kwargs) -> Task[_TResult]:
     future, thread = _create_task_in_thread(callable, *args, **kwargs)
 
     thread.start()
@@ -259,11 +523,19 @@ def run_as_debugpy_hidden_task(callable: Callable[_P, _TResult], *args: _P.args,
 
 def _cancel_all_running_tasks(timeout: Optional[float] = None) -> None:
     threads: List[threading.Thread] = []
+    futures: List[Task[Any]] = []
     with _running_tasks_lock:
         for future, thread in _running_tasks.items():
             if not future.cancelation_requested:
                 future.cancel()
-                threads.append(thread)
+                if thread is None or thread in _task_pool._workers:
+                    futures.append(future)
+                else:
+                    threads.append(thread)
     for thread in threads:
         if thread is not threading.current_thread():
             thread.join(timeout=timeout)
+
+    futures = [f for f in futures if f is not _local_storage._local_future]
+    if futures:
+        wait(futures, timeout=timeout)
@@ -1,7 +1,6 @@
 import collections
 import functools
 import inspect
-import io
 import weakref
 from contextlib import contextmanager
 from typing import (
@@ -9,6 +8,7 @@ from typing import (
     Callable,
     Dict,
     Final,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -85,6 +85,39 @@ def range_to_utf16(lines: List[str], range: Range) -> Range:
     )
 
 
+class Utf16ColumnMap:
+    __slots__ = ("_from_utf16", "_to_utf16")
+
+    def __init__(self, line: str) -> None:
+        self._to_utf16 = [0]
+        self._from_utf16 = [0]
+
+        utf16_counter = 0
+        for i, c in enumerate(line, 1):
+            if is_multibyte_char(c):
+                utf16_counter += 2
+                self._from_utf16.append(i - 1)
+            else:
+                utf16_counter += 1
+            self._from_utf16.append(i)
+            self._to_utf16.append(utf16_counter)
+
+    @classmethod
+    def create(cls, line: str) -> Optional["Utf16ColumnMap"]:
+        return cls(line) if has_multibyte_char(line) else None
+
+    def from_utf16(self, character: int) -> int:
+        return self._from_utf16[min(character, len(self._from_utf16) - 1)]
+
+    def to_utf16(self, character: int) -> int:
+        return self._to_utf16[min(character, len(self._to_utf16) - 1)]
+
+
+_NOT_CREATED: Any = object()
+
+_LINE_BREAKS = ("\n", "\r", "\v", "\f", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+
+
 class InvalidRangeError(Exception):
     pass
 
@@ -116,10 +149,13 @@ class TextDocument:
         self.uri = Uri(self.document_uri).normalized()
         self.language_id = language_id
         self._version = version
-        self._text = text
+        # either the text or the lines are set, the other one is created lazily
+        self._text: Optional[str] = text
         self._orig_text = text
         self._orig_version = version
         self._lines: Optional[List[str]] = None
+        # parallel to the lines, None for lines without multibyte characters
+        self._utf16_maps: Optional[List[Optional[Utf16ColumnMap]]] = None
         self._cache: Dict[weakref.ref[Any], CacheEntry] = collections.defaultdict(CacheEntry)
         self._data_lock = RLock(name=f"Document.data_lock '{document_uri}'", default_timeout=120)
         self._data: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
@@ -141,13 +177,24 @@ class TextDocument:
 
     def text(self) -> str:
         with self._lock:
-            return self._text
+            return self.__get_text()
+
+    def __get_text(self) -> str:
+        if self._text is None:
+            self._text = "".join(self._lines or [])
+
+        return self._text
+
+    def __reset_lines(self) -> None:
+        self.__get_text()
+        self._lines = None
+        self._utf16_maps = None
 
     def save(self, version: Optional[int], text: Optional[str]) -> None:
         self.apply_full_change(version, text, save=True)
 
     def revert(self, version: Optional[int]) -> bool:
-        if self._orig_text != self._text or self._orig_version != self._version:
+        if self._orig_text != self.text() or self._orig_version != self._version:
             self.apply_full_change(version or self._orig_version, self._orig_text)
             return True
         return False
@@ -155,7 +202,7 @@ class TextDocument:
     @_logger.call
     def apply_none_change(self) -> None:
         with self._cache_invalidating():
-            self._lines = None
+            self.__reset_lines()
 
     @_logger.call
     def apply_full_change(self, version: Optional[int], text: Optional[str], *, save: bool = False) -> None:
@@ -165,47 +212,59 @@ class TextDocument:
             if text is not None:
                 self._text = text
                 self._lines = None
+                self._utf16_maps = None
             if save:
-                self._orig_text = self._text
+                self._orig_text = self.__get_text()
 
     @_logger.call
     def apply_incremental_change(self, version: Optional[int], range: Range, text: str) -> None:
         with self._cache_invalidating():
-            try:
-                if version is not None:
-                    self._version = version
-
-                if range.start > range.end:
-                    raise InvalidRangeError(f"Start position is greater then end position {range}.")
-
-                lines = self.__get_lines()
-
-                (start_line, start_col), (end_line, end_col) = range_from_utf16(lines, range)
-
-                if start_line == len(lines):
-                    self._text = self._text + text
-                    return
-
-                with io.StringIO() as new_text:
-                    for i, line in enumerate(lines):
-                        if i < start_line or i > end_line:
-                            new_text.write(line)
-                            continue
-
-                        if i == start_line:
-                            new_text.write(line[:start_col])
-                            new_text.write(text)
-
-                        if i == end_line:
-                            new_text.write(line[end_col:])
+            if version is not None:
+                self._version = version
 
-                    self._text = new_text.getvalue()
-            finally:
-                self._lines = None
+            if range.start > range.end:
+                raise InvalidRangeError(f"Start position is greater then end position {range}.")
+
+            lines = self.__get_lines()
+
+            (start_line, start_col), (end_line, end_col) = self.__range_from_utf16(range)
+
+            if start_line >= len(lines) and (not lines or lines[-1].endswith(_LINE_BREAKS)):
+                start_line = end_line = len(lines)
+                changed = text
+            else:
+                if start_line >= len(lines):
+                    start_line, start_col = len(lines) - 1, len(lines[-1])
+                if end_line >= len(lines):
+                    end_line, end_col = len(lines) - 1, len(lines[-1])
+
+                # only the changed lines are split again, all other lines are reused
+                changed = lines[start_line][:start_col] + text + lines[end_line][end_col:]
+
+            # the changed text may continue on the next line or split a "\r\n", so join the neighbour lines
+            if end_line + 1 < len(lines) and (
+                not changed.endswith(_LINE_BREAKS) or (changed[-1:] == "\r" and lines[end_line + 1][:1] == "\n")
+            ):
+                end_line += 1
+                changed += lines[end_line]
+            if start_line > 0 and changed[:1] == "\n" and lines[start_line - 1].endswith("\r"):
+                start_line -= 1
+                changed = lines[start_line] + changed
+
+            new_lines = changed.splitlines(True)
+            self._lines = [*lines[:start_line], *new_lines, *lines[end_line + 1 :]]
+            self._text = None
+
+            if self._utf16_maps is not None:
+                self._utf16_maps = [
+                    *self._utf16_maps[:start_line],
+                    *(_NOT_CREATED for _ in new_lines),
+                    *self._utf16_maps[end_line + 1 :],
+                ]
 
     def __get_lines(self) -> List[str]:
         if self._lines is None:
-            self._lines = self._text.splitlines(True)
+            self._lines = self.__get_text().splitlines(True)
 
         return self._lines
 
@@ -306,7 +365,7 @@ class TextDocument:
             return self._data.get(key, default)
 
     def _clear(self) -> None:
-        self._lines = None
+        self.__reset_lines()
         self._invalidate_data()
 
     @_logger.call
@@ -314,14 +373,72 @@ class TextDocument:
         with self._cache_invalidating():
             self._clear()
 
+    def __get_utf16_map(self, line: int) -> Optional[Utf16ColumnMap]:
+        lines = self.__get_lines()
+        if line < 0 or line >= len(lines):
+            return None
+
+        if self._utf16_maps is None:
+            self._utf16_maps = [_NOT_CREATED] * len(lines)
+
+        result = self._utf16_maps[line]
+        if result is _NOT_CREATED:
+            result = self._utf16_maps[line] = Utf16ColumnMap.create(lines[line])
+
+        return result
+
+    def __position_from_utf16(self, position: Position) -> Position:
+        lines = self.__get_lines()
+        if position.line >= len(lines):
+            return position
+
+        column_map = self.__get_utf16_map(position.line)
+        if column_map is None:
+            return Position(line=position.line, character=min(position.character, len(lines[position.line])))
+
+        return Position(line=position.line, character=column_map.from_utf16(position.character))
+
+    def __position_to_utf16(self, position: Position) -> Position:
+        column_map = self.__get_utf16_map(position.line)
+        if column_map is None:
+            return position
+
+        return Position(line=position.line, character=column_map.to_utf16(position.character))
+
+    def __range_from_utf16(self, range: Range) -> Range:
+        return Range(start=self.__position_from_utf16(range.start), end=self.__position_from_utf16(range.end))
+
+    def __range_to_utf16(self, range: Range) -> Range:
+        return Range(start=self.__position_to_utf16(range.start), end=self.__position_to_utf16(range.end))
+
     def position_from_utf16(self, position: Position) -> Position:
-        return position_from_utf16(self.get_lines(), position)
+        with self._lock:
+            return self.__position_from_utf16(position)
 
     def position_to_utf16(self, position: Position) -> Position:
-        return position_to_utf16(self.get_lines(), position)
+        with self._lock:
+            return self.__position_to_utf16(position)
 
     def range_from_utf16(self, range: Range) -> Range:
-        return range_from_utf16(self.get_lines(), range)
+        with self._lock:
+            return self.__range_from_utf16(range)
 
     def range_to_utf16(self, range: Range) -> Range:
-        return range_to_utf16(self.get_lines(), range)
+        with self._lock:
+            return self.__range_to_utf16(range)
+
+    def positions_from_utf16(self, positions: Iterable[Position]) -> List[Position]:
+        with self._lock:
+            return [self.__position_from_utf16(p) for p in positions]
+
+    def positions_to_utf16(self, positions: Iterable[Position]) -> List[Position]:
+        with self._lock:
+            return [self.__position_to_utf16(p) for p in positions]
+
+    def ranges_from_utf16(self, ranges: Iterable[Range]) -> List[Range]:
+        with self._lock:
+            return [self.__range_from_utf16(r) for r in ranges]
+
+    def ranges_to_utf16(self, ranges: Iterable[Range]) -> List[Range]:
+        with self._lock:
+            return [self.__range_to_utf16(r) for r in ranges]
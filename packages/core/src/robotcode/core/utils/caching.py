@@ -1,6 +1,7 @@
-from collections import defaultdict
+import time
+from collections import OrderedDict
 from threading import RLock
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Callable, NamedTuple, Optional, Tuple, TypeVar, cast
 
 _T = TypeVar("_T")
 
@@ -16,54 +17,125 @@ class CacheEntry:
         self.data: Any = None
         self.has_data: bool = False
         self.lock = RLock()
+        self.weight: int = 0
+        self.expires: Optional[float] = None
+
+
+class CacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    weight: int
 
 
 class SimpleLRUCache:
-    def __init__(self, max_items: Optional[int] = 128) -> None:
+    def __init__(
+        self,
+        max_items: Optional[int] = 128,
+        *,
+        ttl: Optional[float] = None,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None,
+    ) -> None:
         self.max_items = max_items
+        self.ttl = ttl
+        self.max_weight = max_weight
+        self.weigher = weigher
 
-        self._cache: Dict[Tuple[Any, ...], CacheEntry] = defaultdict(CacheEntry)
-        self._order: Optional[List[Tuple[Any, ...]]] = None
-        if self.max_items:
-            self._order = []
+        self._cache: "OrderedDict[Tuple[Any, ...], CacheEntry]" = OrderedDict()
         self._lock = RLock()
 
+        self._weight = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, self._evictions, len(self._cache), self._weight)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _is_expired(self, entry: CacheEntry) -> bool:
+        return entry.expires is not None and entry.expires <= time.monotonic()
+
+    def _remove(self, key: Tuple[Any, ...]) -> None:
+        entry = self._cache.pop(key)
+        self._weight -= entry.weight
+
+    def _evict(self) -> None:
+        while self._cache and (
+            (self.max_items and len(self._cache) > self.max_items)
+            or (self.max_weight is not None and self._weight > self.max_weight)
+        ):
+            self._remove(next(iter(self._cache)))
+            self._evictions += 1
+
     def has(self, *args: Any, **kwargs: Any) -> bool:
         key = self._make_key(*args, **kwargs)
 
-        if key in self._cache:
-            return self._cache[key].has_data
-
-        return False
+        with self._lock:
+            entry = self._cache.get(key, None)
+            return entry is not None and entry.has_data and not self._is_expired(entry)
 
     def get(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
         key = self._make_key(*args, **kwargs)
 
-        entry = self._cache[key]
+        with self._lock:
+            entry = self._cache.get(key, None)
+            if entry is not None and entry.has_data and self._is_expired(entry):
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                entry = CacheEntry()
+                self._cache[key] = entry
+                self._evict()
+            else:
+                self._cache.move_to_end(key)
 
         with entry.lock:
-            if not entry.has_data:
-                entry.data = func(*args, **kwargs)
-                entry.has_data = True
-
-                if self._order is not None and self.max_items is not None:
-                    with self._lock:
-                        self._order.insert(0, key)
-
-                        if len(self._order) > self.max_items:
-                            del self._cache[self._order.pop()]
-
-            return cast(_T, entry.data)
+            if entry.has_data:
+                with self._lock:
+                    self._hits += 1
+                return cast(_T, entry.data)
+
+            with self._lock:
+                self._misses += 1
+
+            try:
+                data = func(*args, **kwargs)
+            except BaseException:
+                with self._lock:
+                    if self._cache.get(key, None) is entry:
+                        self._remove(key)
+                raise
+
+            entry.data = data
+            entry.has_data = True
+
+            with self._lock:
+                # the entry may have been evicted or the cache cleared while computing
+                if self._cache.get(key, None) is entry:
+                    entry.weight = self.weigher(data) if self.weigher is not None else 1
+                    entry.expires = time.monotonic() + self.ttl if self.ttl is not None else None
+                    self._weight += entry.weight
+                    self._cache.move_to_end(key)
+                    self._evict()
+
+            return data
 
     @staticmethod
     def _make_key(*args: Any, **kwargs: Any) -> Tuple[Any, ...]:
         return (
             tuple(_freeze(v) for v in args),
-            hash(frozenset({k: _freeze(v) for k, v in kwargs.items()})),
+            hash(frozenset((k, _freeze(v)) for k, v in kwargs.items())),
         )
 
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            if self._order is not None:
-                self._order.clear()
+            self._weight = 0
@@ -129,15 +129,15 @@ class DebugAdapterProtocol(JsonRPCProtocolBase):
         else:
             yield inner(data)
 
-    def _handle_body(self, body: bytes, charset: str) -> None:
+    def _handle_body(self, body: memoryview, charset: str) -> None:
         try:
-            self._handle_messages(self._generate_json_rpc_messages_from_dict(json.loads(body.decode(charset))))
+            self._handle_messages(self._generate_json_rpc_messages_from_dict(json.loads(str(body, charset))))
         except (asyncio.CancelledError, SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
             self._logger.exception(e)
             self.send_error(
-                f"Invalid Message: {type(e).__name__}: {e!s} -> {body!s}\n{traceback.format_exc()}",
+                f"Invalid Message: {type(e).__name__}: {e!s} -> {bytes(body)!s}\n{traceback.format_exc()}",
                 error_message=Message(traceback.format_exc()),
             )
 
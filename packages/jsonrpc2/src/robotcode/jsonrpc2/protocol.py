@@ -4,7 +4,6 @@ import asyncio
 import functools
 import inspect
 import json
-import re
 import threading
 import weakref
 from abc import ABC, abstractmethod
@@ -17,6 +16,7 @@ from typing import (
     Dict,
     Final,
     Generic,
+    Hashable,
     Iterator,
     List,
     Mapping,
@@ -33,7 +33,7 @@ from typing import (
 )
 
 from robotcode.core.async_tools import run_coroutine_in_thread
-from robotcode.core.concurrent import Task, run_as_task
+from robotcode.core.concurrent import Task, run_as_interactive_task, run_as_task
 from robotcode.core.event import event
 from robotcode.core.utils.dataclasses import as_json, from_dict
 from robotcode.core.utils.inspect import ensure_coroutine, iter_methods
@@ -147,6 +147,7 @@ class RpcMethodEntry:
     param_type: Optional[Type[Any]]
     cancelable: bool
     threaded: bool
+    interactive: bool = False
 
     _is_coroutine: Optional[bool] = field(default=None, init=False)
 
@@ -178,6 +179,7 @@ def rpc_method(
     param_type: Optional[Type[Any]] = None,
     cancelable: bool = True,
     threaded: bool = False,
+    interactive: bool = False,
 ) -> Callable[[_F], _F]: ...
 
 
@@ -188,6 +190,7 @@ def rpc_method(
     param_type: Optional[Type[Any]] = None,
     cancelable: bool = True,
     threaded: bool = False,
+    interactive: bool = False,
 ) -> Callable[[_F], _F]:
     def _decorator(func: _F) -> Callable[[_F], _F]:
         if inspect.isclass(_func):
@@ -204,7 +207,7 @@ def rpc_method(
         if real_name is None or not real_name:
             raise ValueError("name is empty.")
 
-        cast(RpcMethod, f).__rpc_method__ = RpcMethodEntry(real_name, f, param_type, cancelable, threaded)
+        cast(RpcMethod, f).__rpc_method__ = RpcMethodEntry(real_name, f, param_type, cancelable, threaded, interactive)
         return func
 
     if _func is None:
@@ -272,13 +275,15 @@ class RpcRegistry:
                     rpc_method.__rpc_method__.param_type,
                     rpc_method.__rpc_method__.cancelable,
                     rpc_method.__rpc_method__.threaded,
+                    rpc_method.__rpc_method__.interactive,
                 )
                 for method, rpc_method in map(
                     lambda m1: (m1, cast(RpcMethod, m1)),
                     iter_methods(
                         obj,
-                        lambda m2: isinstance(m2, RpcMethod)
-                        or (inspect.ismethod(m2) and isinstance(m2.__func__, RpcMethod)),
+                        lambda m2: (
+                            isinstance(m2, RpcMethod) or (inspect.ismethod(m2) and isinstance(m2.__func__, RpcMethod))
+                        ),
                     ),
                 )
             }
@@ -322,10 +327,11 @@ class RpcRegistry:
         param_type: Optional[Type[Any]] = None,
         cancelable: bool = True,
         threaded: bool = False,
+        interactive: bool = False,
     ) -> None:
         self.__ensure_initialized()
 
-        self.__methods[name] = RpcMethodEntry(name, func, param_type, cancelable, threaded)
+        self.__methods[name] = RpcMethodEntry(name, func, param_type, cancelable, threaded, interactive)
 
     def remove_method(self, name: str) -> Optional[RpcMethodEntry]:
         self.__ensure_initialized()
@@ -378,7 +384,10 @@ class JsonRPCProtocolBase(asyncio.Protocol, ABC):
     def __init__(self) -> None:
         self.read_transport: Optional[asyncio.ReadTransport] = None
         self.write_transport: Optional[asyncio.WriteTransport] = None
-        self._message_buf = b""
+        self._message_buf = bytearray()
+        self._header_search_start = 0
+        self._body_length: Optional[int] = None
+        self._body_charset = self.CHARSET
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
@@ -411,40 +420,66 @@ class JsonRPCProtocolBase(asyncio.Protocol, ABC):
     CHARSET: Final = "utf-8"
     CONTENT_TYPE: Final = "application/vscode-jsonrpc"
 
-    MESSAGE_PATTERN: Final = re.compile(
-        rb"(?:[^\r\n]*\r\n)*"
-        rb"(Content-Length: ?(?P<length>\d+)\r\n)"
-        rb"((Content-Type: ?(?P<content_type>[^\r\n;]+)"
-        rb"(; *(charset=(?P<charset>[^\r\n]+))?)?\r\n)|(?:[^\r\n]+\r\n))?"
-        rb"\r\n(?P<body>.*)",
-        re.DOTALL,
-    )
+    HEADER_END: Final = b"\r\n\r\n"
 
     def data_received(self, data: bytes) -> None:
-        while len(data):
-            # Append the incoming chunk to the message buffer
-            self._message_buf += data
+        buffer = self._message_buf
+        buffer += data
 
-            # Look for the body of the message
-            found = self.MESSAGE_PATTERN.match(self._message_buf)
+        position = 0
+        while True:
+            if self._body_length is None:
+                header_end = buffer.find(self.HEADER_END, max(position, self._header_search_start))
+                if header_end < 0:
+                    # the next chunk may complete a header end that starts in this chunk
+                    self._header_search_start = max(position, len(buffer) - len(self.HEADER_END) + 1)
+                    break
 
-            body = found.group("body") if found else b""
-            length = int(found.group("length")) if found else 1
+                self._body_length, self._body_charset = self._parse_header(bytes(buffer[position:header_end]))
+                position = header_end + len(self.HEADER_END)
+                self._header_search_start = position
 
-            charset = (
-                found.group("charset").decode("ascii") if found and found.group("charset") is not None else self.CHARSET
-            )
+                if self._body_length is None:
+                    continue
 
-            if len(body) < length:
-                return
+            if len(buffer) - position < self._body_length:
+                break
+
+            body_end = position + self._body_length
+            self._body_length = None
+
+            with memoryview(buffer) as view, view[position:body_end] as body:
+                self._handle_body(body, self._body_charset)
+
+            position = self._header_search_start = body_end
 
-            body, data = body[:length], body[length:]
-            self._message_buf = b""
+        if position > 0:
+            del buffer[:position]
+            self._header_search_start -= position
 
-            self._handle_body(body, charset)
+    def _parse_header(self, header: bytes) -> Tuple[Optional[int], str]:
+        length: Optional[int] = None
+        charset = self.CHARSET
+
+        for line in header.split(b"\r\n"):
+            name, _, value = line.partition(b":")
+            name = name.strip().lower()
+
+            if name == b"content-length":
+                try:
+                    length = int(value)
+                except ValueError:
+                    pass
+            elif name == b"content-type":
+                for parameter in value.split(b";")[1:]:
+                    key, _, parameter_value = parameter.partition(b"=")
+                    if key.strip().lower() == b"charset" and parameter_value.strip():
+                        charset = parameter_value.strip().decode("ascii")
+
+        return length, charset
 
     @abstractmethod
-    def _handle_body(self, body: bytes, charset: str) -> None: ...
+    def _handle_body(self, body: memoryview, charset: str) -> None: ...
 
 
 class JsonRPCProtocol(JsonRPCProtocolBase):
@@ -460,6 +495,10 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         self._received_request_lock = threading.RLock()
         self._signature_cache: Dict[Callable[..., Any], inspect.Signature] = {}
         self._running_handle_message_tasks: Set[asyncio.Future[Any]] = set()
+        self._send_queue_lock = threading.Lock()
+        self._send_queue: List[Optional[bytes]] = []
+        self._send_queue_keys: Dict[Hashable, int] = {}
+        self._send_scheduled = False
 
     @staticmethod
     def _generate_json_rpc_messages_from_dict(
@@ -489,9 +528,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
         else:
             yield inner(data)
 
-    def _handle_body(self, body: bytes, charset: str) -> None:
+    def _handle_body(self, body: memoryview, charset: str) -> None:
         try:
-            b = body.decode(charset)
+            b = str(body, charset)
 
             self._data_logger.trace(lambda: f"JSON Received: {b!r}")
 
@@ -553,7 +592,40 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
             self._do_trace_message(message, msg)
 
             if self._loop:
-                self._loop.call_soon_threadsafe(self.write_transport.write, msg)
+                self._queue_message(msg, self._get_superseding_key(message))
+
+    def _get_superseding_key(self, message: JsonRPCMessage) -> Optional[Hashable]:
+        # a queued message is dropped if a newer message with the same key is sent before it is written
+        return None
+
+    def _queue_message(self, msg: bytes, key: Optional[Hashable]) -> None:
+        with self._send_queue_lock:
+            if key is not None:
+                index = self._send_queue_keys.get(key, None)
+                if index is not None:
+                    self._send_queue[index] = None
+                self._send_queue_keys[key] = len(self._send_queue)
+
+            self._send_queue.append(msg)
+
+            if self._send_scheduled or self._loop is None:
+                return
+            self._send_scheduled = True
+
+            # all messages queued until the next loop iteration are written at once
+            self._loop.call_soon_threadsafe(self._flush_send_queue)
+
+    def _flush_send_queue(self) -> None:
+        with self._send_queue_lock:
+            queue = self._send_queue
+            self._send_queue = []
+            self._send_queue_keys.clear()
+            self._send_scheduled = False
+
+        if self.write_transport is not None:
+            data = b"".join(msg for msg in queue if msg is not None)
+            if data:
+                self.write_transport.write(data)
 
     def _do_trace_message(self, message: JsonRPCMessage, msg: bytes) -> None:
         self._data_logger.trace(lambda: f"JSON send: {msg.decode()!r}")
@@ -749,6 +821,9 @@ class JsonRPCProtocol(JsonRPCProtocolBase):
                             *params[0],
                             **params[1],
                         )
+                    elif e.interactive:
+                        # the editor waits for these requests while the user is typing
+                        task = asyncio.wrap_future(run_as_interactive_task(e.method, *params[0], **params[1]))
                     else:
                         task = asyncio.wrap_future(run_as_task(e.method, *params[0], **params[1]))
                 else:
@@ -1,6 +1,8 @@
 import abc
 import asyncio
 import io
+import os
+import selectors
 import sys
 import threading
 from concurrent.futures import ThreadPoolExecutor
@@ -30,6 +32,8 @@ __all__ = ["JsonRPCServer"]
 
 TProtocol = TypeVar("TProtocol", bound=asyncio.Protocol)
 
+STDIO_READ_SIZE = 65536
+
 
 class NotSupportedError(Exception):
     pass
@@ -68,6 +72,8 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
         self._server: Optional[asyncio.AbstractServer] = None
 
         self._stdio_stop_event: Optional[threading.Event] = None
+        self._stdio_wakeup_fd: Optional[int] = None
+        self._stdio_wakeup_lock = threading.Lock()
 
         self._in_closing = False
         self._closed = False
@@ -114,6 +120,14 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
         if self._stdio_stop_event is not None:
             self._stdio_stop_event.set()
 
+        # the reader thread closes the wakeup pipe when it stops, so the fd must not be used after that
+        with self._stdio_wakeup_lock:
+            if self._stdio_wakeup_fd is not None:
+                try:
+                    os.write(self._stdio_wakeup_fd, b"\0")
+                except OSError:
+                    pass
+
         if self._server and self._server.is_serving():
             self._server.close()
 
@@ -173,6 +187,40 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
 
     stdio_executor: Optional[ThreadPoolExecutor] = None
 
+    def _read_stdio(self, rfile: BinaryIO, stop_event: threading.Event, data_received: Callable[[bytes], None]) -> None:
+        if sys.platform == "win32":
+            # pipes can't be used with selectors on windows, so just block in read
+            while not stop_event.is_set() and not rfile.closed:
+                data = cast(io.BufferedReader, rfile).read1(STDIO_READ_SIZE)
+                if not data:
+                    break
+                data_received(data)
+            return
+
+        fd = rfile.fileno()
+        wakeup_read, wakeup_write = os.pipe()
+        with self._stdio_wakeup_lock:
+            self._stdio_wakeup_fd = wakeup_write
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(fd, selectors.EVENT_READ)
+                selector.register(wakeup_read, selectors.EVENT_READ)
+
+                while not stop_event.is_set():
+                    for key, _ in selector.select():
+                        if key.fd == wakeup_read:
+                            return
+
+                        data = os.read(fd, STDIO_READ_SIZE)
+                        if not data:
+                            return
+                        data_received(data)
+        finally:
+            with self._stdio_wakeup_lock:
+                self._stdio_wakeup_fd = None
+                os.close(wakeup_write)
+            os.close(wakeup_read)
+
     @_logger.call
     def start_stdio(self) -> None:
         self.mode = ServerMode.STDIO
@@ -187,15 +235,11 @@ class JsonRPCServer(Generic[TProtocol], abc.ABC):
             async def aio_readline(rfile: BinaryIO, protocol: asyncio.Protocol) -> None:
                 protocol.connection_made(transport)
 
+                def data_received(data: bytes) -> None:
+                    self.loop.call_soon_threadsafe(protocol.data_received, data)
+
                 def run() -> None:
-                    while not stop_event.is_set() and not rfile.closed:
-                        if cast(io.BufferedReader, rfile).peek(1):
-                            data = cast(io.BufferedReader, rfile).read1(10000)
-
-                            self.loop.call_soon_threadsafe(protocol.data_received, data)
-                        else:
-                            # no data available, wait a bit if we are not closing
-                            stop_event.wait(0.01)
+                    self._read_stdio(rfile, stop_event, data_received)
 
                 with ThreadPoolExecutor(max_workers=1, thread_name_prefix="aio_readline") as stdio_executor:
                     self._stdio_threadpool = stdio_executor
@@ -94,7 +94,7 @@ class CompletionProtocolPart(LanguageServerProtocolPart):
                 completion_item=CompletionOptionsCompletionItemType(label_details_support=True),
             )
 
-    @rpc_method(name="textDocument/completion", param_type=CompletionParams, threaded=True)
+    @rpc_method(name="textDocument/completion", param_type=CompletionParams, threaded=True, interactive=True)
     def _text_document_completion(
         self,
         text_document: TextDocumentIdentifier,
@@ -175,7 +175,7 @@ class CompletionProtocolPart(LanguageServerProtocolPart):
             item.text_edit.insert = document.range_to_utf16(item.text_edit.insert)
             item.text_edit.replace = document.range_to_utf16(item.text_edit.replace)
 
-    @rpc_method(name="completionItem/resolve", param_type=CompletionItem, threaded=True)
+    @rpc_method(name="completionItem/resolve", param_type=CompletionItem, threaded=True, interactive=True)
     def _completion_item_resolve(self, params: CompletionItem, *args: Any, **kwargs: Any) -> CompletionItem:
         results: List[CompletionItem] = []
 
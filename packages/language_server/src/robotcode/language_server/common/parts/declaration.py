@@ -48,7 +48,7 @@ class DeclarationProtocolPart(LanguageServerProtocolPart):
         if len(self.collect):
             capabilities.declaration_provider = True
 
-    @rpc_method(name="textDocument/declaration", param_type=DeclarationParams, threaded=True)
+    @rpc_method(name="textDocument/declaration", param_type=DeclarationParams, threaded=True, interactive=True)
     def _text_document_declaration(
         self,
         text_document: TextDocumentIdentifier,
@@ -48,7 +48,7 @@ class DefinitionProtocolPart(LanguageServerProtocolPart):
         if len(self.collect):
             capabilities.definition_provider = True
 
-    @rpc_method(name="textDocument/definition", param_type=DefinitionParams, threaded=True)
+    @rpc_method(name="textDocument/definition", param_type=DefinitionParams, threaded=True, interactive=True)
     def _text_document_definition(
         self,
         text_document: TextDocumentIdentifier,
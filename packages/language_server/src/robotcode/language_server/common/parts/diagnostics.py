@@ -11,7 +11,16 @@ from enum import Enum
 from threading import Event, Timer
 from typing import TYPE_CHECKING, Any, Dict, Final, Iterator, List, Optional, Union, cast
 
-from robotcode.core.concurrent import Lock, RLock, Task, check_current_task_canceled, run_as_task
+from robotcode.core.concurrent import (
+    Lock,
+    RLock,
+    Task,
+    check_current_task_canceled,
+    get_task_pool,
+    run_as_background_task,
+    run_as_task,
+    run_in_thread,
+)
 from robotcode.core.event import event
 from robotcode.core.language import language_id_filter
 from robotcode.core.lsp.types import (
@@ -119,6 +128,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
         self._current_diagnostics_task_lock = RLock()
         self._current_diagnostics_task: Optional[Task[Any]] = None
         self._diagnostics_task_timeout = 300
+        self._max_interactive_pause = 1.0
 
     def server_initialized(self, sender: Any) -> None:
         if not self.client_supports_pull:
@@ -126,7 +136,7 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
             self.parent.documents.did_change.add(self.update_document_diagnostics)
             self.parent.documents.did_save.add(self.update_document_diagnostics)
 
-        self._workspace_diagnostics_task = run_as_task(self.run_workspace_diagnostics)
+        self._workspace_diagnostics_task = run_in_thread(self.run_workspace_diagnostics)
 
     def extend_capabilities(self, capabilities: ServerCapabilities) -> None:
         if (
@@ -145,6 +155,9 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
     @event
     def analyze(sender, document: TextDocument) -> Optional[DiagnosticsResult]: ...
 
+    @event
+    def analyze_in_workers(sender, documents: List[TextDocument]) -> Optional[Dict[TextDocument, Task[Any]]]: ...
+
     @event
     def collect(
         sender, document: TextDocument, diagnostics_type: DiagnosticsCollectType
@@ -329,6 +342,17 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
             return_exceptions=True,
         )
 
+    def _analyze_in_workers(self, documents: List[TextDocument]) -> Dict[TextDocument, Task[Any]]:
+        result: Dict[TextDocument, Task[Any]] = {}
+
+        for tasks in self.analyze_in_workers(self, documents, return_exceptions=True):
+            if isinstance(tasks, BaseException):
+                self._logger.exception(tasks, exc_info=tasks)
+            elif tasks is not None:
+                result.update(tasks)
+
+        return result
+
     def _doc_need_update(self, document: TextDocument) -> bool:
         with self.get_diagnostics_data(document) as data:
             return data.force or document.version != data.version or data.skipped_entries
@@ -378,55 +402,70 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                         start=False,
                     ) as progress:
                         breaked = False
-                        for i, document in enumerate(documents):
-                            check_current_task_canceled()
-
-                            if breaked or self._break_diagnostics_loop_event.is_set():
-                                self._logger.debug(
-                                    "break workspace diagnostics loop 2", context_name="workspace_diagnostics"
-                                )
-                                breaked = True
-                                self.on_workspace_diagnostics_break(self)
-                                break
-
-                            done_something = True
-
-                            analysis_mode = self.get_analysis_progress_mode(document.uri)
-
-                            if analysis_mode == AnalysisProgressMode.DETAILED:
-                                progress.begin()
-                                path = document.uri.to_path()
-                                folder = self.parent.workspace.get_workspace_folder(document.uri)
-                                name = path if folder is None else path.relative_to(folder.uri.to_path())
-
-                                progress.report(f"Analyze {i + 1}/{len(documents)}: {name}", current=i + 1)
-                            elif analysis_mode == AnalysisProgressMode.SIMPLE:
-                                progress.begin()
-                                progress.report(f"Analyze {i + 1}/{len(documents)}", current=i + 1)
-
-                            try:
-                                with self._current_diagnostics_task_lock:
-                                    self._current_diagnostics_task = run_as_task(self._analyse_document, document)
-                                self._current_diagnostics_task.result(self._diagnostics_task_timeout)
+                        worker_tasks = self._analyze_in_workers(documents)
+                        try:
+                            for i, document in enumerate(documents):
+                                check_current_task_canceled()
+
+                                if breaked or self._break_diagnostics_loop_event.is_set():
+                                    self._logger.debug(
+                                        "break workspace diagnostics loop 2", context_name="workspace_diagnostics"
+                                    )
+                                    breaked = True
+                                    self.on_workspace_diagnostics_break(self)
+                                    break
+
+                                done_something = True
+
+                                self._pause_for_interactive_requests()
+
+                                analysis_mode = self.get_analysis_progress_mode(document.uri)
+
+                                if analysis_mode == AnalysisProgressMode.DETAILED:
+                                    progress.begin()
+                                    path = document.uri.to_path()
+                                    folder = self.parent.workspace.get_workspace_folder(document.uri)
+                                    name = path if folder is None else path.relative_to(folder.uri.to_path())
+
+                                    progress.report(f"Analyze {i + 1}/{len(documents)}: {name}", current=i + 1)
+                                elif analysis_mode == AnalysisProgressMode.SIMPLE:
+                                    progress.begin()
+                                    progress.report(f"Analyze {i + 1}/{len(documents)}", current=i + 1)
+
+                                try:
+                                    # documents analyzed in worker processes are already running in parallel,
+                                    # their results are waited for in the same order to keep the progress reporting
+                                    worker_task = worker_tasks.pop(document, None)
+                                    with self._current_diagnostics_task_lock:
+                                        self._current_diagnostics_task = (
+                                            worker_task
+                                            if worker_task is not None
+                                            else run_as_background_task(self._analyse_document, document)
+                                        )
+                                    self._current_diagnostics_task.result(self._diagnostics_task_timeout)
 
-                            except (SystemExit, KeyboardInterrupt):
-                                raise
+                                except (SystemExit, KeyboardInterrupt):
+                                    raise
 
-                            except CancelledError:
-                                self._logger.debug(
-                                    lambda: f"Analyzing {document.uri} cancelled", context_name="workspace_diagnostics"
-                                )
-                                breaked = True
-                            except BaseException as e:
-                                ex = e
-                                self._logger.exception(
-                                    lambda: f"Error in analyzing ${document.uri}: {ex}",
-                                    exc_info=ex,
-                                    context_name="workspace_diagnostics",
-                                )
-                            finally:
-                                with self._current_diagnostics_task_lock:
-                                    self._current_diagnostics_task = None
+                                except CancelledError:
+                                    self._logger.debug(
+                                        lambda: f"Analyzing {document.uri} cancelled",
+                                        context_name="workspace_diagnostics",
+                                    )
+                                    breaked = True
+                                except BaseException as e:
+                                    ex = e
+                                    self._logger.exception(
+                                        lambda: f"Error in analyzing ${document.uri}: {ex}",
+                                        exc_info=ex,
+                                        context_name="workspace_diagnostics",
+                                    )
+                                finally:
+                                    with self._current_diagnostics_task_lock:
+                                        self._current_diagnostics_task = None
+                        finally:
+                            for task in worker_tasks.values():
+                                task.cancel()
 
                     if breaked or self._break_diagnostics_loop_event.is_set():
                         self._logger.debug("break workspace diagnostics loop 3", context_name="workspace_diagnostics")
@@ -482,6 +521,8 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
 
                             done_something = True
 
+                            self._pause_for_interactive_requests()
+
                             analysis_mode = self.get_analysis_progress_mode(document.uri)
 
                             if analysis_mode == AnalysisProgressMode.DETAILED:
@@ -537,6 +578,23 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                 if not done_something:
                     check_current_task_canceled(1)
 
+    def _pause_for_interactive_requests(self) -> None:
+        task_pool = get_task_pool()
+        if not task_pool.has_interactive_tasks:
+            return
+
+        start = time.monotonic()
+        while not task_pool.wait_for_interactive_tasks(0.1):
+            check_current_task_canceled()
+
+            if self._break_diagnostics_loop_event.is_set() or time.monotonic() - start >= self._max_interactive_pause:
+                break
+
+        self._logger.debug(
+            lambda: f"workspace diagnostics paused for {time.monotonic() - start:.3f}s for interactive requests",
+            context_name="workspace_diagnostics",
+        )
+
     def reset_document_diagnostics_data(self, document: TextDocument) -> None:
         with self.get_diagnostics_data(document) as data:
             data.force = False
@@ -622,8 +680,9 @@ class DiagnosticsProtocolPart(LanguageServerProtocolPart):
                     data.skipped_entries = True
 
                 if result.diagnostics is not None:
-                    for d in result.diagnostics:
-                        d.range = document.range_to_utf16(d.range)
+                    utf16_ranges = document.ranges_to_utf16(d.range for d in result.diagnostics)
+                    for d, utf16_range in zip(result.diagnostics, utf16_ranges):
+                        d.range = utf16_range
 
                         for r in d.related_information or []:
                             doc = self.parent.documents.get(r.location.uri)
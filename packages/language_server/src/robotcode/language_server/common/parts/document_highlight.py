@@ -36,7 +36,9 @@ class DocumentHighlightProtocolPart(LanguageServerProtocolPart):
     @event
     def collect(sender, document: TextDocument, position: Position) -> Optional[List[DocumentHighlight]]: ...
 
-    @rpc_method(name="textDocument/documentHighlight", param_type=DocumentHighlightParams, threaded=True)
+    @rpc_method(
+        name="textDocument/documentHighlight", param_type=DocumentHighlightParams, threaded=True, interactive=True
+    )
     def _text_document_document_highlight(
         self,
         text_document: TextDocumentIdentifier,
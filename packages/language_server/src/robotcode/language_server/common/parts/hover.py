@@ -36,7 +36,7 @@ class HoverProtocolPart(LanguageServerProtocolPart):
         if len(self.collect):
             capabilities.hover_provider = HoverOptions(work_done_progress=True)
 
-    @rpc_method(name="textDocument/hover", param_type=HoverParams, threaded=True)
+    @rpc_method(name="textDocument/hover", param_type=HoverParams, threaded=True, interactive=True)
     def _text_document_hover(
         self,
         text_document: TextDocumentIdentifier,
@@ -47,7 +47,7 @@ class ImplementationProtocolPart(LanguageServerProtocolPart):
         if len(self.collect):
             capabilities.implementation_provider = True
 
-    @rpc_method(name="textDocument/implementation", param_type=ImplementationParams, threaded=True)
+    @rpc_method(name="textDocument/implementation", param_type=ImplementationParams, threaded=True, interactive=True)
     def _text_document_implementation(
         self,
         text_document: TextDocumentIdentifier,
@@ -36,7 +36,9 @@ class LinkedEditingRangeProtocolPart(LanguageServerProtocolPart):
     @event
     def collect(sender, document: TextDocument, position: Position) -> Optional[LinkedEditingRanges]: ...
 
-    @rpc_method(name="textDocument/linkedEditingRange", param_type=LinkedEditingRangeParams, threaded=True)
+    @rpc_method(
+        name="textDocument/linkedEditingRange", param_type=LinkedEditingRangeParams, threaded=True, interactive=True
+    )
     def _text_document_linked_editing_range(
         self,
         text_document: TextDocumentIdentifier,
@@ -68,4 +70,4 @@ class LinkedEditingRangeProtocolPart(LanguageServerProtocolPart):
                     if result.word_pattern is not None:
                         word_pattern = result.word_pattern
 
-        return LinkedEditingRanges([document.range_to_utf16(r) for r in linked_ranges], word_pattern)
+        return LinkedEditingRanges(document.ranges_to_utf16(linked_ranges), word_pattern)
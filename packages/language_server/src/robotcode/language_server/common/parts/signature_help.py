@@ -71,7 +71,7 @@ class SignatureHelpProtocolPart(LanguageServerProtocolPart):
                 retrigger_characters=retrigger_chars if retrigger_chars else None,
             )
 
-    @rpc_method(name="textDocument/signatureHelp", param_type=SignatureHelpParams, threaded=True)
+    @rpc_method(name="textDocument/signatureHelp", param_type=SignatureHelpParams, threaded=True, interactive=True)
     def _text_document_signature_help(
         self,
         text_document: TextDocumentIdentifier,
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import threading
 from threading import Event
-from typing import Any, ClassVar, Final, List, Optional, Set, Union
+from typing import Any, ClassVar, Final, Hashable, List, Optional, Set, Union
 
 from robotcode.core.concurrent import Task
 from robotcode.core.event import event
@@ -20,7 +20,9 @@ from robotcode.core.lsp.types import (
     LogTraceParams,
     MessageType,
     PositionEncodingKind,
+    ProgressParams,
     ProgressToken,
+    PublishDiagnosticsParams,
     Registration,
     RegistrationParams,
     SaveOptions,
@@ -31,6 +33,7 @@ from robotcode.core.lsp.types import (
     TraceValues,
     Unregistration,
     UnregistrationParams,
+    WorkDoneProgressReport,
     WorkspaceFolder,
 )
 from robotcode.core.utils.logging import TRACE, LoggingDescriptor
@@ -40,6 +43,7 @@ from robotcode.jsonrpc2.protocol import (
     JsonRPCErrors,
     JsonRPCException,
     JsonRPCMessage,
+    JsonRPCNotification,
     JsonRPCProtocol,
     ProtocolPartDescriptor,
     rpc_method,
@@ -374,6 +378,22 @@ class LanguageServerProtocol(JsonRPCProtocol):
     def log_trace(self, message: str, verbose: Optional[str] = None) -> None:
         self.send_notification("$/logTrace", LogTraceParams(message=message, verbose=verbose))
 
+    def _get_superseding_key(self, message: JsonRPCMessage) -> Optional[Hashable]:
+        if isinstance(message, JsonRPCNotification):
+            if message.method == "textDocument/publishDiagnostics" and isinstance(
+                message.params, PublishDiagnosticsParams
+            ):
+                return (message.method, message.params.uri)
+
+            if (
+                message.method == "$/progress"
+                and isinstance(message.params, ProgressParams)
+                and isinstance(message.params.value, WorkDoneProgressReport)
+            ):
+                return (message.method, message.params.token)
+
+        return None
+
     def _do_trace_message(self, message: JsonRPCMessage, msg: bytes) -> None:
         if getattr(message, "method", None) not in ["$/logTrace", "window/logMessage"]:
             self._data_logger.trace(lambda: f"JSON send: {msg.decode()!r}")
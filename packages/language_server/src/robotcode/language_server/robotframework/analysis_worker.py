@@ -0,0 +1,147 @@
+import functools
+import itertools
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Type, Union
+
+from robot.utils import FileReader
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.language import LanguageDefinition
+from robotcode.core.lsp.types import Diagnostic
+from robotcode.core.uri import Uri
+from robotcode.core.utils.path import normalized_path
+from robotcode.core.workspace import ConfigBase, TConfig, Workspace, WorkspaceFolder
+from robotcode.robot.config.model import RobotBaseProfile
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.reference_index import KeywordKey, VariableKey, keyword_key, variable_key
+from robotcode.robot.diagnostics.workspace_config import WorkspaceAnalysisConfig
+
+from .parts.workspace_symbols import WorkspaceSymbolEntry, get_workspace_symbol_entries
+
+
+@dataclass
+class AnalysisWorkerFolder:
+    name: str
+    uri: str
+    cache_path: Path
+    configs: Dict[Type[ConfigBase], ConfigBase] = field(default_factory=dict)
+
+
+@dataclass
+class AnalysisWorkerConfig:
+    root_uri: Optional[str]
+    folders: List[AnalysisWorkerFolder]
+    languages: List[LanguageDefinition]
+    robot_profile: RobotBaseProfile
+    analysis_config: WorkspaceAnalysisConfig
+    # the texts of the documents opened in the editor, they can differ from the files on disk
+    opened_documents: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class DocumentAnalysisResult:
+    uri: str
+    diagnostics: List[Diagnostic]
+    keywords: List[KeywordKey]
+    variables: List[VariableKey]
+    tags: List[str]
+    imports: Dict[str, Set[str]]
+    unresolved_imports: Set[str]
+    workspace_symbols: List[WorkspaceSymbolEntry]
+
+    @functools.cached_property
+    def sources(self) -> FrozenSet[str]:
+        # the document itself and all files it imports, directly or through the imported resources
+        return frozenset(
+            str(normalized_path(Path(source)))
+            for source in itertools.chain(self.imports.keys(), *self.imports.values())
+        )
+
+
+def create_analysis_executor(config: AnalysisWorkerConfig, max_workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_initialize_worker,
+        initargs=(config,),
+    )
+
+
+class _WorkerWorkspace(Workspace):
+    # the configuration of the client can't be requested from a worker, the resolved configuration of every
+    # workspace folder is sent to the worker instead
+    def __init__(self, config: AnalysisWorkerConfig) -> None:
+        super().__init__(
+            Uri(config.root_uri) if config.root_uri is not None else None,
+            [WorkspaceFolder(f.name, Uri(f.uri)) for f in config.folders],
+        )
+        self._folder_configs = {f.uri: f.configs for f in config.folders}
+
+    def get_configuration(self, section: Type[TConfig], scope_uri: Union[str, Uri, None] = None) -> TConfig:
+        folder = self.get_workspace_folder(scope_uri) if scope_uri is not None else None
+        if folder is not None:
+            config = self._folder_configs.get(str(folder.uri), {}).get(section, None)
+            if config is not None:
+                return config  # type: ignore[return-value]
+
+        return super().get_configuration(section, scope_uri)
+
+
+class _WorkerDocumentsCache(DocumentsCacheHelper):
+    def __init__(self, workspace: Workspace, config: AnalysisWorkerConfig) -> None:
+        super().__init__(
+            workspace, workspace.documents, FileWatcherManagerDummy(), config.robot_profile, config.analysis_config
+        )
+        self._cache_paths = {f.uri: f.cache_path for f in config.folders}
+        self._opened_documents = {str(Uri(uri).normalized()): text for uri, text in config.opened_documents.items()}
+
+        self.documents_manager.languages = list(config.languages)
+        self.documents_manager.on_read_document_text.add(self._read_document_text)
+
+    def _read_document_text(self, sender: Any, uri: Uri) -> str:
+        text = self._opened_documents.get(str(uri.normalized()), None)
+        if text is not None:
+            return text
+
+        with FileReader(uri.to_path()) as reader:
+            return str(reader.read())
+
+    def calc_cache_path(self, folder_uri: Uri) -> Path:
+        # use the same cache as the language server, so the library docs are only loaded once
+        cache_path = self._cache_paths.get(str(folder_uri), None)
+        return cache_path if cache_path is not None else super().calc_cache_path(folder_uri)
+
+
+_worker_documents_cache: Optional[_WorkerDocumentsCache] = None
+
+
+def _initialize_worker(config: AnalysisWorkerConfig) -> None:
+    global _worker_documents_cache
+
+    _worker_documents_cache = _WorkerDocumentsCache(_WorkerWorkspace(config), config)
+
+
+def analyze_document_in_worker(uri: str, text: str) -> DocumentAnalysisResult:
+    if _worker_documents_cache is None:
+        raise RuntimeError("Worker is not initialized.")
+
+    document = _worker_documents_cache.documents_manager.get_or_open_document(Uri(uri).to_path(), "robotframework")
+    if document.text() != text:
+        document.apply_full_change(None, text)
+
+    namespace = _worker_documents_cache.get_namespace(document)
+    namespace.analyze()
+
+    return DocumentAnalysisResult(
+        uri,
+        namespace.get_diagnostics(),
+        [keyword_key(kw) for kw in namespace.get_keyword_references().keys()],
+        [variable_key(var) for var in namespace.get_variable_references().keys()],
+        [tag.name for tag in namespace.get_tag_definitions()],
+        namespace.get_imported_sources(),
+        set(namespace.unresolved_imports),
+        get_workspace_symbol_entries(namespace),
+    )
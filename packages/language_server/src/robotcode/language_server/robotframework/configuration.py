@@ -69,6 +69,7 @@ class AnalysisConfig(ConfigBase):
     progress_mode: AnalysisProgressMode = AnalysisProgressMode.OFF
     references_code_lens: bool = False
     find_unused_references: bool = False
+    workers: Optional[int] = None
     cache: CacheConfig = field(default_factory=CacheConfig)
     robot: AnalysisRobotConfig = field(default_factory=AnalysisRobotConfig)
     modifiers: AnalysisDiagnosticModifiersConfig = field(default_factory=AnalysisDiagnosticModifiersConfig)
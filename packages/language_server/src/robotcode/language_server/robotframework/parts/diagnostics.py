@@ -1,17 +1,28 @@
-from concurrent.futures import CancelledError
-from typing import TYPE_CHECKING, Any, List, Optional
-
-from robotcode.core.concurrent import check_current_task_canceled
+import functools
+import weakref
+from concurrent.futures import CancelledError, Future, InvalidStateError
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from robotcode.analyze.code.code_analyzer import resolve_jobs, worker_analysis_config
+from robotcode.core.concurrent import RLock, Task, check_current_task_canceled
+from robotcode.core.filewatcher import FileWatcherEntry
 from robotcode.core.language import language_id
 from robotcode.core.lsp.types import (
     Diagnostic,
     DiagnosticSeverity,
     DiagnosticTag,
+    FileChangeType,
+    FileEvent,
     Position,
     Range,
+    WatchKind,
 )
 from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.utils.path import normalized_path
 from robotcode.language_server.robotframework.configuration import AnalysisConfig
 from robotcode.robot.diagnostics.entities import (
     ArgumentDefinition,
@@ -19,10 +30,17 @@ from robotcode.robot.diagnostics.entities import (
     GlobalVariableDefinition,
     LibraryArgumentDefinition,
 )
-from robotcode.robot.diagnostics.library_doc import LibraryDoc
-from robotcode.robot.diagnostics.namespace import Namespace
+from robotcode.robot.diagnostics.namespace import Namespace, could_resolve_import
+from robotcode.robot.diagnostics.workspace_config import AnalysisRobotConfig, CacheConfig, RobotConfig
 
 from ...common.parts.diagnostics import DiagnosticsCollectType, DiagnosticsResult
+from ..analysis_worker import (
+    AnalysisWorkerConfig,
+    AnalysisWorkerFolder,
+    DocumentAnalysisResult,
+    analyze_document_in_worker,
+    create_analysis_executor,
+)
 
 if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
@@ -47,27 +65,27 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
 
         self.parent.diagnostics.on_get_related_documents.add(self._on_get_related_documents)
 
+        # the results of documents analyzed in worker processes, they are valid until the document or one of the
+        # files it imports changes, the invalidations that happen while a worker is running are also checked
+        # against its result when it arrives
+        self._analysis_results_lock = RLock(default_timeout=120, name="RobotDiagnosticsProtocolPart.analysis_results")
+        self._analyzed_in_workers: weakref.WeakSet[TextDocument] = weakref.WeakSet()
+        self._running_analyses = 0
+        self._analysis_invalidations: List[Callable[[TextDocument, DocumentAnalysisResult], bool]] = []
+        self._analysis_file_watcher: Optional[FileWatcherEntry] = None
+
     def _on_initialized(self, sender: Any) -> None:
         self.parent.diagnostics.analyze.add(self.analyze)
+        self.parent.diagnostics.analyze_in_workers.add(self.analyze_in_workers)
         self.parent.documents_cache.namespace_initialized(self._on_namespace_initialized)
-        self.parent.documents_cache.libraries_changed.add(self._on_libraries_changed)
-        self.parent.documents_cache.variables_changed.add(self._on_variables_changed)
-
-    def _on_libraries_changed(self, sender: Any, libraries: List[LibraryDoc]) -> None:
-        for doc in self.parent.documents.documents:
-            namespace = self.parent.documents_cache.get_only_initialized_namespace(doc)
-            if namespace is not None:
-                lib_docs = (e.library_doc for e in namespace.get_libraries().values())
-                if any(lib_doc in lib_docs for lib_doc in libraries):
-                    self.parent.diagnostics.force_refresh_document(doc)
-
-    def _on_variables_changed(self, sender: Any, variables: List[LibraryDoc]) -> None:
-        for doc in self.parent.documents.documents:
-            namespace = self.parent.documents_cache.get_only_initialized_namespace(doc)
-            if namespace is not None:
-                lib_docs = (e.library_doc for e in namespace.get_variables_imports().values())
-                if any(lib_doc in lib_docs for lib_doc in variables):
-                    self.parent.diagnostics.force_refresh_document(doc)
+        self.parent.documents_cache.namespace_invalidated.add(self._on_namespace_invalidated)
+        self.parent.documents_cache.namespace_analysed.add(self._on_namespace_analysed)
+        self.parent.documents.on_document_cache_invalidated.add(self._on_document_cache_invalidated)
+
+    def _on_namespace_invalidated(self, sender: Any, namespace: Namespace) -> None:
+        # the imports manager invalidates only the namespaces of documents that imports a changed file
+        if namespace.document is not None:
+            self.parent.diagnostics.force_refresh_document(namespace.document)
 
     @language_id("robotframework")
     def analyze(self, sender: Any, document: TextDocument) -> None:
@@ -78,27 +96,211 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
         if namespace.document is not None:
             self.parent.diagnostics.force_refresh_document(namespace.document)
 
+    def _on_namespace_analysed(self, sender: Any, namespace: Namespace) -> None:
+        # the namespace of the language server process is used from now on
+        if namespace.document is not None:
+            with self._analysis_results_lock:
+                namespace.document.remove_data(DocumentAnalysisResult)
+                self._analyzed_in_workers.discard(namespace.document)
+
     @language_id("robotframework")
-    def _on_get_related_documents(self, sender: Any, document: TextDocument) -> Optional[List[TextDocument]]:
-        namespace = self.parent.documents_cache.get_only_initialized_namespace(document)
-        if namespace is None:
+    def _on_document_cache_invalidated(self, sender: Any, document: TextDocument) -> None:
+        source = str(normalized_path(document.uri.to_path()))
+
+        self._invalidate_analysis_results(lambda d, r: d is document or source in r.sources)
+
+    def _on_watched_files_changed(self, sender: Any, changes: List[FileEvent]) -> None:
+        changed = {str(normalized_path(Uri(c.uri).to_path())) for c in changes if c.type != FileChangeType.CREATED}
+        created = [Uri(c.uri).to_path() for c in changes if c.type == FileChangeType.CREATED]
+
+        self._invalidate_analysis_results(
+            lambda d, r: (
+                not changed.isdisjoint(r.sources) or any(could_resolve_import(r.unresolved_imports, p) for p in created)
+            )
+        )
+
+    def _invalidate_analysis_results(self, predicate: Callable[[TextDocument, DocumentAnalysisResult], bool]) -> None:
+        with self._analysis_results_lock:
+            if self._running_analyses:
+                self._analysis_invalidations.append(predicate)
+
+            invalid = []
+            for document in self._analyzed_in_workers:
+                analysis_result = document.get_data(DocumentAnalysisResult)
+                if analysis_result is None or predicate(document, analysis_result):
+                    invalid.append(document)
+
+            for document in invalid:
+                document.remove_data(DocumentAnalysisResult)
+                self._analyzed_in_workers.discard(document)
+
+        for document in invalid:
+            self.parent.documents_cache.reference_index.remove_document(str(document.uri))
+            self.parent.diagnostics.force_refresh_document(document)
+
+    def analyze_in_workers(self, sender: Any, documents: List[TextDocument]) -> Optional[Dict[TextDocument, Task[Any]]]:
+        workers = resolve_jobs(self.parent.workspace.get_configuration(AnalysisConfig).workers)
+        if workers <= 1:
             return None
 
-        result = []
+        result: Dict[TextDocument, Task[Any]] = {}
+        to_analyze: List[TextDocument] = []
 
-        lib_doc = namespace.get_library_doc()
-        for doc in self.parent.documents.documents:
-            if doc.language_id != "robotframework":
+        # the documents opened in the editor and the documents that already have a valid namespace are analyzed
+        # in the language server process
+        for document in documents:
+            if document.language_id != "robotframework" or document.opened_in_editor:
                 continue
 
-            doc_namespace = self.parent.documents_cache.get_only_initialized_namespace(doc)
-            if doc_namespace is None:
+            if document.get_data(DocumentAnalysisResult) is not None:
+                task: Task[Any] = Task()
+                task.set_result(None)
+                result[document] = task
                 continue
 
-            if doc_namespace.is_analyzed():
-                for ref in doc_namespace.get_namespace_references():
-                    if ref.library_doc == lib_doc:
-                        result.append(doc)
+            namespace = self.parent.documents_cache.get_only_initialized_namespace(document)
+            if namespace is None or namespace.invalid:
+                to_analyze.append(document)
+
+        if len(to_analyze) < 2:
+            return result
+
+        self._ensure_analysis_file_watcher()
+
+        executor = create_analysis_executor(self._create_analysis_worker_config(), min(workers, len(to_analyze)))
+        try:
+            for document in to_analyze:
+                text = document.text()
+
+                with self._analysis_results_lock:
+                    invalidations = len(self._analysis_invalidations)
+                    self._running_analyses += 1
+
+                try:
+                    future = executor.submit(analyze_document_in_worker, str(document.uri), text)
+                except BrokenProcessPool as e:
+                    # the remaining documents are analyzed in the language server process
+                    with self._analysis_results_lock:
+                        self._running_analyses -= 1
+
+                    self._logger.exception(e, exc_info=e)
+                    break
+
+                result[document] = task = Task()
+                future.add_done_callback(
+                    functools.partial(self._worker_analysis_done, document, text, invalidations, task)
+                )
+                task.add_done_callback(functools.partial(self._cancel_worker_analysis, future))
+        finally:
+            # the workers exit after the submitted documents are analyzed or cancelled
+            executor.shutdown(wait=False)
+
+        return result
+
+    def _cancel_worker_analysis(self, future: "Future[DocumentAnalysisResult]", task: Task[Any]) -> None:
+        if task.cancelled():
+            future.cancel()
+
+    def _worker_analysis_done(
+        self,
+        document: TextDocument,
+        text: str,
+        invalidations: int,
+        task: Task[Any],
+        future: "Future[DocumentAnalysisResult]",
+    ) -> None:
+        exception: Optional[BaseException] = None
+        analysis_result: Optional[DocumentAnalysisResult] = None
+
+        if future.cancelled():
+            exception = CancelledError()
+        elif future.exception() is not None:
+            exception = future.exception()
+        else:
+            analysis_result = future.result()
+
+        imports_manager = (
+            self.parent.documents_cache.get_imports_manager(document) if analysis_result is not None else None
+        )
+
+        with self._analysis_results_lock:
+            self._running_analyses -= 1
+
+            if analysis_result is not None and (
+                document.text() != text
+                or any(p(document, analysis_result) for p in self._analysis_invalidations[invalidations:])
+            ):
+                # the result is outdated, the namespace is created in the language server process if needed
+                analysis_result = None
+
+            if not self._running_analyses:
+                self._analysis_invalidations.clear()
+
+            if analysis_result is not None and imports_manager is not None:
+                document.set_data(DocumentAnalysisResult, analysis_result)
+                self._analyzed_in_workers.add(document)
+
+                imports_manager.import_graph.update(analysis_result.imports)
+                self.parent.documents_cache.reference_index.update_document_keys(
+                    str(document.uri), analysis_result.keywords, analysis_result.variables, analysis_result.tags
+                )
+                self.parent.robot_workspace_symbols.update_document_symbols(
+                    str(document.uri), analysis_result.workspace_symbols
+                )
+
+        try:
+            if exception is not None:
+                task.set_exception(exception)
+            else:
+                task.set_result(None)
+        except InvalidStateError:
+            pass
+
+    def _ensure_analysis_file_watcher(self) -> None:
+        # changes of files that are only loaded by a worker are not seen by the imports managers
+        if self._analysis_file_watcher is None:
+            self._analysis_file_watcher = self.parent.workspace.add_file_watcher(
+                self._on_watched_files_changed,
+                "**/*.{py,yaml,yml,json}",
+                WatchKind.CREATE | WatchKind.CHANGE | WatchKind.DELETE,
+            )
+
+    def _create_analysis_worker_config(self) -> AnalysisWorkerConfig:
+        folders = []
+        for folder in self.parent.workspace.workspace_folders:
+            cache_config = self.parent.workspace.get_configuration(CacheConfig, folder.uri)
+            folders.append(
+                AnalysisWorkerFolder(
+                    folder.name,
+                    str(folder.uri),
+                    self.parent.documents_cache.calc_cache_path(folder.uri),
+                    {
+                        RobotConfig: self.parent.workspace.get_configuration(RobotConfig, folder.uri),
+                        CacheConfig: replace(cache_config, library_workers=1),
+                        AnalysisRobotConfig: self.parent.workspace.get_configuration(AnalysisRobotConfig, folder.uri),
+                    },
+                )
+            )
+
+        return AnalysisWorkerConfig(
+            str(self.parent.workspace.root_uri) if self.parent.workspace.root_uri is not None else None,
+            folders,
+            self.parent.language_definitions,
+            self.parent.robot_profile,
+            worker_analysis_config(self.parent.analysis_config),
+            {str(d.uri): d.text() for d in self.parent.documents.documents if d.opened_in_editor},
+        )
+
+    @language_id("robotframework")
+    def _on_get_related_documents(self, sender: Any, document: TextDocument) -> Optional[List[TextDocument]]:
+        imports_manager = self.parent.documents_cache.get_imports_manager(document)
+
+        result = []
+
+        for source in sorted(imports_manager.get_importers([str(document.uri.to_path())], transitive=False)):
+            doc = self.parent.documents.get(str(Uri.from_path(source)))
+            if doc is not None and doc.language_id == "robotframework":
+                result.append(doc)
 
         return result
 
@@ -110,6 +312,13 @@ class RobotDiagnosticsProtocolPart(RobotLanguageServerProtocolPart):
         self, sender: Any, document: TextDocument, diagnostics_type: DiagnosticsCollectType
     ) -> DiagnosticsResult:
         try:
+            analysis_result = None if document.opened_in_editor else document.get_data(DocumentAnalysisResult)
+            if analysis_result is not None:
+                return DiagnosticsResult(
+                    self.collect_namespace_diagnostics,
+                    self.modify_diagnostics(document, analysis_result.diagnostics),
+                )
+
             namespace = self.parent.documents_cache.get_namespace(document)
 
             return DiagnosticsResult(
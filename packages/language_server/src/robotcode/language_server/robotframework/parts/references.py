@@ -35,6 +35,7 @@ from robotcode.robot.diagnostics.library_doc import (
 )
 from robotcode.robot.diagnostics.model_helper import ModelHelper
 from robotcode.robot.diagnostics.namespace import Namespace
+from robotcode.robot.diagnostics.reference_index import ReferenceCandidates
 from robotcode.robot.utils import get_robot_version
 from robotcode.robot.utils.ast import (
     get_nodes_at_position,
@@ -152,6 +153,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         stop_at_first: bool,
         func: Callable[..., Iterable[Location]],
         *args: Any,
+        candidates: Optional[ReferenceCandidates] = None,
         **kwargs: Any,
     ) -> List[Location]:
         result: List[Location] = []
@@ -159,6 +161,9 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         for doc in filter(lambda d: d.language_id == "robotframework", self.parent.documents.documents):
             check_current_task_canceled()
 
+            if candidates is not None and str(doc.uri) not in candidates:
+                continue
+
             result.extend(func(doc, *args, **kwargs))
             if result and stop_at_first:
                 break
@@ -239,6 +244,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                     self.find_variable_references_in_file,
                     variable,
                     False,
+                    candidates=self.parent.documents_cache.reference_index.variable_candidates(variable),
                 )
             )
         return result
@@ -329,6 +335,7 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
                 self.find_keyword_references_in_file,
                 kw_doc,
                 False,
+                candidates=self.parent.documents_cache.reference_index.keyword_candidates(kw_doc),
             )
         )
 
@@ -589,12 +596,15 @@ class RobotReferencesProtocolPart(RobotLanguageServerProtocolPart, ModelHelper):
         return None
 
     def find_tag_references(self, document: TextDocument, tag: str) -> List[Location]:
+        normalized_tag = normalize(tag)
+
         return self._find_references_in_workspace(
             document,
             False,
             self.find_tag_references_in_file,
-            normalize(tag),
+            normalized_tag,
             True,
+            candidates=self.parent.documents_cache.reference_index.tag_candidates(normalized_tag, True),
         )
 
     def references_ForceTags(  # noqa: N802
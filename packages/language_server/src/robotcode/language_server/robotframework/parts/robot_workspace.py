@@ -1,11 +1,14 @@
 from concurrent.futures import CancelledError
+from dataclasses import dataclass
 from logging import CRITICAL
 from threading import Event
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from robotcode.core.ignore_spec import DEFAULT_SPEC_RULES, GIT_IGNORE_FILE, ROBOT_IGNORE_FILE, IgnoreSpec, iter_files
 from robotcode.core.language import language_id
+from robotcode.core.lsp.types import TextDocumentIdentifier
 from robotcode.core.uri import Uri
+from robotcode.core.utils.dataclasses import CamelSnakeMixin
 from robotcode.core.utils.logging import LoggingDescriptor
 from robotcode.jsonrpc2.protocol import rpc_method
 from robotcode.language_server.common.parts.diagnostics import (
@@ -30,6 +33,18 @@ class CantReadDocumentError(Exception):
     pass
 
 
+@dataclass(repr=False)
+class GetImportersParams(CamelSnakeMixin):
+    text_document: Optional[TextDocumentIdentifier] = None
+    transitive: Optional[bool] = None
+
+
+@dataclass(repr=False)
+class ImportersEntry(CamelSnakeMixin):
+    uri: str
+    importers: List[str]
+
+
 class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
@@ -130,3 +145,31 @@ class RobotWorkspaceProtocolPart(RobotLanguageServerProtocolPart):
     def robot_cache_clear(self) -> None:
         for folder in self.parent.workspace.workspace_folders:
             self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder).clear_cache()
+
+    @rpc_method(name="robot/imports/importers", param_type=GetImportersParams, threaded=True)
+    @_logger.call
+    def robot_imports_importers(
+        self,
+        text_document: Optional[TextDocumentIdentifier] = None,
+        transitive: Optional[bool] = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[ImportersEntry]:
+        # the files that import the given document, without a document the importers of every imported file
+        if text_document is not None:
+            uri = Uri(text_document.uri)
+            importers = self.parent.documents_cache.get_imports_manager_for_uri(uri).get_importers(
+                [str(uri.to_path())], transitive=transitive if transitive is not None else True
+            )
+            return [ImportersEntry(str(uri), sorted(str(Uri.from_path(s)) for s in importers))]
+
+        graph: Dict[str, List[str]] = {}
+        for folder in self.parent.workspace.workspace_folders:
+            imports_manager = self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder)
+            for source, source_importers in imports_manager.import_graph.get_reverse_graph().items():
+                graph.setdefault(source, []).extend(source_importers)
+
+        return [
+            ImportersEntry(str(Uri.from_path(source)), sorted({str(Uri.from_path(s)) for s in source_importers}))
+            for source, source_importers in sorted(graph.items())
+        ]
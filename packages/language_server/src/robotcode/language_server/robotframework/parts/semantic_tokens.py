@@ -1,4 +1,6 @@
 import ast
+import bisect
+import itertools
 import operator
 import re
 from dataclasses import dataclass
@@ -11,7 +13,10 @@ from typing import (
     ClassVar,
     Dict,
     FrozenSet,
+    Iterable,
     Iterator,
+    List,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -48,10 +53,11 @@ from robotcode.core.lsp.types import (
     SemanticTokens,
     SemanticTokensDelta,
     SemanticTokensDeltaPartialResult,
+    SemanticTokensEdit,
     SemanticTokensPartialResult,
     SemanticTokenTypes,
 )
-from robotcode.core.text_document import TextDocument, range_to_utf16
+from robotcode.core.text_document import TextDocument
 from robotcode.robot.diagnostics.keyword_finder import DEFAULT_BDD_PREFIXES
 from robotcode.robot.diagnostics.library_doc import (
     ALL_RUN_KEYWORDS_MATCHERS,
@@ -159,6 +165,82 @@ class SemTokenInfo:
         )
 
 
+class _SemanticTokensResult(NamedTuple):
+    result_id: str
+    version: Optional[int]
+    namespace: Namespace
+    data: List[int]
+
+
+class _NodeLineIndex:
+    # the top level statements and blocks of all sections ordered by line, used to find the nodes in a range
+    # without walking the whole model
+
+    def __init__(self, model: ast.AST) -> None:
+        self._end_lines: List[int] = []
+        self._entries: List[Tuple[int, Section, ast.AST]] = []
+
+        end_line = 0
+        for section in getattr(model, "sections", []):
+            for node in [section.header, *section.body] if section.header is not None else section.body:
+                start_line = node.lineno
+                # end_lineno is -1 for blocks without statements, keep the end lines sorted for bisect
+                end_line = max(end_line, start_line, node.end_lineno)
+
+                self._end_lines.append(end_line)
+                self._entries.append((start_line, section, node))
+
+    def iter_nodes(self, range: Range) -> Iterator[ast.AST]:
+        # robot lines are 1-based
+        start_line = range.start.line + 1
+        end_line = range.end.line + 1
+
+        current_section: Optional[Section] = None
+        for node_start_line, section, node in itertools.islice(
+            self._entries, bisect.bisect_left(self._end_lines, start_line), None
+        ):
+            if node_start_line > end_line:
+                break
+
+            if section is not current_section:
+                current_section = section
+                yield section
+
+            yield node
+            yield from iter_nodes(node)
+
+
+# the size of one encoded token in the semantic tokens data array
+_TOKEN_SIZE = 5
+
+
+def _compute_semantic_tokens_edits(old_data: List[int], new_data: List[int]) -> List[SemanticTokensEdit]:
+    # the encoding is relative to the previous token, so an edit in the document only changes the tokens
+    # between the common prefix and the common suffix of both arrays
+    max_length = min(len(old_data), len(new_data))
+
+    start = 0
+    while start < max_length and old_data[start] == new_data[start]:
+        start += 1
+    start -= start % _TOKEN_SIZE
+
+    if start == len(old_data) == len(new_data):
+        return []
+
+    end = 0
+    while end < max_length - start and old_data[-end - 1] == new_data[-end - 1]:
+        end += 1
+    end -= end % _TOKEN_SIZE
+
+    return [
+        SemanticTokensEdit(
+            start=start,
+            delete_count=len(old_data) - end - start,
+            data=new_data[start : len(new_data) - end],
+        )
+    ]
+
+
 class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
     def __init__(self, parent: "RobotLanguageServerProtocol") -> None:
         super().__init__(parent)
@@ -166,6 +248,10 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         parent.semantic_tokens.token_modifiers += list(RobotSemTokenModifiers)
 
         parent.semantic_tokens.collect_full.add(self.collect_full)
+        parent.semantic_tokens.collect_full_delta.add(self.collect_full_delta)
+        parent.semantic_tokens.collect_range.add(self.collect_range)
+
+        self._result_ids = itertools.count(1)
 
         self.parent.on_initialized.add(self._on_initialized)
 
@@ -957,11 +1043,17 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         last_line = 0
         last_col = 0
 
+        nodes: Iterable[ast.AST] = (
+            iter_nodes(model)
+            if range is None
+            else document.get_cache(self.__get_node_line_index, model).iter_nodes(range)
+        )
+
         def get_tokens() -> Iterator[Tuple[Token, ast.AST]]:
             current_section: Optional[Section] = None
             in_invalid_section = False
 
-            for node in iter_nodes(model):
+            for node in nodes:
                 if cached_isinstance(node, Section):
                     current_section = node
                     if get_robot_version() >= (7, 0):
@@ -1134,67 +1226,70 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
                             continue
                         yield token, node
 
-        lines = document.get_lines()
-
-        for robot_token, robot_node in takewhile(
-            lambda t: range is None or token_in_range(t[0], range),
-            dropwhile(
-                lambda t: range is not None and not token_in_range(t[0], range),
-                [(t, n) for t, n in get_tokens() if t.type not in [Token.SEPARATOR, Token.EOL, Token.EOS]],
-            ),
-        ):
-            for token in self.generate_sem_tokens(robot_token, robot_node, namespace, builtin_library_doc):
-                if token.length == 0:
-                    continue
-
-                token_range = range_to_utf16(
-                    lines,
-                    Range(
-                        start=Position(line=token.lineno - 1, character=token.col_offset),
-                        end=Position(
-                            line=token.lineno - 1,
-                            character=token.col_offset + token.length,
-                        ),
-                    ),
-                )
+        sem_tokens = [
+            token
+            for robot_token, robot_node in takewhile(
+                lambda t: range is None or token_in_range(t[0], range),
+                dropwhile(
+                    lambda t: range is not None and not token_in_range(t[0], range),
+                    [(t, n) for t, n in get_tokens() if t.type not in [Token.SEPARATOR, Token.EOL, Token.EOS]],
+                ),
+            )
+            for token in self.generate_sem_tokens(robot_token, robot_node, namespace, builtin_library_doc)
+            if token.length != 0
+        ]
+
+        # convert all ranges at once with the cached utf16 column maps of the document
+        token_ranges = document.ranges_to_utf16(
+            Range(
+                start=Position(line=token.lineno - 1, character=token.col_offset),
+                end=Position(line=token.lineno - 1, character=token.col_offset + token.length),
+            )
+            for token in sem_tokens
+        )
 
-                token_col_offset = token_range.start.character
-                token_length = token_range.end.character - token_range.start.character
+        for token, token_range in zip(sem_tokens, token_ranges):
+            token_col_offset = token_range.start.character
+            token_length = token_range.end.character - token_range.start.character
 
-                current_line = token.lineno - 1
+            current_line = token.lineno - 1
 
-                data.append(current_line - last_line)
+            data.append(current_line - last_line)
 
-                if last_line != current_line:
-                    last_col = token_col_offset
-                    data.append(last_col)
-                else:
-                    delta = token_col_offset - last_col
-                    data.append(delta)
-                    last_col += delta
+            if last_line != current_line:
+                last_col = token_col_offset
+                data.append(last_col)
+            else:
+                delta = token_col_offset - last_col
+                data.append(delta)
+                last_col += delta
 
-                last_line = current_line
+            last_line = current_line
 
-                data.append(token_length)
+            data.append(token_length)
 
-                data.append(self.parent.semantic_tokens.token_types.index(token.sem_token_type))
+            data.append(self.parent.semantic_tokens.token_types.index(token.sem_token_type))
 
-                data.append(
-                    reduce(
-                        operator.or_,
-                        [2 ** self.parent.semantic_tokens.token_modifiers.index(e) for e in token.sem_modifiers],
-                    )
-                    if token.sem_modifiers
-                    else 0
+            data.append(
+                reduce(
+                    operator.or_,
+                    [2 ** self.parent.semantic_tokens.token_modifiers.index(e) for e in token.sem_modifiers],
                 )
+                if token.sem_modifiers
+                else 0
+            )
 
         return SemanticTokens(data=data)
 
+    def __get_node_line_index(self, document: TextDocument, model: ast.AST) -> _NodeLineIndex:
+        return _NodeLineIndex(model)
+
     def _collect(
-        self, document: TextDocument, range: Optional[Range]
+        self, document: TextDocument, range: Optional[Range], namespace: Optional[Namespace] = None
     ) -> Union[SemanticTokens, SemanticTokensPartialResult, None]:
         model = self.parent.documents_cache.get_model(document, False)
-        namespace = self.parent.documents_cache.get_namespace(document)
+        if namespace is None:
+            namespace = self.parent.documents_cache.get_namespace(document)
 
         builtin_library_doc = next(
             (
@@ -1209,11 +1304,32 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
 
         return self._collect_internal(document, model, range, namespace, builtin_library_doc)
 
+    def _collect_full_result(
+        self, document: TextDocument, previous: Optional[_SemanticTokensResult]
+    ) -> _SemanticTokensResult:
+        version = document.version
+        namespace = self.parent.documents_cache.get_namespace(document)
+
+        # the tokens depend only on the document text and the namespace, reuse them if nothing has changed
+        if previous is not None and previous.version == version and previous.namespace is namespace:
+            return previous
+
+        tokens = self._collect(document, None, namespace)
+
+        result = _SemanticTokensResult(
+            str(next(self._result_ids)), version, namespace, tokens.data if tokens is not None else []
+        )
+        document.set_data(RobotSemanticTokenProtocolPart, result)
+
+        return result
+
     @language_id("robotframework")
     def collect_full(
         self, sender: Any, document: TextDocument, **kwargs: Any
     ) -> Union[SemanticTokens, SemanticTokensPartialResult, None]:
-        return self._collect(document, None)
+        result = self._collect_full_result(document, document.get_data(RobotSemanticTokenProtocolPart))
+
+        return SemanticTokens(data=result.data, result_id=result.result_id)
 
     @language_id("robotframework")
     def collect_range(
@@ -1234,4 +1350,13 @@ class RobotSemanticTokenProtocolPart(RobotLanguageServerProtocolPart):
         SemanticTokensDeltaPartialResult,
         None,
     ]:
-        return None
+        previous: Optional[_SemanticTokensResult] = document.get_data(RobotSemanticTokenProtocolPart)
+
+        result = self._collect_full_result(document, previous)
+
+        if previous is None or previous.result_id != previous_result_id:
+            return SemanticTokens(data=result.data, result_id=result.result_id)
+
+        return SemanticTokensDelta(
+            edits=_compute_semantic_tokens_edits(previous.data, result.data), result_id=result.result_id
+        )
@@ -1,13 +1,23 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Union
+import heapq
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
+from robotcode.core.language import language_id
 from robotcode.core.lsp.types import (
     Location,
+    Range,
     SymbolInformation,
     SymbolKind,
     SymbolTag,
     WorkspaceSymbol,
 )
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
 from robotcode.core.utils.logging import LoggingDescriptor
+from robotcode.core.workspace import WorkspaceFolder
+from robotcode.robot.diagnostics.data_cache import CacheSection
+from robotcode.robot.diagnostics.namespace import Namespace
 
 from .protocol_part import RobotLanguageServerProtocolPart
 
@@ -15,74 +25,294 @@ if TYPE_CHECKING:
     from ..protocol import RobotLanguageServerProtocol
 
 
-def contains_characters_in_order(main_string: str, check_string: str) -> bool:
-    main_iter = iter(main_string.lower())
-    return all(char in main_iter for char in check_string.lower())
+def _character_mask(s: str) -> int:
+    result = 0
+    for c in s:
+        result |= 1 << (ord(c) & 63)
+    return result
+
+
+def _match_score(name: str, query: str) -> Optional[Tuple[int, int]]:
+    # lower is better: exact match, prefix, substring and at last the characters in order with the fewest gaps
+    if not query:
+        return (0, 0)
+
+    if name == query:
+        return (0, 0)
+
+    index = name.find(query)
+    if index == 0:
+        return (1, 0)
+    if index > 0:
+        return (2, index)
+
+    gaps = 0
+    position = -1
+    for c in query:
+        next_position = name.find(c, position + 1)
+        if next_position < 0:
+            return None
+        if next_position != position + 1:
+            gaps += 1
+        position = next_position
+
+    return (3, gaps)
+
+
+@dataclass
+class WorkspaceSymbolEntry:
+    name: str
+    kind: SymbolKind
+    range: Range
+    container_name: Optional[str] = None
+    deprecated: bool = False
+
+
+@dataclass
+class DocumentWorkspaceSymbols:
+    uri: str
+    mtime: Optional[int]
+    symbols: List[WorkspaceSymbolEntry]
+
+
+@dataclass
+class WorkspaceSymbolsCacheData:
+    documents: List[DocumentWorkspaceSymbols]
+
+
+class _IndexedDocument:
+    def __init__(self, document: DocumentWorkspaceSymbols) -> None:
+        self.document = document
+        self.entries = [(_character_mask(e.name.lower()), e.name.lower(), e) for e in document.symbols]
+
+
+class WorkspaceSymbolIndex:
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._documents: Dict[str, _IndexedDocument] = {}
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self._documents
+
+    def update_document(self, uri: str, mtime: Optional[int], symbols: List[WorkspaceSymbolEntry]) -> None:
+        with self._lock:
+            self._documents[uri] = _IndexedDocument(DocumentWorkspaceSymbols(uri, mtime, symbols))
+
+    def update_documents(self, documents: List[DocumentWorkspaceSymbols]) -> None:
+        with self._lock:
+            for document in documents:
+                # symbols of analysed documents are newer than loaded ones
+                if document.uri not in self._documents:
+                    self._documents[document.uri] = _IndexedDocument(document)
+
+    def remove_document(self, uri: str) -> None:
+        with self._lock:
+            self._documents.pop(uri, None)
+
+    def get_documents(self) -> List[DocumentWorkspaceSymbols]:
+        with self._lock:
+            return [d.document for d in self._documents.values()]
+
+    def search(self, query: str, max_results: Optional[int] = None) -> List[Tuple[str, WorkspaceSymbolEntry]]:
+        lower_query = query.lower()
+        query_mask = _character_mask(lower_query)
+
+        def iter_matches() -> Iterator[Tuple[Tuple[int, int, int, str], str, WorkspaceSymbolEntry]]:
+            with self._lock:
+                documents = list(self._documents.values())
+
+            for document in documents:
+                for mask, lower_name, entry in document.entries:
+                    if mask & query_mask != query_mask:
+                        continue
+
+                    score = _match_score(lower_name, lower_query)
+                    if score is None:
+                        continue
+
+                    yield (*score, len(lower_name), lower_name), document.document.uri, entry
+
+        if max_results is None:
+            matches = sorted(iter_matches(), key=lambda m: m[0])
+        else:
+            matches = heapq.nsmallest(max_results, iter_matches(), key=lambda m: m[0])
+
+        return [(uri, entry) for _, uri, entry in matches]
+
+
+def _get_mtime(uri: str) -> Optional[int]:
+    try:
+        return Uri(uri).to_path().stat().st_mtime_ns
+    except (SystemExit, KeyboardInterrupt):
+        raise
+    except BaseException:
+        return None
+
+
+def get_workspace_symbol_entries(namespace: Namespace) -> List[WorkspaceSymbolEntry]:
+    container_name = namespace.get_library_doc().name
+
+    return [
+        *(
+            WorkspaceSymbolEntry(kw_doc.name, SymbolKind.FUNCTION, kw_doc.range, container_name, kw_doc.is_deprecated)
+            for kw_doc in namespace.get_keyword_references().keys()
+            if kw_doc.source == namespace.source
+        ),
+        *(
+            WorkspaceSymbolEntry(var.name, SymbolKind.VARIABLE, var.range, container_name)
+            for var in namespace.get_variable_references().keys()
+            if var.source == namespace.source
+        ),
+        *(
+            WorkspaceSymbolEntry(test.name, SymbolKind.CLASS, test.range, container_name)
+            for test in namespace.get_testcase_definitions()
+        ),
+    ]
 
 
 class RobotWorkspaceSymbolsProtocolPart(RobotLanguageServerProtocolPart):
     _logger = LoggingDescriptor()
 
+    CACHE_ENTRY_NAME = "workspace_symbols"
+    SAVE_DELAY = 10.0
+
     def __init__(self, parent: "RobotLanguageServerProtocol") -> None:
         super().__init__(parent)
 
+        self.max_results = 1000
+
+        self._index = WorkspaceSymbolIndex()
+        self._loaded_folders: Set[str] = set()
+        self._load_lock = threading.RLock()
+
+        self._save_timer_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+
         parent.workspace_symbols.collect.add(self.collect)
+        parent.documents.did_close.add(self._document_did_close)
+        parent.on_initialized.add(self._on_initialized)
+        parent.on_shutdown.add(self._on_shutdown)
+
+    def _on_initialized(self, sender: Any) -> None:
+        self.parent.documents_cache.namespace_analysed.add(self._namespace_analysed)
+
+    def _on_shutdown(self, sender: Any) -> None:
+        with self._save_timer_lock:
+            if self._save_timer is None:
+                return
+
+            self._save_timer.cancel()
+            self._save_timer = None
+
+        self._save()
+
+    def _namespace_analysed(self, sender: Any, namespace: Namespace) -> None:
+        document = namespace.document
+        if document is None:
+            return
+
+        self._index_namespace(document, namespace)
+
+    @language_id("robotframework")
+    def _document_did_close(self, sender: Any, document: TextDocument, full_close: bool) -> None:
+        if full_close:
+            self._index.remove_document(str(document.uri))
+            self._schedule_save()
+
+    def _index_namespace(self, document: TextDocument, namespace: Namespace) -> None:
+        self.update_document_symbols(str(document.uri), get_workspace_symbol_entries(namespace))
+
+    def update_document_symbols(self, uri: str, symbols: List[WorkspaceSymbolEntry]) -> None:
+        self._index.update_document(uri, _get_mtime(uri), symbols)
+        self._schedule_save()
+
+    def _get_cache_folders(self) -> List[WorkspaceFolder]:
+        return list(self.parent.workspace.workspace_folders)
+
+    def _load(self) -> None:
+        with self._load_lock:
+            for folder in self._get_cache_folders():
+                if str(folder.uri) in self._loaded_folders:
+                    continue
+                self._loaded_folders.add(str(folder.uri))
+
+                try:
+                    data_cache = self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder).data_cache
+                    if not data_cache.cache_data_exists(CacheSection.WORKSPACE, self.CACHE_ENTRY_NAME):
+                        continue
+
+                    data = data_cache.read_cache_data(
+                        CacheSection.WORKSPACE, self.CACHE_ENTRY_NAME, WorkspaceSymbolsCacheData
+                    )
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except BaseException as e:
+                    self._logger.exception(e)
+                    continue
+
+                # files changed since the symbols were saved are indexed again when they are analysed
+                self._index.update_documents(
+                    [d for d in data.documents if d.mtime is not None and d.mtime == _get_mtime(d.uri)]
+                )
+
+    def _schedule_save(self) -> None:
+        with self._save_timer_lock:
+            if self._save_timer is not None:
+                return
+
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self._save_delayed)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_delayed(self) -> None:
+        with self._save_timer_lock:
+            self._save_timer = None
+
+        self._save()
+
+    def _save(self) -> None:
+        self._load()
+
+        documents_by_folder: Dict[str, List[DocumentWorkspaceSymbols]] = {}
+        folders = self._get_cache_folders()
+        for document in self._index.get_documents():
+            folder = self.parent.workspace.get_workspace_folder(document.uri)
+            if folder is not None:
+                documents_by_folder.setdefault(str(folder.uri), []).append(document)
+
+        for folder in folders:
+            try:
+                data_cache = self.parent.documents_cache.get_imports_manager_for_workspace_folder(folder).data_cache
+                data_cache.save_cache_data(
+                    CacheSection.WORKSPACE,
+                    self.CACHE_ENTRY_NAME,
+                    WorkspaceSymbolsCacheData(documents_by_folder.get(str(folder.uri), [])),
+                )
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                self._logger.exception(e)
 
     @_logger.call
     def collect(self, sender: Any, query: str) -> Optional[Union[List[WorkspaceSymbol], List[SymbolInformation], None]]:
-        result: List[WorkspaceSymbol] = []
+        self._load()
+
         for document in self.parent.documents.documents:
-            if document.language_id == "robotframework":
+            if document.language_id == "robotframework" and str(document.uri) not in self._index:
                 namespace = self.parent.documents_cache.get_only_initialized_namespace(document)
                 if namespace is not None:
-                    container_name = namespace.get_library_doc().name
-
-                    for kw_doc in [
-                        v
-                        for v in namespace.get_keyword_references().keys()
-                        if v.source == namespace.source and contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=kw_doc.name,
-                                kind=SymbolKind.FUNCTION,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=kw_doc.range,
-                                ),
-                                tags=[SymbolTag.DEPRECATED] if kw_doc.is_deprecated else None,
-                                container_name=container_name,
-                            )
-                        )
-                    for var in [
-                        v
-                        for v in namespace.get_variable_references().keys()
-                        if v.source == namespace.source and contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=var.name,
-                                kind=SymbolKind.VARIABLE,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=var.range,
-                                ),
-                                container_name=container_name,
-                            )
-                        )
-
-                    for test in [
-                        v for v in namespace.get_testcase_definitions() if contains_characters_in_order(v.name, query)
-                    ]:
-                        result.append(
-                            WorkspaceSymbol(
-                                name=test.name,
-                                kind=SymbolKind.CLASS,
-                                location=Location(
-                                    uri=document.document_uri,
-                                    range=test.range,
-                                ),
-                                container_name=container_name,
-                            )
-                        )
-        return result
+                    self._index_namespace(document, namespace)
+
+        return [
+            WorkspaceSymbol(
+                name=entry.name,
+                kind=entry.kind,
+                location=Location(uri=uri, range=entry.range),
+                tags=[SymbolTag.DEPRECATED] if entry.deprecated else None,
+                container_name=entry.container_name,
+            )
+            for uri, entry in self._index.search(query, self.max_results)
+        ]
@@ -1,8 +1,16 @@
+import os
 import pickle
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Tuple, Type, TypeVar, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast
 
 from robotcode.core.utils.dataclasses import as_json, from_json
 
@@ -12,6 +20,66 @@ _T = TypeVar("_T")
 class CacheSection(Enum):
     LIBRARY = "libdoc"
     VARIABLES = "variables"
+    WORKSPACE = "workspace"
+
+
+class CacheStorage(Enum):
+    PICKLE = "pickle"
+    JSON = "json"
+    SQLITE = "sqlite"
+
+
+@dataclass
+class DataCacheStats:
+    entries: int = 0
+    size: int = 0
+    sections: Dict[str, int] = field(default_factory=dict)
+
+
+def _create_cache_dir(cache_dir: Path) -> None:
+    if not Path.exists(cache_dir):
+        Path.mkdir(cache_dir, parents=True, exist_ok=True)
+        Path(cache_dir / ".gitignore").write_text(
+            "# Created by robotcode\n*\n",
+            "utf-8",
+        )
+
+
+# network file systems on which SQLite can't use a write ahead log, see https://www.sqlite.org/wal.html
+_REMOTE_FILE_SYSTEMS = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "ncpfs", "afs", "9p", "fuse.sshfs"}
+
+
+def _is_remote_path(path: Path) -> bool:
+    path = path.absolute()
+
+    if sys.platform == "win32":
+        import ctypes
+
+        if str(path).startswith("\\\\"):
+            return True
+
+        DRIVE_REMOTE = 4  # noqa: N806
+        return bool(ctypes.windll.kernel32.GetDriveTypeW(path.anchor) == DRIVE_REMOTE)
+
+    try:
+        mounts = Path("/proc/mounts").read_text().splitlines()
+    except OSError:
+        return False
+
+    mount_point: Optional[Path] = None
+    file_system = ""
+    for line in mounts:
+        parts = line.split()
+        if len(parts) < 3:
+            continue
+
+        candidate = Path(parts[1].replace("\\040", " "))
+        if (candidate == path or candidate in path.parents) and (
+            mount_point is None or len(candidate.parts) > len(mount_point.parts)
+        ):
+            mount_point, file_system = candidate, parts[2]
+
+    return file_system in _REMOTE_FILE_SYSTEMS
 
 
 class DataCache(ABC):
@@ -26,17 +94,28 @@ class DataCache(ABC):
     @abstractmethod
     def save_cache_data(self, section: CacheSection, entry_name: str, data: Any) -> None: ...
 
+    def close(self) -> None:
+        pass
+
 
 class FileCacheDataBase(DataCache, ABC):
     def __init__(self, cache_dir: Path) -> None:
         self.cache_dir = cache_dir
 
-        if not Path.exists(self.cache_dir):
-            Path.mkdir(self.cache_dir, parents=True)
-            Path(self.cache_dir / ".gitignore").write_text(
-                "# Created by robotcode\n*\n",
-                "utf-8",
-            )
+        _create_cache_dir(self.cache_dir)
+
+    def _write_cache_file(self, cache_file: Path, data: bytes) -> None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file and rename it, so other processes sharing the cache never read a partial file
+        fd, temp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_name, cache_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
 
 
 class JsonDataCache(FileCacheDataBase):
@@ -54,10 +133,7 @@ class JsonDataCache(FileCacheDataBase):
         return from_json(cache_file.read_text("utf-8"), types)
 
     def save_cache_data(self, section: CacheSection, entry_name: str, data: Any) -> None:
-        cached_file = self.build_cache_data_filename(section, entry_name)
-
-        cached_file.parent.mkdir(parents=True, exist_ok=True)
-        cached_file.write_text(as_json(data), "utf-8")
+        self._write_cache_file(self.build_cache_data_filename(section, entry_name), as_json(data).encode("utf-8"))
 
 
 class PickleDataCache(FileCacheDataBase):
@@ -82,8 +158,275 @@ class PickleDataCache(FileCacheDataBase):
             raise TypeError(f"Expected {types} but got {type(result)}")
 
     def save_cache_data(self, section: CacheSection, entry_name: str, data: Any) -> None:
-        cached_file = self.build_cache_data_filename(section, entry_name)
+        self._write_cache_file(self.build_cache_data_filename(section, entry_name), pickle.dumps(data))
+
+
+class SqliteDataCache(DataCache):
+    # stores all entries in a single database file, reading thousands of small files is slow on network drives
+    FILE_NAME = "cache.db"
+    # entries written with another format version are ignored and replaced
+    FORMAT_VERSION = 1
+    # version of the table layout, stored in `PRAGMA user_version`, older databases are migrated on open
+    SCHEMA_VERSION = 2
+    # reads are written in batches, so readers don't take the write lock of a cache shared by several processes
+    ACCESS_FLUSH_INTERVAL = 60.0
+
+    def __init__(self, cache_dir: Path, timeout: float = 30, track_access: bool = False) -> None:
+        self.cache_dir = cache_dir
+        self.cache_file = cache_dir / self.FILE_NAME
+        self.timeout = timeout
+        # remember the last read of an entry, so prune can remove the least recently used entries
+        self.track_access = track_access
+
+        self._lock = threading.RLock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self.journal_mode: Optional[str] = None
+
+        self._pending_access: Dict[Tuple[str, str], float] = {}
+        self._last_access_flush = time.monotonic()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            _create_cache_dir(self.cache_dir)
+
+            connection = sqlite3.connect(
+                str(self.cache_file), timeout=self.timeout, isolation_level=None, check_same_thread=False
+            )
+            try:
+                self.journal_mode = self._set_journal_mode(connection)
+                self._migrate(connection)
+            except BaseException:
+                connection.close()
+                raise
+
+            self._connection = connection
+
+        return self._connection
+
+    def _get_schema_version(self, connection: sqlite3.Connection) -> int:
+        row = connection.execute("PRAGMA user_version").fetchone()
+        return int(row[0]) if row is not None else 0
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        if self._get_schema_version(connection) >= self.SCHEMA_VERSION:
+            return
+
+        # another process may migrate the same database, so check the version again inside the write transaction
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = self._get_schema_version(connection)
+
+            if version < 1:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    "section TEXT NOT NULL, "
+                    "name TEXT NOT NULL, "
+                    "version INTEGER NOT NULL, "
+                    "data BLOB NOT NULL, "
+                    "modified REAL NOT NULL, "
+                    "PRIMARY KEY (section, name)"
+                    ") WITHOUT ROWID"
+                )
+
+            if version < 2:
+                columns = {row[1] for row in connection.execute("PRAGMA table_info(entries)")}
+                if "accessed" not in columns:
+                    connection.execute("ALTER TABLE entries ADD COLUMN accessed REAL NOT NULL DEFAULT 0")
+                    connection.execute("UPDATE entries SET accessed = modified")
+
+            if version < self.SCHEMA_VERSION:
+                connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    def _flush_access(self, connection: sqlite3.Connection) -> None:
+        self._last_access_flush = time.monotonic()
+
+        if not self._pending_access:
+            return
+
+        pending, self._pending_access = self._pending_access, {}
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "UPDATE entries SET accessed = MAX(accessed, ?) WHERE section = ? AND name = ?",
+                [(accessed, section, name) for (section, name), accessed in pending.items()],
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            raise
+
+    def _set_journal_mode(self, connection: sqlite3.Connection) -> str:
+        # write ahead logging allows other processes to read the cache while one process writes to it, but it needs
+        # shared memory on the same host, so on network file systems the default rollback journal is used
+        if not _is_remote_path(self.cache_dir):
+            try:
+                row = connection.execute("PRAGMA journal_mode=WAL").fetchone()
+                if row is not None and str(row[0]).lower() == "wal":
+                    connection.execute("PRAGMA synchronous=NORMAL")
+                    return "wal"
+            except sqlite3.OperationalError:
+                pass
+
+        try:
+            row = connection.execute("PRAGMA journal_mode=DELETE").fetchone()
+        except sqlite3.OperationalError:
+            # another process holds the database open in another mode, it can't be switched now
+            row = connection.execute("PRAGMA journal_mode").fetchone()
+
+        return str(row[0]).lower() if row is not None else "delete"
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                try:
+                    self._flush_access(self._connection)
+                except sqlite3.Error:
+                    pass
+                self._connection.close()
+                self._connection = None
+
+    def cache_data_exists(self, section: CacheSection, entry_name: str) -> bool:
+        with self._lock:
+            return (
+                self._get_connection()
+                .execute(
+                    "SELECT 1 FROM entries WHERE section = ? AND name = ? AND version = ?",
+                    (section.value, entry_name, self.FORMAT_VERSION),
+                )
+                .fetchone()
+                is not None
+            )
+
+    def read_cache_data(
+        self, section: CacheSection, entry_name: str, types: Union[Type[_T], Tuple[Type[_T], ...]]
+    ) -> _T:
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT data FROM entries WHERE section = ? AND name = ? AND version = ?",
+                (section.value, entry_name, self.FORMAT_VERSION),
+            ).fetchone()
+
+            if row is not None and self.track_access:
+                self._pending_access[(section.value, entry_name)] = time.time()
+                if time.monotonic() - self._last_access_flush >= self.ACCESS_FLUSH_INTERVAL:
+                    try:
+                        self._flush_access(connection)
+                    except sqlite3.OperationalError:
+                        # the access times are only a hint for prune, a locked database must not fail the read
+                        pass
+
+        if row is None:
+            raise KeyError(f"Cache entry '{entry_name}' not found in section '{section.value}'")
+
+        result = pickle.loads(zlib.decompress(row[0]))
+
+        if isinstance(result, types):
+            return result
+
+        raise TypeError(f"Expected {types} but got {type(result)}")
+
+    def save_cache_data(self, section: CacheSection, entry_name: str, data: Any) -> None:
+        blob = zlib.compress(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+        now = time.time()
+        with self._lock:
+            self._get_connection().execute(
+                "INSERT OR REPLACE INTO entries (section, name, version, data, modified, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (section.value, entry_name, self.FORMAT_VERSION, blob, now, now),
+            )
+
+    def stats(self) -> DataCacheStats:
+        result = DataCacheStats()
+
+        with self._lock:
+            rows = (
+                self._get_connection()
+                .execute("SELECT section, COUNT(*), SUM(LENGTH(data)) FROM entries GROUP BY section")
+                .fetchall()
+            )
+
+        for section, count, size in rows:
+            result.entries += count
+            result.size += size or 0
+            result.sections[section] = count
+
+        return result
+
+    def used_size(self) -> int:
+        # the size of the pages in use, it is never smaller than the data of the entries and, unlike summing up the
+        # data, doesn't need to read the whole table
+        with self._lock:
+            connection = self._get_connection()
+            page_count = connection.execute("PRAGMA page_count").fetchone()
+            freelist_count = connection.execute("PRAGMA freelist_count").fetchone()
+            page_size = connection.execute("PRAGMA page_size").fetchone()
+
+        return (int(page_count[0]) - int(freelist_count[0])) * int(page_size[0])
+
+    def prune(
+        self,
+        max_age: Optional[float] = None,
+        sections: Optional[Iterable[CacheSection]] = None,
+        max_size: Optional[int] = None,
+    ) -> int:
+        # removes the entries of other format versions and the entries not written in the last max_age seconds,
+        # then the least recently used entries until the data is smaller than max_size bytes
+        conditions = ["version != ?"]
+        parameters: List[Any] = [self.FORMAT_VERSION]
+
+        if max_age is not None:
+            conditions.append("modified < ?")
+            parameters.append(time.time() - max_age)
+
+        section_clause = ""
+        section_values: List[Any] = []
+        if sections is not None:
+            section_values = [s.value for s in sections]
+            section_clause = f"section IN ({', '.join('?' for _ in section_values)})"
+
+        query = f"DELETE FROM entries WHERE ({' OR '.join(conditions)})"
+        if section_clause:
+            query += f" AND {section_clause}"
+
+        with self._lock:
+            connection = self._get_connection()
+            self._flush_access(connection)
+
+            result: int = connection.execute(query, [*parameters, *section_values]).rowcount
+
+            if max_size is not None:
+                size = 0
+                removed = []
+                for section, name, entry_size in connection.execute(
+                    "SELECT section, name, LENGTH(data) FROM entries"
+                    + (f" WHERE {section_clause}" if section_clause else "")
+                    + " ORDER BY accessed DESC",
+                    section_values,
+                ):
+                    size += entry_size
+                    if size > max_size:
+                        removed.append((section, name))
+
+                if removed:
+                    connection.executemany("DELETE FROM entries WHERE section = ? AND name = ?", removed)
+                    result += len(removed)
+
+            return result
+
 
-        cached_file.parent.mkdir(parents=True, exist_ok=True)
-        with cached_file.open("wb") as f:
-            pickle.dump(data, f)
+def create_data_cache(storage: CacheStorage, cache_dir: Path) -> DataCache:
+    if storage == CacheStorage.JSON:
+        return JsonDataCache(cache_dir)
+    if storage == CacheStorage.SQLITE:
+        return SqliteDataCache(cache_dir)
+    return PickleDataCache(cache_dir)
@@ -18,6 +18,8 @@ from typing import (
     cast,
 )
 
+import platformdirs
+
 from robot.parsing.lexer.tokens import Token
 from robotcode.core.documents_manager import DocumentsManager
 from robotcode.core.event import event
@@ -32,8 +34,10 @@ from ..config.model import RobotBaseProfile
 from ..utils import get_robot_version
 from ..utils.stubs import Languages
 from .imports_manager import ImportsManager
+from .incremental_parser import IncrementalParser
 from .library_doc import LibraryDoc
 from .namespace import DocumentType, Namespace
+from .reference_index import ReferenceIndex
 from .workspace_config import (
     AnalysisDiagnosticModifiersConfig,
     AnalysisRobotConfig,
@@ -61,6 +65,7 @@ class DocumentsCacheHelper:
         file_watcher_manager: FileWatcherManagerBase,
         robot_profile: Optional[RobotBaseProfile],
         analysis_config: Optional[WorkspaceAnalysisConfig],
+        incremental_parsing: bool = True,
     ) -> None:
         self.INITIALIZED_NAMESPACE = _CacheEntry()
 
@@ -78,6 +83,18 @@ class DocumentsCacheHelper:
             weakref.WeakKeyDictionary()
         )
 
+        self.incremental_parsing = incremental_parsing
+        self._incremental_parsers_lock = threading.RLock()
+        self._incremental_parser_keys = {
+            (document_type, data_only): _CacheEntry()
+            for document_type in (DocumentType.GENERAL, DocumentType.RESOURCE, DocumentType.INIT)
+            for data_only in (False, True)
+        }
+
+        self.reference_index = ReferenceIndex()
+        self._reference_index_lock = threading.RLock()
+        self.documents_manager.on_document_cache_invalidated.add(self.__document_cache_invalidated)
+
     def get_languages_for_document(self, document_or_uri: Union[TextDocument, Uri, str]) -> Optional[Languages]:
         if get_robot_version() < (6, 0):
             return None
@@ -267,7 +284,7 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_tokens(content, True, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.GENERAL, True, get)
 
     def __get_general_tokens(self, document: TextDocument) -> List[Token]:
         lang = self.get_languages_for_document(document)
@@ -276,10 +293,32 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_tokens(content, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.GENERAL, False, get)
+
+    def __get_tokens_internal(
+        self,
+        document: TextDocument,
+        document_type: DocumentType,
+        data_only: bool,
+        get: Callable[[str], List[Token]],
+    ) -> List[Token]:
+        if not self.incremental_parsing:
+            return get(document.text())
+
+        return self.__get_incremental_parser(document, document_type, data_only).get_tokens(document.get_lines(), get)
 
-    def __get_tokens_internal(self, document: TextDocument, get: Callable[[str], List[Token]]) -> List[Token]:
-        return get(document.text())
+    def __get_incremental_parser(
+        self, document: TextDocument, document_type: DocumentType, data_only: bool
+    ) -> IncrementalParser:
+        key = self._incremental_parser_keys[(document_type, data_only)]
+
+        with self._incremental_parsers_lock:
+            result: Optional[IncrementalParser] = document.get_data(key)
+            if result is None:
+                result = IncrementalParser()
+                document.set_data(key, result)
+
+            return result
 
     def get_resource_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
         if data_only:
@@ -294,7 +333,7 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_resource_tokens(content, True, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.RESOURCE, True, get)
 
     def __get_resource_tokens(self, document: TextDocument) -> List[Token]:
         lang = self.get_languages_for_document(document)
@@ -303,7 +342,7 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_resource_tokens(content, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.RESOURCE, False, get)
 
     def get_init_tokens(self, document: TextDocument, data_only: bool = False) -> List[Token]:
         if data_only:
@@ -317,7 +356,7 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_init_tokens(content, True, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.INIT, True, get)
 
     def __get_init_tokens(self, document: TextDocument) -> List[Token]:
         lang = self.get_languages_for_document(document)
@@ -326,7 +365,7 @@ class DocumentsCacheHelper:
             with io.StringIO(text) as content:
                 return [e for e in self.__internal_get_init_tokens(content, lang=lang)]
 
-        return self.__get_tokens_internal(document, get)
+        return self.__get_tokens_internal(document, DocumentType.INIT, False, get)
 
     def get_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         document_type = self.get_document_type(document)
@@ -345,6 +384,20 @@ class DocumentsCacheHelper:
         document: TextDocument,
         tokens: Iterable[Any],
         document_type: DocumentType,
+        data_only: bool,
+    ) -> ast.AST:
+        if not self.incremental_parsing or not isinstance(tokens, list):
+            return self.__parse_model(document, tokens, document_type)
+
+        return self.__get_incremental_parser(document, document_type, data_only).get_model(
+            tokens, lambda t: self.__parse_model(document, t, document_type)
+        )
+
+    def __parse_model(
+        self,
+        document: TextDocument,
+        tokens: Iterable[Any],
+        document_type: DocumentType,
     ) -> ast.AST:
         from robot.parsing.parser.parser import _get_model
 
@@ -371,10 +424,10 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_general_model, self.get_general_tokens(document))
 
     def __get_general_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.GENERAL)
+        return self.__get_model(document, tokens, DocumentType.GENERAL, True)
 
     def __get_general_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.GENERAL)
+        return self.__get_model(document, tokens, DocumentType.GENERAL, False)
 
     def get_resource_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         if data_only:
@@ -386,10 +439,10 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_resource_model, self.get_resource_tokens(document))
 
     def __get_resource_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.RESOURCE)
+        return self.__get_model(document, tokens, DocumentType.RESOURCE, True)
 
     def __get_resource_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.RESOURCE)
+        return self.__get_model(document, tokens, DocumentType.RESOURCE, False)
 
     def get_init_model(self, document: TextDocument, data_only: bool = True) -> ast.AST:
         if data_only:
@@ -400,10 +453,10 @@ class DocumentsCacheHelper:
         return document.get_cache(self.__get_init_model, self.get_init_tokens(document))
 
     def __get_init_model_data_only(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.INIT)
+        return self.__get_model(document, tokens, DocumentType.INIT, True)
 
     def __get_init_model(self, document: TextDocument, tokens: Iterable[Any]) -> ast.AST:
-        return self.__get_model(document, tokens, DocumentType.INIT)
+        return self.__get_model(document, tokens, DocumentType.INIT, False)
 
     def get_namespace(self, document: TextDocument) -> Namespace:
         return document.get_cache(self.__get_namespace)
@@ -444,6 +497,9 @@ class DocumentsCacheHelper:
     @event
     def namespace_invalidated(sender, namespace: Namespace) -> None: ...
 
+    @event
+    def namespace_analysed(sender, namespace: Namespace) -> None: ...
+
     def __invalidate_namespace(self, sender: Namespace) -> None:
         document = sender.document
         if document is not None:
@@ -454,6 +510,41 @@ class DocumentsCacheHelper:
 
             self.namespace_invalidated(self, sender)
 
+        self.__remove_from_reference_index(sender)
+
+    def __namespace_analysed(self, sender: Namespace) -> None:
+        document = sender.document
+        if document is None:
+            return
+
+        try:
+            keywords = sender.get_keyword_references().keys()
+            variables = sender.get_variable_references().keys()
+            tags = [tag.name for tag in sender.get_tag_definitions()]
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+            return
+
+        with self._reference_index_lock:
+            # the document may have been changed while analysing, then the references are outdated
+            if document.get_cache_value(self.__get_namespace) is not sender:
+                return
+
+            self.reference_index.update_document(str(document.uri), keywords, variables, tags)
+
+        self.namespace_analysed(self, sender)
+
+    def __remove_from_reference_index(self, namespace: Namespace) -> None:
+        if namespace.document is not None:
+            with self._reference_index_lock:
+                self.reference_index.remove_document(str(namespace.document.uri))
+
+    def __document_cache_invalidated(self, sender: Any, document: TextDocument) -> None:
+        with self._reference_index_lock:
+            self.reference_index.remove_document(str(document.uri))
+
     def __namespace_initialized(self, sender: Namespace) -> None:
         if sender.document is not None:
             sender.document.set_data(self.INITIALIZED_NAMESPACE, sender)
@@ -496,6 +587,7 @@ class DocumentsCacheHelper:
         )
         result.has_invalidated.add(self.__invalidate_namespace)
         result.has_initialized.add(self.__namespace_initialized)
+        result.has_analysed.add(self.__namespace_analysed)
 
         return result
 
@@ -532,6 +624,33 @@ class DocumentsCacheHelper:
             self.analysis_config.cache.ignore_arguments_for_library + cache_config.ignore_arguments_for_library,
             self.analysis_config.robot.global_library_search_order + analysis_config.global_library_search_order,
             cache_base_path,
+            library_workers=(
+                cache_config.library_workers
+                if cache_config.library_workers is not None
+                else self.analysis_config.cache.library_workers
+            ),
+            library_worker_max_jobs=(
+                cache_config.library_worker_max_jobs
+                if cache_config.library_worker_max_jobs is not None
+                else self.analysis_config.cache.library_worker_max_jobs
+            ),
+            library_worker_max_memory=(
+                cache_config.library_worker_max_memory
+                if cache_config.library_worker_max_memory is not None
+                else self.analysis_config.cache.library_worker_max_memory
+            ),
+            cache_storage=(
+                cache_config.storage if cache_config.storage is not None else self.analysis_config.cache.storage
+            ),
+            shared_cache_path=(
+                Path(platformdirs.user_cache_dir("robotcode", appauthor=False), "libdoc")
+                if (
+                    cache_config.shared_cache
+                    if cache_config.shared_cache is not None
+                    else self.analysis_config.cache.shared_cache
+                )
+                else None
+            ),
         )
 
         result.libraries_changed.add(self._on_libraries_changed)
@@ -0,0 +1,67 @@
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Set
+
+from robotcode.core.concurrent import RLock
+from robotcode.core.utils.path import normalized_path
+
+
+def _normalize(source: str) -> str:
+    return str(normalized_path(Path(source)))
+
+
+class ImportGraph:
+    # the files imported by a resource or suite file and the reverse direction, which files import a file
+    def __init__(self) -> None:
+        self._lock = RLock(default_timeout=120, name="ImportGraph.lock")
+        self._imports: Dict[str, Set[str]] = {}
+        self._importers: Dict[str, Set[str]] = {}
+
+    def update(self, imports: Mapping[str, Iterable[str]]) -> None:
+        # replaces the imports of the given files, the imports of all other files are kept
+        with self._lock:
+            for importer, imported in imports.items():
+                importer = _normalize(importer)
+                new_imports = {_normalize(s) for s in imported}
+                old_imports = self._imports.get(importer, set())
+
+                for source in old_imports - new_imports:
+                    importers = self._importers.get(source)
+                    if importers is not None:
+                        importers.discard(importer)
+                        if not importers:
+                            del self._importers[source]
+
+                for source in new_imports - old_imports:
+                    self._importers.setdefault(source, set()).add(importer)
+
+                if new_imports:
+                    self._imports[importer] = new_imports
+                else:
+                    self._imports.pop(importer, None)
+
+    def get_imports(self, source: str) -> Set[str]:
+        with self._lock:
+            return set(self._imports.get(_normalize(source), ()))
+
+    def get_importers(self, sources: Iterable[str], transitive: bool = True) -> Set[str]:
+        with self._lock:
+            pending = [_normalize(s) for s in sources]
+            result: Set[str] = set()
+
+            while pending:
+                for importer in self._importers.get(pending.pop(), ()):
+                    if importer not in result:
+                        result.add(importer)
+                        if transitive:
+                            pending.append(importer)
+
+            return result
+
+    def get_reverse_graph(self) -> Dict[str, List[str]]:
+        with self._lock:
+            return {k: sorted(v) for k, v in sorted(self._importers.items())}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._imports.clear()
+            self._importers.clear()
@@ -1,15 +1,14 @@
 import ast
-import itertools
-import multiprocessing as mp
 import os
 import shutil
 import sys
 import threading
+import time
 import weakref
 import zlib
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures import TimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 from typing import (
@@ -17,6 +16,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Mapping,
     Optional,
@@ -54,12 +54,13 @@ from ..__version__ import __version__
 from ..utils import get_robot_version, get_robot_version_str
 from ..utils.robot_path import find_file_ex
 from ..utils.variables import contains_variable
-from .data_cache import CacheSection
-from .data_cache import PickleDataCache as DefaultDataCache
+from .data_cache import CacheSection, CacheStorage, SqliteDataCache, create_data_cache
 from .entities import (
     CommandLineVariableDefinition,
     VariableDefinition,
 )
+from .import_graph import ImportGraph
+from .keyword_finder import KeywordLookupCache, NamespaceKeywordIndex
 from .library_doc import (
     ROBOT_LIBRARY_PACKAGE,
     CompleteResult,
@@ -82,6 +83,8 @@ from .library_doc import (
     resolve_args,
     resolve_variable,
 )
+from .library_fingerprints import LibraryFingerprints, get_distribution_key
+from .worker_pool import LibraryWorkerPool
 
 if TYPE_CHECKING:
     from .document_cache_helper import DocumentsCacheHelper
@@ -99,6 +102,8 @@ REST_EXTENSIONS = (".rst", ".rest")
 LOAD_LIBRARY_TIME_OUT = 10
 COMPLETE_LIBRARY_IMPORT_TIME_OUT = COMPLETE_RESOURCE_IMPORT_TIME_OUT = COMPLETE_VARIABLES_IMPORT_TIME_OUT = 5
 
+SHARED_CACHE_MAX_SIZE = 256 * 1024 * 1024
+
 
 class _EntryKey:
     pass
@@ -514,6 +519,12 @@ class ImportsManager:
         ignore_arguments_for_library: List[str],
         global_library_search_order: List[str],
         cache_base_path: Optional[Path],
+        library_workers: Optional[int] = None,
+        library_worker_max_jobs: Optional[int] = None,
+        library_worker_max_memory: Optional[int] = None,
+        cache_storage: Optional[CacheStorage] = None,
+        shared_cache_path: Optional[Path] = None,
+        shared_cache_max_size: int = SHARED_CACHE_MAX_SIZE,
     ) -> None:
         super().__init__()
 
@@ -535,11 +546,17 @@ class ImportsManager:
         self._logger.trace(lambda: f"use {cache_base_path} as base for caching")
 
         self.cache_path = cache_base_path / ".robotcode_cache"
-        self.data_cache = DefaultDataCache(
+        self.data_cache = create_data_cache(
+            cache_storage or CacheStorage.PICKLE,
             self.cache_path
             / f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-            / get_robot_version_str()
+            / get_robot_version_str(),
+        )
+
+        self.shared_data_cache: Optional[SqliteDataCache] = (
+            SqliteDataCache(shared_cache_path, track_access=True) if shared_cache_path is not None else None
         )
+        self.shared_cache_max_size = shared_cache_max_size
 
         self.cmd_variables = variables
         self.cmd_variable_files = variable_files
@@ -571,11 +588,15 @@ class ImportsManager:
             self._environment.update(environment)
 
         self._library_files_cache = SimpleLRUCache(2048)
+        self._library_fingerprints = LibraryFingerprints()
         self._resource_files_cache = SimpleLRUCache(2048)
         self._variables_files_cache = SimpleLRUCache(2048)
 
-        self._executor_lock = RLock(default_timeout=120, name="ImportsManager._executor_lock")
-        self._executor: Optional[ProcessPoolExecutor] = None
+        self._library_workers = library_workers
+        self._library_worker_max_jobs = library_worker_max_jobs
+        self._library_worker_max_memory = library_worker_max_memory
+        self._worker_pool_lock = RLock(default_timeout=120, name="ImportsManager._worker_pool_lock")
+        self._worker_pool: Optional[LibraryWorkerPool] = None
 
         self._resource_document_changed_timer_lock = RLock(
             default_timeout=120, name="ImportsManager._resource_document_changed_timer_lock"
@@ -588,15 +609,30 @@ class ImportsManager:
             weakref.WeakKeyDictionary()
         )
 
+        self._keyword_lookup_caches_lock = RLock(
+            default_timeout=120, name="ImportsManager._keyword_lookup_caches_lock"
+        )
+        self._keyword_lookup_caches: "weakref.WeakValueDictionary[Tuple[Any, ...], KeywordLookupCache]" = (
+            weakref.WeakValueDictionary()
+        )
+
+        self._import_graph = ImportGraph()
+        self._namespaces_lock = RLock(default_timeout=120, name="ImportsManager._namespaces_lock")
+        self._namespaces: Dict[str, "weakref.WeakSet[Namespace]"] = {}
+
         self._diagnostics: List[Diagnostic] = []
 
     def __del__(self) -> None:
         try:
-            if self._executor is not None:
-                self._executor.shutdown(wait=False)
+            if self._worker_pool is not None:
+                self._worker_pool.shutdown()
         except RuntimeError:
             pass
 
+        self.data_cache.close()
+        if self.shared_data_cache is not None:
+            self.shared_data_cache.close()
+
     @property
     def diagnostics(self) -> List[Diagnostic]:
         self.get_command_line_variables()
@@ -610,7 +646,63 @@ class ImportsManager:
     def get_namespace_for_resource(self, document: TextDocument) -> "Namespace":
         return self.document_cache_helper.get_resource_namespace(document)
 
+    def get_keyword_lookup_cache(self, index: NamespaceKeywordIndex) -> KeywordLookupCache:
+        with self._keyword_lookup_caches_lock:
+            result = self._keyword_lookup_caches.get(index.fingerprint, None)
+            if result is None:
+                result = KeywordLookupCache(index)
+                self._keyword_lookup_caches[index.fingerprint] = result
+
+            return result
+
+    @property
+    def import_graph(self) -> ImportGraph:
+        return self._import_graph
+
+    def update_namespace_imports(self, namespace: "Namespace", imports: Mapping[str, Iterable[str]]) -> None:
+        self._import_graph.update(imports)
+
+        source = str(normalized_path(Path(namespace.source)))
+        with self._namespaces_lock:
+            # the sets are weak, drop the files whose namespaces are all gone
+            for key in [k for k, v in self._namespaces.items() if not v and k != source]:
+                del self._namespaces[key]
+
+            namespaces = self._namespaces.get(source, None)
+            if namespaces is None:
+                namespaces = self._namespaces[source] = weakref.WeakSet()
+            namespaces.add(namespace)
+
+    def get_importers(self, sources: Iterable[str], transitive: bool = True) -> Set[str]:
+        return self._import_graph.get_importers(sources, transitive)
+
+    def _invalidate_importers(self, sources: Iterable[Optional[str]]) -> None:
+        # only the namespaces of files that import one of the changed files, directly or through other resources,
+        # are invalidated
+        importers = self._import_graph.get_importers(s for s in sources if s is not None)
+        if not importers:
+            return
+
+        with self._namespaces_lock:
+            namespaces = [n for s in importers for n in list(self._namespaces.get(s, ()))]
+
+            for source in importers:
+                if source in self._namespaces and not self._namespaces[source]:
+                    del self._namespaces[source]
+
+        self._logger.debug(
+            lambda: f"Invalidate {len(namespaces)} namespaces of {len(importers)} importers", context_name="import"
+        )
+
+        for namespace in namespaces:
+            namespace.invalidate()
+
     def clear_cache(self) -> None:
+        self.data_cache.close()
+        if self.shared_data_cache is not None:
+            self.shared_data_cache.close()
+        self._library_fingerprints.clear()
+
         if self.cache_path.exists():
             shutil.rmtree(self.cache_path, ignore_errors=True)
 
@@ -743,6 +835,9 @@ class ImportsManager:
     @event
     def imports_changed(sender, uri: DocumentUri) -> None: ...
 
+    @event
+    def library_doc_loaded(sender, section: CacheSection, doc: LibraryDoc, cached: bool, elapsed: float) -> None: ...
+
     def _on_possible_imports_modified(self, sender: Any, uri: DocumentUri) -> None:
         # TODO: do we really need this?
         self.imports_changed(self, uri)
@@ -802,6 +897,7 @@ class ImportsManager:
                     resource_changed.append(lib_doc)
 
         if resource_changed:
+            self._invalidate_importers(r.source for r in resource_changed)
             self.resources_changed(self, resource_changed)
 
     @_logger.call
@@ -812,6 +908,10 @@ class ImportsManager:
 
         lib_doc: Optional[LibraryDoc]
 
+        self._library_fingerprints.invalidate(
+            Uri(change.uri).to_path() for change in changes if Uri(change.uri).scheme == "file"
+        )
+
         with self._libaries_lock:
             for l_key, l_entry in self._libaries.items():
                 lib_doc = None
@@ -848,6 +948,7 @@ class ImportsManager:
                 if t == FileChangeType.DELETED:
                     self.__remove_library_entry(l, self._libaries[l], True)
 
+            self._invalidate_importers(v.source_or_origin for (_, _, v) in libraries_changed if v is not None)
             self.libraries_changed(self, [v for (_, _, v) in libraries_changed if v is not None])
 
         if resource_changed:
@@ -855,6 +956,7 @@ class ImportsManager:
                 if t == FileChangeType.DELETED:
                     self.__remove_resource_entry(r, self._resources[r], True)
 
+            self._invalidate_importers(r.name for (r, _, _) in resource_changed)
             self.resources_changed(self, [v for (_, _, v) in resource_changed if v is not None])
 
         if variables_changed:
@@ -862,6 +964,7 @@ class ImportsManager:
                 if t == FileChangeType.DELETED:
                     self.__remove_variables_entry(v, self._variables[v], True)
 
+            self._invalidate_importers(v.source_or_origin for (_, _, v) in variables_changed if v is not None)
             self.variables_changed(self, [v for (_, _, v) in variables_changed if v is not None])
 
     def __remove_library_entry(
@@ -976,14 +1079,8 @@ class ImportsManager:
                 if result.submodule_search_locations:
                     if result.mtimes is None:
                         result.mtimes = {}
-                    result.mtimes.update(
-                        {
-                            str(f): os.stat(f, follow_symlinks=False).st_mtime_ns
-                            for f in itertools.chain(
-                                *(Path(loc).rglob("**/*.py") for loc in result.submodule_search_locations)
-                            )
-                        }
-                    )
+                    for loc in result.submodule_search_locations:
+                        result.mtimes.update(self._library_fingerprints.get(loc))
 
             return result, import_name, ignore_arguments
         except (SystemExit, KeyboardInterrupt):
@@ -1045,14 +1142,8 @@ class ImportsManager:
                 if result.submodule_search_locations:
                     if result.mtimes is None:
                         result.mtimes = {}
-                    result.mtimes.update(
-                        {
-                            str(f): os.stat(f, follow_symlinks=False).st_mtime_ns
-                            for f in itertools.chain(
-                                *(Path(loc).rglob("**/*.py") for loc in result.submodule_search_locations)
-                            )
-                        }
-                    )
+                    for loc in result.submodule_search_locations:
+                        result.mtimes.update(self._library_fingerprints.get(loc))
 
             return result, import_name
         except (SystemExit, KeyboardInterrupt):
@@ -1188,12 +1279,17 @@ class ImportsManager:
         return find_file_ex(name, base_dir, "Variables")
 
     @property
-    def executor(self) -> ProcessPoolExecutor:
-        with self._executor_lock:
-            if self._executor is None:
-                self._executor = ProcessPoolExecutor(mp_context=mp.get_context("spawn"))
+    def worker_pool(self) -> LibraryWorkerPool:
+        with self._worker_pool_lock:
+            if self._worker_pool is None:
+                self._worker_pool = LibraryWorkerPool(
+                    self._library_workers,
+                    self._library_worker_max_jobs,
+                    self._library_worker_max_memory,
+                )
+                self._worker_pool.start()
 
-        return self._executor
+        return self._worker_pool
 
     def _get_library_libdoc_handler(
         self,
@@ -1209,6 +1305,53 @@ class ImportsManager:
 
         return _call
 
+    def _get_shared_cache_entry_name(self, meta: Optional[LibraryMetaData], args: Tuple[Any, ...]) -> Optional[str]:
+        # only libraries of installed distributions imported without arguments are shared between workspaces
+        if self.shared_data_cache is None or meta is None or meta.has_errors or meta.origin is None or args:
+            return None
+
+        distribution_key = get_distribution_key(meta.origin)
+        if distribution_key is None:
+            return None
+
+        return "/".join(
+            (
+                f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
+                get_robot_version_str(),
+                distribution_key,
+                meta.filepath_base,
+            )
+        )
+
+    def _read_shared_library_doc(self, entry_name: str) -> Optional[LibraryDoc]:
+        if self.shared_data_cache is None:
+            return None
+
+        try:
+            if self.shared_data_cache.cache_data_exists(CacheSection.LIBRARY, entry_name):
+                self._logger.debug(lambda: f"Use shared library cache entry {entry_name}", context_name="import")
+                return self.shared_data_cache.read_cache_data(CacheSection.LIBRARY, entry_name, LibraryDoc)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+
+        return None
+
+    def _save_shared_library_doc(self, entry_name: str, library_doc: LibraryDoc) -> None:
+        if self.shared_data_cache is None:
+            return
+
+        try:
+            self.shared_data_cache.save_cache_data(CacheSection.LIBRARY, entry_name, library_doc)
+            # pruning reads the whole shared cache, so only prune when the used pages exceed the limit
+            if self.shared_data_cache.used_size() > self.shared_cache_max_size:
+                self.shared_data_cache.prune(max_size=self.shared_cache_max_size)
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except BaseException as e:
+            self._logger.exception(e)
+
     def _get_library_libdoc(
         self,
         name: str,
@@ -1217,6 +1360,22 @@ class ImportsManager:
         base_dir: str,
         variables: Optional[Dict[str, Any]] = None,
     ) -> LibraryDoc:
+        start = time.monotonic()
+
+        result, cached = self._load_library_libdoc(name, args, working_dir, base_dir, variables)
+
+        self.library_doc_loaded(self, CacheSection.LIBRARY, result, cached, time.monotonic() - start)
+
+        return result
+
+    def _load_library_libdoc(
+        self,
+        name: str,
+        args: Tuple[Any, ...],
+        working_dir: str,
+        base_dir: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[LibraryDoc, bool]:
         meta, _source, ignore_arguments = self.get_library_meta(name, base_dir, variables)
 
         if meta is not None and not meta.has_errors:
@@ -1238,7 +1397,7 @@ class ImportsManager:
                             self._logger.debug(
                                 lambda: f"Use cached library meta data for {name}", context_name="import"
                             )
-                            return self.data_cache.read_cache_data(CacheSection.LIBRARY, spec_path, LibraryDoc)
+                            return self.data_cache.read_cache_data(CacheSection.LIBRARY, spec_path, LibraryDoc), True
 
                     except (SystemExit, KeyboardInterrupt):
                         raise
@@ -1251,33 +1410,36 @@ class ImportsManager:
                 except BaseException as e:
                     self._logger.exception(e)
 
-        self._logger.debug(lambda: f"Load library in process {name}{args!r}", context_name="import")
-        # if self._process_pool_executor is None:
-        #     self._process_pool_executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
-        # executor = self._process_pool_executor
-        executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
-        try:
+        shared_entry_name = self._get_shared_cache_entry_name(meta, args if not ignore_arguments else ())
+        result = self._read_shared_library_doc(shared_entry_name) if shared_entry_name is not None else None
+        cached = result is not None
+
+        if result is None:
+            self._logger.debug(lambda: f"Load library in process {name}{args!r}", context_name="import")
             try:
-                result = executor.submit(
-                    get_library_doc,
-                    name,
-                    args if not ignore_arguments else (),
-                    working_dir,
-                    base_dir,
-                    self.get_resolvable_command_line_variables(),
-                    variables,
-                ).result(LOAD_LIBRARY_TIME_OUT)
+                try:
+                    result = self.worker_pool.submit(
+                        get_library_doc,
+                        name,
+                        args if not ignore_arguments else (),
+                        working_dir,
+                        base_dir,
+                        self.get_resolvable_command_line_variables(),
+                        variables,
+                        timeout=LOAD_LIBRARY_TIME_OUT,
+                    )
 
-            except TimeoutError as e:
-                raise RuntimeError(f"Timeout loading library {name}({args!r})") from e
+                except TimeoutError as e:
+                    raise RuntimeError(f"Timeout loading library {name}({args!r})") from e
 
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as e:
-            self._logger.exception(e)
-            raise
-        finally:
-            executor.shutdown(wait=True)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as e:
+                self._logger.exception(e)
+                raise
+
+            if shared_entry_name is not None and not result.errors:
+                self._save_shared_library_doc(shared_entry_name, result)
 
         try:
             if meta is not None:
@@ -1301,7 +1463,7 @@ class ImportsManager:
         except BaseException as e:
             self._logger.exception(e)
 
-        return result
+        return result, cached
 
     @_logger.call
     def get_libdoc_for_library_import(
@@ -1396,6 +1558,26 @@ class ImportsManager:
         resolve_variables: bool = True,
         resolve_command_line_vars: bool = True,
     ) -> VariablesDoc:
+        start = time.monotonic()
+
+        result, cached = self._load_variables_libdoc(
+            name, args, working_dir, base_dir, variables, resolve_variables, resolve_command_line_vars
+        )
+
+        self.library_doc_loaded(self, CacheSection.VARIABLES, result, cached, time.monotonic() - start)
+
+        return result
+
+    def _load_variables_libdoc(
+        self,
+        name: str,
+        args: Tuple[Any, ...],
+        working_dir: str,
+        base_dir: str,
+        variables: Optional[Dict[str, Any]] = None,
+        resolve_variables: bool = True,
+        resolve_command_line_vars: bool = True,
+    ) -> Tuple[VariablesDoc, bool]:
         meta, _source = self.get_variables_meta(
             name,
             base_dir,
@@ -1415,7 +1597,10 @@ class ImportsManager:
                         if saved_meta == meta:
                             spec_path = meta.filepath_base + ".spec"
 
-                            return self.data_cache.read_cache_data(CacheSection.VARIABLES, spec_path, VariablesDoc)
+                            return (
+                                self.data_cache.read_cache_data(CacheSection.VARIABLES, spec_path, VariablesDoc),
+                                True,
+                            )
                     except (SystemExit, KeyboardInterrupt):
                         raise
                     except BaseException as e:
@@ -1427,10 +1612,9 @@ class ImportsManager:
                 except BaseException as e:
                     self._logger.exception(e)
 
-        executor = ProcessPoolExecutor(max_workers=1, mp_context=mp.get_context("spawn"))
         try:
             try:
-                result = executor.submit(
+                result = self.worker_pool.submit(
                     get_variables_doc,
                     name,
                     args,
@@ -1438,7 +1622,8 @@ class ImportsManager:
                     base_dir,
                     self.get_resolvable_command_line_variables() if resolve_command_line_vars else None,
                     variables,
-                ).result(LOAD_LIBRARY_TIME_OUT)
+                    timeout=LOAD_LIBRARY_TIME_OUT,
+                )
 
             except TimeoutError as e:
                 raise RuntimeError(f"Timeout loading library {name}({args!r})") from e
@@ -1448,8 +1633,6 @@ class ImportsManager:
         except BaseException as e:
             self._logger.exception(e)
             raise
-        finally:
-            executor.shutdown(True)
 
         try:
             if meta is not None:
@@ -1470,7 +1653,7 @@ class ImportsManager:
         except BaseException as e:
             self._logger.exception(e)
 
-        return result
+        return result, False
 
     @_logger.call
     def get_libdoc_for_variables_import(
@@ -1601,14 +1784,15 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> List[CompleteResult]:
-        return self.executor.submit(
+        return self.worker_pool.submit(
             complete_library_import,
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_LIBRARY_IMPORT_TIME_OUT)
+            timeout=COMPLETE_LIBRARY_IMPORT_TIME_OUT,
+        )
 
     def complete_resource_import(
         self,
@@ -1616,14 +1800,15 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[CompleteResult]]:
-        return self.executor.submit(
+        return self.worker_pool.submit(
             complete_resource_import,
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_RESOURCE_IMPORT_TIME_OUT)
+            timeout=COMPLETE_RESOURCE_IMPORT_TIME_OUT,
+        )
 
     def complete_variables_import(
         self,
@@ -1631,14 +1816,15 @@ class ImportsManager:
         base_dir: str = ".",
         variables: Optional[Dict[str, Any]] = None,
     ) -> Optional[List[CompleteResult]]:
-        return self.executor.submit(
+        return self.worker_pool.submit(
             complete_variables_import,
             name,
             str(self.root_folder),
             base_dir,
             self.get_resolvable_command_line_variables(),
             variables,
-        ).result(COMPLETE_VARIABLES_IMPORT_TIME_OUT)
+            timeout=COMPLETE_VARIABLES_IMPORT_TIME_OUT,
+        )
 
     def resolve_variable(
         self,
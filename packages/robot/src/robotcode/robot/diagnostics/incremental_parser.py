@@ -0,0 +1,365 @@
+import ast
+import bisect
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, cast
+
+from robot.parsing.lexer.tokens import Token
+from robot.parsing.model.statements import Statement
+from robotcode.core.concurrent import RLock
+
+_SECTION_HEADERS = frozenset(Token.HEADER_TOKENS)
+
+# only inside of these sections a single test case or keyword can be lexed again
+_BLOCK_SECTION_HEADERS = frozenset(
+    t for t in (Token.TESTCASE_HEADER, getattr(Token, "TASK_HEADER", None), Token.KEYWORD_HEADER) if t is not None
+)
+
+_BLOCK_NAMES = frozenset((Token.TESTCASE_NAME, Token.KEYWORD_NAME))
+
+# these tokens change how the other parts of a file are lexed, so a file containing them is always lexed completely
+_CONTEXT_DEPENDENT = frozenset(t for t in (Token.TEST_TEMPLATE, getattr(Token, "CONFIG", None)) if t is not None)
+
+
+class _Unit(NamedTuple):
+    # a section header or the name of a test case or keyword, 0-based line and index of the first token in this line
+    line: int
+    token_index: int
+    type: str
+
+
+class _Splice(NamedTuple):
+    old_tokens: List[Token]
+    tokens: List[Token]
+    units: List[_Unit]
+    # 0-based lines, the range [start, old_end) of the old lines is replaced by [start, new_end) of the new lines
+    start: int
+    old_end: int
+    new_end: int
+    section_line: int
+    fragment: List[Token]
+    shifted: Dict[int, Token]
+
+    @property
+    def delta(self) -> int:
+        return self.new_end - self.old_end
+
+
+def _scan_units(tokens: List[Token]) -> Optional[List[_Unit]]:
+    result: List[_Unit] = []
+
+    line = -1
+    line_index = 0
+    for i, token in enumerate(tokens):
+        token_type = token.type
+        if token.lineno != line:
+            line = token.lineno
+            line_index = i
+
+        # continued headers and empty names, the indented first line after a header, are not the start of a block
+        if (token_type in _SECTION_HEADERS and token.value.startswith("*")) or (
+            token_type in _BLOCK_NAMES and token.value
+        ):
+            if not result or result[-1].line != line - 1:
+                result.append(_Unit(line - 1, line_index, token_type))
+        elif token_type in _CONTEXT_DEPENDENT:
+            return None
+
+    return result
+
+
+def _is_header_line(line: str) -> bool:
+    # also catches pipe separated files and some lines that are not a header, these are just lexed completely
+    return line.lstrip(" \t|").startswith("*")
+
+
+_TOKEN_SLOTS = tuple(Token.__slots__)
+
+
+def _shift_token(token: Token, delta: int) -> Token:
+    # much faster than copy.copy
+    result = Token.__new__(type(token))
+    for slot in _TOKEN_SLOTS:
+        setattr(result, slot, getattr(token, slot))
+    result.lineno += delta
+    return result
+
+
+def _copy_node(node: Any) -> Any:
+    # the nodes can't be copied with copy.copy, because the blocks requires arguments in __init__
+    node_type: Any = type(node)
+    result = node_type.__new__(node_type)
+    result.__dict__.update(node.__dict__)
+    return result
+
+
+def _shift_node(node: ast.AST, delta: int, shifted: Dict[int, Token]) -> ast.AST:
+    result = _copy_node(node)
+
+    if isinstance(node, Statement):
+        result.tokens = tuple(shifted.get(id(t)) or _shift_token(t, delta) for t in node.tokens)
+        return cast(ast.AST, result)
+
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            setattr(result, field, [_shift_node(v, delta, shifted) if isinstance(v, ast.AST) else v for v in value])
+        elif isinstance(value, ast.AST):
+            setattr(result, field, _shift_node(value, delta, shifted))
+
+    return cast(ast.AST, result)
+
+
+def _node_line(node: Any) -> int:
+    # blocks starts with their header, this avoids visiting the whole block
+    header = getattr(node, "header", None)
+    if isinstance(header, Statement):
+        return cast(int, header.lineno - 1)
+    return cast(int, node.lineno - 1)
+
+
+def _lines_equal(a: str, b: str) -> bool:
+    return a is b or a == b
+
+
+def _relex(
+    old_lines: List[str],
+    old_tokens: List[Token],
+    units: List[_Unit],
+    lines: List[str],
+    lex: Callable[[str], List[Token]],
+) -> Optional[_Splice]:
+    start = 0
+    limit = min(len(old_lines), len(lines))
+    while start < limit and _lines_equal(old_lines[start], lines[start]):
+        start += 1
+
+    old_end = len(old_lines)
+    new_end = len(lines)
+    while old_end > start and new_end > start and _lines_equal(old_lines[old_end - 1], lines[new_end - 1]):
+        old_end -= 1
+        new_end -= 1
+
+    if start == old_end == new_end:
+        return _Splice(old_tokens, old_tokens, units, start, old_end, new_end, -1, [], {})
+
+    if any(_is_header_line(line) for line in old_lines[start:old_end]) or any(
+        _is_header_line(line) for line in lines[start:new_end]
+    ):
+        return None
+
+    unit_lines = [u.line for u in units]
+
+    unit_index = bisect.bisect_right(unit_lines, start) - 1
+    if unit_index < 0:
+        return None
+
+    section_index = unit_index
+    while units[section_index].type not in _SECTION_HEADERS:
+        section_index -= 1
+
+    section = units[section_index]
+    if section.type == Token.SETTING_HEADER:
+        return None
+
+    if section.type not in _BLOCK_SECTION_HEADERS:
+        unit_index = section_index
+    elif unit_index > section_index and units[unit_index].line == start:
+        # the name itself is changed, maybe it now belongs to the previous test case or keyword
+        unit_index -= 1
+
+    unit = units[unit_index]
+
+    end_index = bisect.bisect_left(unit_lines, max(old_end, unit.line + 1), lo=unit_index + 1)
+    if section.type not in _BLOCK_SECTION_HEADERS:
+        while end_index < len(units) and units[end_index].type not in _SECTION_HEADERS:
+            end_index += 1
+
+    if end_index < len(units):
+        old_unit_end = units[end_index].line
+        old_token_end = units[end_index].token_index
+    else:
+        old_unit_end = len(old_lines)
+        old_token_end = len(old_tokens)
+    new_unit_end = old_unit_end + new_end - old_end
+
+    if new_unit_end < unit.line:
+        return None
+
+    prepend_header = unit_index != section_index
+
+    text = "".join(lines[unit.line : new_unit_end])
+    if prepend_header:
+        text = old_lines[section.line] + text
+
+    fragment = lex(text)
+
+    # the fragment always starts with the section header, followed by the name of a test case or keyword
+    fragment_units = _scan_units(fragment)
+    if (
+        not fragment_units
+        or fragment_units[0] != _Unit(0, 0, section.type)
+        or any(u.type in _SECTION_HEADERS for u in fragment_units[1:])
+    ):
+        return None
+
+    header_count = 0
+    if prepend_header:
+        fragment_units = fragment_units[1:]
+        if not fragment_units or fragment_units[0].line != 1 or fragment_units[0].type not in _BLOCK_NAMES:
+            return None
+
+        header_count = fragment_units[0].token_index
+        for token in fragment[:header_count]:
+            token.lineno += section.line
+
+    line_delta = unit.line - (1 if prepend_header else 0)
+    kept = fragment[header_count:]
+    for token in kept:
+        token.lineno += line_delta
+
+    delta = new_unit_end - old_unit_end
+    shifted: Dict[int, Token] = {}
+
+    suffix = old_tokens[old_token_end:]
+    if delta != 0:
+        suffix = [_shift_token(t, delta) for t in old_tokens[old_token_end:]]
+        shifted = {id(o): n for o, n in zip(old_tokens[old_token_end:], suffix)}
+
+    prefix_length = unit.token_index
+    suffix_offset = prefix_length + len(kept) - old_token_end
+
+    tokens = [*old_tokens[:prefix_length], *kept, *suffix]
+    new_units = [
+        *units[:unit_index],
+        *(_Unit(u.line + line_delta, u.token_index - header_count + prefix_length, u.type) for u in fragment_units),
+        *(_Unit(u.line + delta, u.token_index + suffix_offset, u.type) for u in units[end_index:]),
+    ]
+
+    return _Splice(
+        old_tokens,
+        tokens,
+        new_units,
+        unit.line,
+        old_unit_end,
+        new_unit_end,
+        section.line,
+        fragment,
+        shifted,
+    )
+
+
+def _reparse(old_model: Any, splice: _Splice, parse: Callable[[List[Token]], ast.AST]) -> Optional[ast.AST]:
+    if splice.tokens is splice.old_tokens:
+        return cast(ast.AST, old_model)
+
+    sections = getattr(old_model, "sections", None)
+    if sections is None:
+        return None
+
+    section_index = next(
+        (i for i, s in enumerate(sections) if s.header is not None and s.header.lineno - 1 == splice.section_line),
+        None,
+    )
+    if section_index is None:
+        return None
+
+    old_section = sections[section_index]
+
+    fragment_model: Any = parse(splice.fragment)
+    fragment_sections = getattr(fragment_model, "sections", None)
+    if not fragment_sections or len(fragment_sections) != 1 or type(fragment_sections[0]) is not type(old_section):
+        return None
+    fragment_section = fragment_sections[0]
+
+    delta = splice.delta
+
+    before: List[Any] = []
+    after: List[Any] = []
+    for node in old_section.body:
+        lineno = _node_line(node)
+        if lineno < splice.start:
+            before.append(node)
+        elif lineno >= splice.old_end:
+            after.append(node if delta == 0 else _shift_node(node, delta, splice.shifted))
+
+    if before and before[-1].end_lineno - 1 >= splice.start:
+        return None
+
+    section: Any
+    if splice.start == splice.section_line:
+        if before:
+            return None
+        section = _copy_node(fragment_section)
+    else:
+        section = _copy_node(old_section)
+
+    section.body = [*before, *fragment_section.body, *after]
+
+    result = _copy_node(old_model)
+    result.sections = [
+        *sections[:section_index],
+        section,
+        *(s if delta == 0 else _shift_node(s, delta, splice.shifted) for s in sections[section_index + 1 :]),
+    ]
+
+    return cast(ast.AST, result)
+
+
+# lexes and parses only the changed test cases, keywords or sections and reuses the rest of the previous version
+class IncrementalParser:
+    def __init__(self) -> None:
+        self._lock = RLock(default_timeout=120, name="IncrementalParser.lock")
+
+        self._lines: Optional[List[str]] = None
+        self._tokens: Optional[List[Token]] = None
+        self._units: Optional[List[_Unit]] = None
+        self._splice: Optional[_Splice] = None
+
+        self._model: Optional[ast.AST] = None
+        self._model_tokens: Optional[List[Token]] = None
+
+    def get_tokens(self, lines: List[str], lex: Callable[[str], List[Token]]) -> List[Token]:
+        with self._lock:
+            splice: Optional[_Splice] = None
+            if self._lines is not None and self._tokens is not None and self._units is not None:
+                splice = _relex(self._lines, self._tokens, self._units, lines, lex)
+
+            if splice is not None:
+                tokens: List[Token] = splice.tokens
+                units: Optional[List[_Unit]] = splice.units
+            else:
+                tokens = lex("".join(lines))
+                units = _scan_units(tokens)
+
+            self._lines = lines
+            self._tokens = tokens
+            self._units = units
+            self._splice = splice
+
+            return tokens
+
+    def get_model(self, tokens: List[Token], parse: Callable[[List[Token]], ast.AST]) -> ast.AST:
+        with self._lock:
+            model: Optional[ast.AST] = None
+            if self._model is not None:
+                if self._model_tokens is tokens:
+                    return self._model
+
+                splice = self._splice
+                if splice is not None and splice.tokens is tokens and splice.old_tokens is self._model_tokens:
+                    model = _reparse(self._model, splice, parse)
+
+            if model is None:
+                model = parse(tokens)
+
+            self._model = model
+            self._model_tokens = tokens
+
+            return model
+
+    @property
+    def last_change(self) -> Optional[Tuple[int, int, int]]:
+        # the last lexed range of lines as (start, old_end, new_end) or None if the whole file was lexed
+        splice = self._splice
+        if splice is None:
+            return None
+        return (splice.start, splice.old_end, splice.new_end)
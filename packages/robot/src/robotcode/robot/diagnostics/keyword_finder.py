@@ -1,7 +1,7 @@
 import functools
 import re
 from itertools import chain
-from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 from robot.libraries import STDLIBS
 from robotcode.core.lsp.types import (
@@ -9,7 +9,7 @@ from robotcode.core.lsp.types import (
 )
 
 from ..utils import get_robot_version
-from ..utils.match import eq_namespace
+from ..utils.match import eq_namespace, normalize, normalize_namespace
 from .entities import (
     LibraryEntry,
     ResourceEntry,
@@ -35,37 +35,122 @@ class CancelSearchError(Exception):
     pass
 
 
+class KeywordFindResult(NamedTuple):
+    keyword: Optional[KeywordDoc]
+    diagnostics: Tuple[DiagnosticsEntry, ...] = ()
+    multiple_keywords: Optional[Tuple[KeywordDoc, ...]] = None
+    bdd_prefix: Optional[str] = None
+
+
+class _SearchState:
+    def __init__(self) -> None:
+        self.diagnostics: List[DiagnosticsEntry] = []
+        self.multiple_keywords: Optional[List[KeywordDoc]] = None
+        self.bdd_prefix: Optional[str] = None
+
+    def add_multiple_keywords(self, kw: Iterable[KeywordDoc]) -> None:
+        if self.multiple_keywords is None:
+            self.multiple_keywords = list(kw)
+        else:
+            self.multiple_keywords.extend(kw)
+
+
+class _ImportedKeywordResult(NamedTuple):
+    keyword: Optional[KeywordDoc]
+    diagnostics: Tuple[DiagnosticsEntry, ...]
+    multiple_keywords: Optional[Tuple[KeywordDoc, ...]]
+    canceled: bool
+
+
 DEFAULT_BDD_PREFIXES = {"Given ", "When ", "Then ", "And ", "But "}
 
 
+class KeywordIndex:
+    def __init__(self, entries: Iterable[LibraryEntry]) -> None:
+        self.entries = list(entries)
+
+        self._by_name: Dict[str, List[Tuple[int, LibraryEntry, KeywordDoc]]] = {}
+        self._embedded: List[Tuple[int, LibraryEntry, KeywordDoc]] = []
+        self._by_owner: Dict[str, List[LibraryEntry]] = {}
+
+        position = 0
+        for entry in self.entries:
+            self._by_owner.setdefault(normalize_namespace(entry.alias or entry.name), []).append(entry)
+
+            for kw in entry.library_doc.keywords:
+                if kw.matcher.embedded_arguments is not None:
+                    self._embedded.append((position, entry, kw))
+                else:
+                    self._by_name.setdefault(kw.matcher.normalized_name, []).append((position, entry, kw))
+                position += 1
+
+    def iter_all(self, name: str) -> Iterator[Tuple[LibraryEntry, KeywordDoc]]:
+        candidates = self._by_name.get(normalize(name), [])
+
+        embedded = [e for e in self._embedded if e[2].matcher.match_string(name)]
+        if embedded:
+            candidates = sorted([*candidates, *embedded], key=lambda e: e[0])
+
+        return ((entry, kw) for _, entry, kw in candidates)
+
+    def iter_owners(self, owner_name: str) -> Iterator[LibraryEntry]:
+        return iter(self._by_owner.get(normalize_namespace(owner_name), []))
+
+
+class NamespaceKeywordIndex(NamedTuple):
+    resources: KeywordIndex
+    libraries: KeywordIndex
+    fingerprint: Tuple[Any, ...]
+
+    @classmethod
+    def create(cls, namespace: "Namespace") -> "NamespaceKeywordIndex":
+        resources = KeywordIndex(namespace._resources.values())
+        libraries = KeywordIndex(namespace._libraries.values())
+
+        return cls(
+            resources,
+            libraries,
+            (
+                tuple((e.name, e.alias, id(e.library_doc)) for e in resources.entries),
+                tuple((e.name, e.alias, id(e.library_doc)) for e in libraries.entries),
+                namespace.search_order,
+                # keywords from the own file are preferred, see `KeywordFinder._prioritize_same_file_or_public`
+                namespace.source if any(e.library_doc.source == namespace.source for e in resources.entries) else None,
+            ),
+        )
+
+
+class KeywordLookupCache:
+    """Results of keyword lookups in the imported libraries and resources.
+
+    Shared by all namespaces with the same imports, see `ImportsManager.get_keyword_lookup_cache`.
+    """
+
+    def __init__(self, index: NamespaceKeywordIndex) -> None:
+        # the fingerprint contains the ids of the library docs, so keep them alive as long as the cache exists
+        self._entries = (*index.resources.entries, *index.libraries.entries)
+        self._results: Dict[str, _ImportedKeywordResult] = {}
+
+    def get(self, name: str) -> Optional[_ImportedKeywordResult]:
+        return self._results.get(name, None)
+
+    def set(self, name: str, result: _ImportedKeywordResult) -> None:
+        self._results[name] = result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
 class KeywordFinder:
     def __init__(self, namespace: "Namespace") -> None:
         self._namespace = namespace
 
-        self.diagnostics: List[DiagnosticsEntry] = []
-        self.result_bdd_prefix: Optional[str] = None
-
-        self.multiple_keywords_result: Optional[List[KeywordDoc]] = None
-        self._cache: Dict[
-            Tuple[Optional[str], bool],
-            Tuple[
-                Optional[KeywordDoc],
-                List[DiagnosticsEntry],
-                Optional[List[KeywordDoc]],
-                Optional[str],
-            ],
-        ] = {}
+        self._cache: Dict[Tuple[Optional[str], bool], KeywordFindResult] = {}
 
     @functools.cached_property
     def _library_doc(self) -> LibraryDoc:
         return self._namespace.get_library_doc()
 
-    def reset_diagnostics(self) -> None:
-        self.diagnostics = []
-        self.multiple_keywords_result = None
-        self.result_bdd_prefix = None
-
-    # TODO: make this threadsafe
     def find_keyword(
         self,
         name: Optional[str],
@@ -73,71 +158,79 @@ class KeywordFinder:
         raise_keyword_error: bool = False,
         handle_bdd_style: bool = True,
     ) -> Optional[KeywordDoc]:
-        try:
-            self.reset_diagnostics()
-
-            cached = self._cache.get((name, handle_bdd_style), None)
-
-            if cached is not None:
-                self.diagnostics = cached[1]
-                self.multiple_keywords_result = cached[2]
-                self.result_bdd_prefix = cached[3]
-                return cached[0]
+        return self.find_keyword_result(
+            name, raise_keyword_error=raise_keyword_error, handle_bdd_style=handle_bdd_style
+        ).keyword
 
-            try:
-                result = self._find_keyword(name, handle_bdd_style)
-                if result is None:
-                    error_message = "No keyword with found."
-
-                    if name and name.strip(": ").upper() == "FOR":
-                        error_message = (
-                            f"Support for the old FOR loop syntax has been removed. "
-                            f"Replace '{name}' with 'FOR', end the loop with 'END', and "
-                            f"remove escaping backslashes."
-                        )
-                    elif name and name == "\\":
-                        error_message = (
-                            "No keyword with name '\\' found. If it is used inside a for "
-                            "loop, remove escaping backslashes and end the loop with 'END'."
-                        )
-                    else:
-                        error_message = f"No keyword with name '{name}' found."
+    def find_keyword_result(
+        self,
+        name: Optional[str],
+        *,
+        raise_keyword_error: bool = False,
+        handle_bdd_style: bool = True,
+    ) -> KeywordFindResult:
+        cached = self._cache.get((name, handle_bdd_style), None)
+        if cached is not None:
+            return cached
 
-                    self.diagnostics.append(
-                        DiagnosticsEntry(
-                            error_message,
-                            DiagnosticSeverity.ERROR,
-                            Error.KEYWORD_NOT_FOUND,
-                        )
+        state = _SearchState()
+        result: Optional[KeywordDoc] = None
+        try:
+            result = self._find_keyword(state, name, handle_bdd_style)
+            if result is None:
+                error_message = "No keyword with found."
+
+                if name and name.strip(": ").upper() == "FOR":
+                    error_message = (
+                        f"Support for the old FOR loop syntax has been removed. "
+                        f"Replace '{name}' with 'FOR', end the loop with 'END', and "
+                        f"remove escaping backslashes."
+                    )
+                elif name and name == "\\":
+                    error_message = (
+                        "No keyword with name '\\' found. If it is used inside a for "
+                        "loop, remove escaping backslashes and end the loop with 'END'."
+                    )
+                else:
+                    error_message = f"No keyword with name '{name}' found."
+
+                state.diagnostics.append(
+                    DiagnosticsEntry(
+                        error_message,
+                        DiagnosticSeverity.ERROR,
+                        Error.KEYWORD_NOT_FOUND,
                     )
-            except KeywordError as e:
-                if e.multiple_keywords:
-                    self._add_to_multiple_keywords_result(e.multiple_keywords)
+                )
+        except KeywordError as e:
+            if e.multiple_keywords:
+                state.add_multiple_keywords(e.multiple_keywords)
 
-                if raise_keyword_error:
-                    raise
+            if raise_keyword_error:
+                raise
 
-                result = None
-                self.diagnostics.append(DiagnosticsEntry(str(e), DiagnosticSeverity.ERROR, Error.KEYWORD_ERROR))
+            result = None
+            state.diagnostics.append(DiagnosticsEntry(str(e), DiagnosticSeverity.ERROR, Error.KEYWORD_ERROR))
+        except CancelSearchError:
+            result = None
 
-            self._cache[(name, handle_bdd_style)] = (
-                result,
-                self.diagnostics,
-                self.multiple_keywords_result,
-                self.result_bdd_prefix,
-            )
+        find_result = KeywordFindResult(
+            result,
+            tuple(state.diagnostics),
+            tuple(state.multiple_keywords) if state.multiple_keywords is not None else None,
+            state.bdd_prefix,
+        )
+        self._cache[(name, handle_bdd_style)] = find_result
 
-            return result
-        except CancelSearchError:
-            return None
+        return find_result
 
     def _find_keyword(
         self,
+        state: _SearchState,
         name: Optional[str],
         handle_bdd_style: bool = True,
     ) -> Optional[KeywordDoc]:
         if not name:
-            self.diagnostics.append(
+            state.diagnostics.append(
                 DiagnosticsEntry(
                     "Keyword name cannot be empty.",
                     DiagnosticSeverity.ERROR,
@@ -146,7 +239,7 @@ class KeywordFinder:
             )
             raise CancelSearchError
         if not isinstance(name, str):
-            self.diagnostics.append(  # type: ignore
+            state.diagnostics.append(  # type: ignore
                 DiagnosticsEntry(
                     "Keyword name must be a string.",
                     DiagnosticSeverity.ERROR,
@@ -158,23 +251,56 @@ class KeywordFinder:
         result: Optional[KeywordDoc] = None
 
         if get_robot_version() >= (7, 0) and handle_bdd_style:
-            result = self._get_bdd_style_keyword(name)
+            result = self._get_bdd_style_keyword(state, name)
 
         if not result:
-            result = self._get_keyword_from_self(name)
-
-        if not result and "." in name:
-            result = self._get_explicit_keyword(name)
+            result = self._get_keyword_from_self(state, name)
 
         if not result:
-            result = self._get_implicit_keyword(name)
+            result = self._get_imported_keyword(state, name)
 
         if get_robot_version() < (7, 0) and not result and handle_bdd_style:
-            return self._get_bdd_style_keyword(name)
+            return self._get_bdd_style_keyword(state, name)
 
         return result
 
-    def _get_keyword_from_self(self, name: str) -> Optional[KeywordDoc]:
+    @functools.cached_property
+    def _lookup_cache(self) -> KeywordLookupCache:
+        return self._namespace.imports_manager.get_keyword_lookup_cache(self._keyword_index)
+
+    def _get_imported_keyword(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
+        cached = self._lookup_cache.get(name)
+
+        if cached is None:
+            imported_state = _SearchState()
+            result: Optional[KeywordDoc] = None
+            canceled = False
+            try:
+                if "." in name:
+                    result = self._get_explicit_keyword(imported_state, name)
+
+                if not result:
+                    result = self._get_implicit_keyword(imported_state, name)
+            except CancelSearchError:
+                canceled = True
+
+            cached = _ImportedKeywordResult(
+                result,
+                tuple(imported_state.diagnostics),
+                tuple(imported_state.multiple_keywords) if imported_state.multiple_keywords is not None else None,
+                canceled,
+            )
+            self._lookup_cache.set(name, cached)
+
+        state.diagnostics.extend(cached.diagnostics)
+        if cached.multiple_keywords is not None:
+            state.add_multiple_keywords(cached.multiple_keywords)
+        if cached.canceled:
+            raise CancelSearchError
+
+        return cached.keyword
+
+    def _get_keyword_from_self(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
         if get_robot_version() >= (6, 0):
             found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = [
                 (None, v) for v in self._library_doc.keywords.iter_all(name)
@@ -182,9 +308,9 @@ class KeywordFinder:
             if len(found) > 1:
                 found = self._select_best_matches(found)
                 if len(found) > 1:
-                    self.diagnostics.append(
+                    state.diagnostics.append(
                         DiagnosticsEntry(
-                            self._create_multiple_keywords_found_message(name, found, implicit=False),
+                            self._create_multiple_keywords_found_message(state, name, found, implicit=False),
                             DiagnosticSeverity.ERROR,
                             Error.MULTIPLE_KEYWORDS,
                         )
@@ -200,7 +326,7 @@ class KeywordFinder:
         try:
             return self._library_doc.keywords.get(name, None)
         except KeywordError as e:
-            self.diagnostics.append(DiagnosticsEntry(str(e), DiagnosticSeverity.ERROR, Error.KEYWORD_ERROR))
+            state.diagnostics.append(DiagnosticsEntry(str(e), DiagnosticSeverity.ERROR, Error.KEYWORD_ERROR))
             raise CancelSearchError from e
 
     def _yield_owner_and_kw_names(self, full_name: str) -> Iterator[Tuple[str, ...]]:
@@ -208,7 +334,7 @@ class KeywordFinder:
         for i in range(1, len(tokens)):
             yield ".".join(tokens[:i]), ".".join(tokens[i:])
 
-    def _get_explicit_keyword(self, name: str) -> Optional[KeywordDoc]:
+    def _get_explicit_keyword(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
         found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = []
         for owner_name, kw_name in self._yield_owner_and_kw_names(name):
             found.extend(self.find_keywords(owner_name, kw_name))
@@ -217,9 +343,9 @@ class KeywordFinder:
             found = self._select_best_matches(found)
 
         if len(found) > 1:
-            self.diagnostics.append(
+            state.diagnostics.append(
                 DiagnosticsEntry(
-                    self._create_multiple_keywords_found_message(name, found, implicit=False),
+                    self._create_multiple_keywords_found_message(state, name, found, implicit=False),
                     DiagnosticSeverity.ERROR,
                     Error.MULTIPLE_KEYWORDS,
                 )
@@ -237,11 +363,15 @@ class KeywordFinder:
             )
         )
 
+    @functools.cached_property
+    def _keyword_index(self) -> NamespaceKeywordIndex:
+        return self._namespace.get_keyword_index()
+
     def find_keywords(self, owner_name: str, name: str) -> List[Tuple[LibraryEntry, KeywordDoc]]:
         if get_robot_version() >= (6, 0):
             result: List[Tuple[LibraryEntry, KeywordDoc]] = []
-            for v in self._all_keywords:
-                if eq_namespace(v.alias or v.name, owner_name):
+            for index in (self._keyword_index.libraries, self._keyword_index.resources):
+                for v in index.iter_owners(owner_name):
                     result.extend((v, kw) for kw in v.library_doc.keywords.iter_all(name))
             return result
 
@@ -253,19 +383,14 @@ class KeywordFinder:
                     result.append((v, kw))
         return result
 
-    def _add_to_multiple_keywords_result(self, kw: Iterable[KeywordDoc]) -> None:
-        if self.multiple_keywords_result is None:
-            self.multiple_keywords_result = list(kw)
-        else:
-            self.multiple_keywords_result.extend(kw)
-
     def _create_multiple_keywords_found_message(
         self,
+        state: _SearchState,
         name: str,
         found: Sequence[Tuple[Optional[LibraryEntry], KeywordDoc]],
         implicit: bool = True,
     ) -> str:
-        self._add_to_multiple_keywords_result([k for _, k in found])
+        state.add_multiple_keywords([k for _, k in found])
 
         if any(e[1].is_embedded for e in found):
             error = f"Multiple keywords matching name '{name}' found"
@@ -278,10 +403,10 @@ class KeywordFinder:
         names = sorted(f"{e[1].name if e[0] is None else f'{e[0].alias or e[0].name}.{e[1].name}'}" for e in found)
         return "\n    ".join([f"{error}:", *names])
 
-    def _get_implicit_keyword(self, name: str) -> Optional[KeywordDoc]:
-        result = self._get_keyword_from_resource_files(name)
+    def _get_implicit_keyword(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
+        result = self._get_keyword_from_resource_files(state, name)
         if not result:
-            return self._get_keyword_from_libraries(name)
+            return self._get_keyword_from_libraries(state, name)
         return result
 
     def _prioritize_same_file_or_public(
@@ -353,11 +478,9 @@ class KeywordFinder:
     def _resource_imports(self) -> List[ResourceEntry]:
         return list(chain(self._namespace._resources.values()))
 
-    def _get_keyword_from_resource_files(self, name: str) -> Optional[KeywordDoc]:
+    def _get_keyword_from_resource_files(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
         if get_robot_version() >= (6, 0):
-            found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = [
-                (v, k) for v in self._resource_imports for k in v.library_doc.keywords.iter_all(name)
-            ]
+            found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = list(self._keyword_index.resources.iter_all(name))
         else:
             found = []
             for k in self._resource_imports:
@@ -385,9 +508,9 @@ class KeywordFinder:
         if len(found) == 1:
             return found[0][1]
 
-        self.diagnostics.append(
+        state.diagnostics.append(
             DiagnosticsEntry(
-                self._create_multiple_keywords_found_message(name, found),
+                self._create_multiple_keywords_found_message(state, name, found),
                 DiagnosticSeverity.ERROR,
                 Error.MULTIPLE_KEYWORDS,
             )
@@ -408,11 +531,9 @@ class KeywordFinder:
     def _library_imports(self) -> List[LibraryEntry]:
         return list(chain(self._namespace._libraries.values()))
 
-    def _get_keyword_from_libraries(self, name: str) -> Optional[KeywordDoc]:
+    def _get_keyword_from_libraries(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
         if get_robot_version() >= (6, 0):
-            found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = [
-                (v, k) for v in self._library_imports for k in v.library_doc.keywords.iter_all(name)
-            ]
+            found: List[Tuple[Optional[LibraryEntry], KeywordDoc]] = list(self._keyword_index.libraries.iter_all(name))
 
         else:
             found = []
@@ -434,14 +555,14 @@ class KeywordFinder:
             if len(found) > 1:
                 found = self._get_keyword_based_on_search_order(found)
             if len(found) == 2:
-                found = self._filter_stdlib_runner(*found)
+                found = self._filter_stdlib_runner(state, *found)
 
         if len(found) == 1:
             return found[0][1]
 
-        self.diagnostics.append(
+        state.diagnostics.append(
             DiagnosticsEntry(
-                self._create_multiple_keywords_found_message(name, found),
+                self._create_multiple_keywords_found_message(state, name, found),
                 DiagnosticSeverity.ERROR,
                 Error.MULTIPLE_KEYWORDS,
             )
@@ -450,6 +571,7 @@ class KeywordFinder:
 
     def _filter_stdlib_runner(
         self,
+        state: _SearchState,
         entry1: Tuple[Optional[LibraryEntry], KeywordDoc],
         entry2: Tuple[Optional[LibraryEntry], KeywordDoc],
     ) -> List[Tuple[Optional[LibraryEntry], KeywordDoc]]:
@@ -461,7 +583,7 @@ class KeywordFinder:
         else:
             return [entry1, entry2]
 
-        self.diagnostics.append(
+        state.diagnostics.append(
             DiagnosticsEntry(
                 self._create_custom_and_standard_keyword_conflict_warning_message(custom, standard),
                 DiagnosticSeverity.WARNING,
@@ -504,14 +626,14 @@ class KeywordFinder:
         )
         return re.compile(rf"({prefixes})\s", re.IGNORECASE)
 
-    def _get_bdd_style_keyword(self, name: str) -> Optional[KeywordDoc]:
+    def _get_bdd_style_keyword(self, state: _SearchState, name: str) -> Optional[KeywordDoc]:
         match = self.bdd_prefix_regexp.match(name)
         if match:
             result = self._find_keyword(
-                name[match.end() :], handle_bdd_style=False if get_robot_version() >= (7, 0) else True
+                state, name[match.end() :], handle_bdd_style=False if get_robot_version() >= (7, 0) else True
             )
             if result:
-                self.result_bdd_prefix = str(match.group(0))
+                state.bdd_prefix = str(match.group(0))
 
             return result
         return None
@@ -922,14 +922,61 @@ class KeywordError(Exception):
         self.multiple_keywords = multiple_keywords
 
 
+class _KeywordStoreIndex:
+    def __init__(self, keywords: List[KeywordDoc]) -> None:
+        self.keywords = keywords
+        self.count = len(keywords)
+        self.by_name: Dict[str, List[int]] = {}
+        self.embedded: List[int] = []
+
+        for i, kw in enumerate(keywords):
+            if kw.matcher.embedded_arguments is not None:
+                self.embedded.append(i)
+            else:
+                self.by_name.setdefault(kw.matcher.normalized_name, []).append(i)
+
+    def is_valid_for(self, keywords: List[KeywordDoc]) -> bool:
+        return self.keywords is keywords and self.count == len(keywords)
+
+
 @dataclass
 class KeywordStore:
     source: Optional[str] = None
     source_type: Optional[str] = None
     keywords: List[KeywordDoc] = field(default_factory=list)
 
+    def _get_index(self) -> _KeywordStoreIndex:
+        # the index is not a dataclass field, so it is ignored by json but kept by pickle
+        index: Optional[_KeywordStoreIndex] = self.__dict__.get("_index", None)
+        if index is None or not index.is_valid_for(self.keywords):
+            index = _KeywordStoreIndex(self.keywords)
+            self.__dict__["_index"] = index
+
+        return index
+
+    def _find_positions(self, key: object) -> List[int]:
+        index = self._get_index()
+
+        if type(key) is KeywordMatcher:
+            if key._is_namespace:
+                return []
+
+            name = key.normalized_name
+            embedded = [i for i in index.embedded if self.keywords[i].matcher.normalized_name == name]
+        elif type(key) is str:
+            name = normalize(key)
+            embedded = [i for i in index.embedded if self.keywords[i].matcher.match_string(key)]
+        else:
+            return []
+
+        result = index.by_name.get(name, [])
+        if embedded:
+            return sorted([*result, *embedded])
+
+        return result
+
     def __getitem__(self, key: str) -> KeywordDoc:
-        items = [v for v in self.keywords if v.matcher == key]
+        items = [self.keywords[i] for i in self._find_positions(key)]
 
         if not items:
             raise KeyError
@@ -956,7 +1003,7 @@ class KeywordStore:
         )
 
     def __contains__(self, _x: object) -> bool:
-        return any(v.matcher == _x for v in self.keywords)
+        return bool(self._find_positions(_x))
 
     def __len__(self) -> int:
         return len(self.keywords)
@@ -986,7 +1033,7 @@ class KeywordStore:
         return list(self.iter_all(key))
 
     def iter_all(self, key: str) -> Iterable[KeywordDoc]:
-        return (v for v in self.keywords if v.matcher.match_string(key))
+        return (self.keywords[i] for i in self._find_positions(key))
 
 
 @dataclass
@@ -0,0 +1,114 @@
+import os
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from robotcode.core.concurrent import RLock
+from robotcode.core.utils.path import normalized_path, path_is_relative_to
+
+
+def _find_distribution_record(location: Path) -> Optional[Path]:
+    # a package or module installed from a distribution has a *.dist-info folder next to it, its RECORD lists all files
+    name = location.name
+    top_level_name = location.stem if location.suffix == ".py" else name
+
+    try:
+        dist_infos = [e.path for e in os.scandir(location.parent) if e.name.endswith(".dist-info") and e.is_dir()]
+    except OSError:
+        return None
+
+    for dist_info in dist_infos:
+        record = Path(dist_info, "RECORD")
+        top_level = Path(dist_info, "top_level.txt")
+        try:
+            if top_level.exists():
+                if top_level_name in top_level.read_text("utf-8").split() and record.exists():
+                    return record
+                continue
+
+            with record.open(encoding="utf-8") as f:
+                if any(line.startswith((name + "/", name + ",")) for line in f):
+                    return record
+        except OSError:
+            continue
+
+    return None
+
+
+def _iter_python_files(location: str) -> Iterable["os.DirEntry[str]"]:
+    try:
+        entries = list(os.scandir(location))
+    except OSError:
+        return
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_python_files(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry
+
+
+def get_distribution_key(origin: str) -> Optional[str]:
+    # identifies the installed distribution that contains the given file, None if it is not installed
+    path = normalized_path(Path(origin))
+
+    for location in (path, *path.parents):
+        if location.parent == location:
+            break
+
+        record = _find_distribution_record(location)
+        if record is not None:
+            dist_info = record.parent
+            return "/".join(
+                (
+                    dist_info.name[: -len(".dist-info")],
+                    f"{zlib.adler32(record.read_bytes()):08x}",
+                    f"{zlib.adler32(str(dist_info.parent).encode('utf-8')):08x}",
+                )
+            )
+
+    return None
+
+
+def get_location_fingerprints(location: str) -> Dict[str, int]:
+    record = _find_distribution_record(Path(location))
+    if record is not None:
+        # the RECORD of a distribution changes with every reinstall, so the files itself needs not to be checked
+        return {str(record): zlib.adler32(record.read_bytes())}
+
+    return {e.path: e.stat(follow_symlinks=False).st_mtime_ns for e in _iter_python_files(location)}
+
+
+class LibraryFingerprints:
+    # remembers the fingerprints of the package folders of libraries until a file in a folder is changed
+    def __init__(self) -> None:
+        self._lock = RLock(default_timeout=120, name="LibraryFingerprints.lock")
+        self._locations: Dict[str, Dict[str, int]] = {}
+
+    def get(self, location: str) -> Dict[str, int]:
+        with self._lock:
+            result = self._locations.get(location, None)
+            if result is not None:
+                return result
+
+        result = get_location_fingerprints(location)
+
+        with self._lock:
+            self._locations[location] = result
+
+        return result
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        paths = [normalized_path(p) for p in paths]
+        if not paths:
+            return
+
+        with self._lock:
+            for location in list(self._locations.keys()):
+                location_path = normalized_path(Path(location))
+                if any(path_is_relative_to(p, location_path) for p in paths):
+                    del self._locations[location]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._locations.clear()
@@ -211,11 +211,12 @@ class ModelHelper:
         analyse_run_keywords: bool = True,
     ) -> Optional[Tuple[Optional[KeywordDoc], Token]]:
         finder = namespace.get_finder()
-        keyword_doc = finder.find_keyword(keyword_name, raise_keyword_error=False)
+        find_result = finder.find_keyword_result(keyword_name, raise_keyword_error=False)
+        keyword_doc = find_result.keyword
         if keyword_doc is None:
             return None
 
-        if finder.result_bdd_prefix:
+        if find_result.bdd_prefix:
             keyword_token = ModelHelper.strip_bdd_prefix(namespace, keyword_token)
 
         if position.is_in_range(range_from_token(keyword_token)):
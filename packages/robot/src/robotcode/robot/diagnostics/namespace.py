@@ -1,9 +1,11 @@
 import ast
 import enum
 import itertools
+import logging
+import threading
 import weakref
 from collections import OrderedDict, defaultdict
-from concurrent.futures import CancelledError
+from concurrent.futures import CancelledError, wait
 from pathlib import Path
 from typing import (
     Any,
@@ -19,7 +21,7 @@ from typing import (
     cast,
 )
 
-from robot.errors import VariableError
+from robot.errors import DataError, VariableError
 from robot.parsing.lexer.tokens import Token
 from robot.parsing.model.blocks import Keyword, SettingSection, TestCase, VariableSection
 from robot.parsing.model.statements import Arguments, Setup, Statement, Timeout
@@ -28,7 +30,7 @@ from robot.parsing.model.statements import ResourceImport as RobotResourceImport
 from robot.parsing.model.statements import (
     VariablesImport as RobotVariablesImport,
 )
-from robotcode.core.concurrent import RLock
+from robotcode.core.concurrent import RLock, run_as_task
 from robotcode.core.event import event
 from robotcode.core.lsp.types import (
     CodeDescription,
@@ -59,6 +61,7 @@ from ..utils.variables import (
     BUILTIN_VARIABLES,
     InvalidVariableError,
     VariableMatcher,
+    contains_variable,
     is_scalar_assign,
     search_variable,
 )
@@ -83,7 +86,7 @@ from .entities import (
 )
 from .errors import DIAGNOSTICS_SOURCE_NAME, Error
 from .imports_manager import ImportsManager
-from .keyword_finder import KeywordFinder
+from .keyword_finder import KeywordFinder, NamespaceKeywordIndex
 from .library_doc import (
     BUILTIN_LIBRARY_NAME,
     DEFAULT_LIBRARIES,
@@ -92,7 +95,7 @@ from .library_doc import (
     LibraryDoc,
     resolve_robot_variables,
 )
-from .namespace_analyzer import NamespaceAnalyzer
+from .namespace_analyzer import AnalyzerBlockCache, NamespaceAnalyzer
 
 if get_robot_version() >= (7, 0):
     from robot.parsing.model.statements import Var
@@ -693,6 +696,28 @@ class DocumentType(enum.Enum):
     INIT = "init"
 
 
+def could_resolve_import(names: Iterable[str], path: Path) -> bool:
+    # checks if one of the names of imports that could not be resolved may resolve to the given file now
+    path_names = {path.name.casefold(), path.stem.casefold()}
+    if path.stem == "__init__":
+        path_names.add(path.parent.name.casefold())
+
+    for name in names:
+        base_name = name.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+        if contains_variable(base_name, "$@&%"):
+            return True
+
+        # a library can be imported by file name, by module name or by the name of a package folder
+        if {
+            base_name.casefold(),
+            base_name.rsplit(".", 1)[0].casefold(),
+            base_name.rsplit(".", 1)[-1].casefold(),
+        } & path_names:
+            return True
+
+    return False
+
+
 class Namespace:
     _logger = LoggingDescriptor()
 
@@ -758,6 +783,9 @@ class Namespace:
         self._suite_variables_lock = RLock(default_timeout=120, name="Namespace.global_variables")
 
         self._diagnostics: List[Diagnostic] = []
+        self._import_diagnostics_count = 0
+        # names of the imports that could not be resolved, a new file can only change the result of these
+        self._unresolved_imports: Set[str] = set()
         self._keyword_references: Dict[KeywordDoc, Set[Location]] = {}
         self._variable_references: Dict[VariableDefinition, Set[Location]] = {}
         self._local_variable_assignments: Dict[VariableDefinition, Set[Range]] = {}
@@ -775,11 +803,11 @@ class Namespace:
         self._search_order: Optional[Tuple[str, ...]] = None
 
         self._finder: Optional[KeywordFinder] = None
+        self._keyword_index: Optional[NamespaceKeywordIndex] = None
+        self._keyword_index_lock = RLock(default_timeout=120, name="Namespace.keyword_index")
 
         self.imports_manager.imports_changed.add(self._on_imports_changed)
         self.imports_manager.libraries_changed.add(self._on_libraries_changed)
-        self.imports_manager.resources_changed.add(self._on_resources_changed)
-        self.imports_manager.variables_changed.add(self._on_variables_changed)
 
         self._in_initialize = False
 
@@ -808,48 +836,28 @@ class Namespace:
         return self._search_order
 
     def _on_imports_changed(self, sender: Any, uri: DocumentUri) -> None:
-        # TODO: optimise this by checking our imports
-        self.invalidate()
-
-    @_logger.call
-    def _on_libraries_changed(self, sender: Any, libraries: List[LibraryDoc]) -> None:
+        # changed files are handled by the import graph, a created file is only of interest if an import
+        # of this namespace could not be resolved before and may resolve to it now
         if not self.initialized or self.invalid:
             return
 
-        invalidate = False
-
-        for p in libraries:
-            if any(e for e in self._libraries.values() if e.library_doc == p):
-                invalidate = True
-                break
-
-        if invalidate:
+        if self._could_resolve_unresolved_import(Uri(uri).to_path()):
             self.invalidate()
 
-    @_logger.call
-    def _on_resources_changed(self, sender: Any, resources: List[LibraryDoc]) -> None:
-        if not self.initialized or self.invalid:
-            return
-
-        invalidate = False
-
-        for p in resources:
-            if any(e for e in self._resources.values() if e.library_doc.source == p.source):
-                invalidate = True
-                break
-
-        if invalidate:
-            self.invalidate()
+    def _could_resolve_unresolved_import(self, path: Path) -> bool:
+        return could_resolve_import(self._unresolved_imports, path)
 
     @_logger.call
-    def _on_variables_changed(self, sender: Any, variables: List[LibraryDoc]) -> None:
+    def _on_libraries_changed(self, sender: Any, libraries: List[LibraryDoc]) -> None:
+        # changes of files in the import graph invalidates the importers directly in the imports manager,
+        # only libraries that could not be found have no file and must be checked here
         if not self.initialized or self.invalid:
             return
 
         invalidate = False
 
-        for p in variables:
-            if any(e for e in self._variables_imports.values() if e.library_doc.source == p.source):
+        for p in libraries:
+            if p.source_or_origin is None and any(e for e in self._libraries.values() if e.library_doc == p):
                 invalidate = True
                 break
 
@@ -862,10 +870,9 @@ class Namespace:
 
     def _invalidate(self) -> None:
         self._invalid = True
+        self._keyword_index = None
         self.imports_manager.imports_changed.remove(self._on_imports_changed)
         self.imports_manager.libraries_changed.remove(self._on_libraries_changed)
-        self.imports_manager.resources_changed.remove(self._on_resources_changed)
-        self.imports_manager.variables_changed.remove(self._on_variables_changed)
 
     @_logger.call
     def invalidate(self) -> bool:
@@ -885,6 +892,13 @@ class Namespace:
 
         return self._diagnostics
 
+    @_logger.call
+    def get_import_diagnostics(self) -> List[Diagnostic]:
+        # the diagnostics of loading the imports, without analyzing the document
+        self.ensure_initialized()
+
+        return self._diagnostics[: self._import_diagnostics_count]
+
     @_logger.call
     def get_keyword_references(self) -> Dict[KeywordDoc, Set[Location]]:
         self.ensure_initialized()
@@ -907,6 +921,13 @@ class Namespace:
 
         return self._test_case_definitions
 
+    def get_tag_definitions(self) -> List[TagDefinition]:
+        self.ensure_initialized()
+
+        self.analyze()
+
+        return self._tag_definitions
+
     def get_local_variable_assignments(self) -> Dict[VariableDefinition, Set[Range]]:
         self.ensure_initialized()
 
@@ -962,6 +983,38 @@ class Namespace:
 
             return self._library_doc
 
+    def get_analysis_fingerprint(self) -> Tuple[Any, ...]:
+        # everything outside of the model that changes the analysis of a test case or keyword
+        self.ensure_initialized()
+
+        entries = [*self._libraries.values(), *self._resources.values(), *self._variables_imports.values()]
+
+        return (
+            # compare the identity of the docs first, they are only recreated if a library or resource is changed
+            tuple(id(e.library_doc) for e in entries),
+            tuple(entries),
+            tuple(self.get_imported_variables()),
+            tuple(self.get_command_line_variables()),
+            tuple(type(lang) for lang in self.languages) if self.languages is not None else None,
+            # the own keywords without their line numbers, the analyzer moves the cached results with the blocks
+            tuple(
+                (
+                    kw.name,
+                    kw.col_offset,
+                    kw.end_col_offset,
+                    str(kw),
+                    kw.doc,
+                    tuple(kw.tags),
+                    kw.is_error_handler,
+                    kw.error_handler_message,
+                    kw.deprecated,
+                    kw.return_type,
+                )
+                for kw in self.get_library_doc().keywords.keywords
+            ),
+            tuple(e.library_doc for e in entries),
+        )
+
     class DataEntry(NamedTuple):
         libraries: Dict[str, LibraryEntry] = OrderedDict()
         resources: Dict[str, ResourceEntry] = OrderedDict()
@@ -993,7 +1046,10 @@ class Namespace:
 
                         self._reset_global_variables()
 
+                        self._import_diagnostics_count = len(self._diagnostics)
                         self._initialized = True
+
+                        self.imports_manager.update_namespace_imports(self, self.get_imported_sources())
                         succeed = True
 
                     except BaseException:
@@ -1009,10 +1065,25 @@ class Namespace:
 
         return self._initialized
 
+    def get_imported_sources(self) -> Dict[str, Set[str]]:
+        # the files imported by this file and by the resources it imports, the default libraries has no import
+        result: Dict[str, Set[str]] = {self.source: set()}
+
+        for entry in itertools.chain(self._import_entries.values(), self._libraries.values()):
+            source = entry.library_doc.source_or_origin
+            if source is not None:
+                result.setdefault(entry.import_source or self.source, set()).add(source)
+
+        return result
+
     @property
     def initialized(self) -> bool:
         return self._initialized
 
+    @property
+    def unresolved_imports(self) -> Set[str]:
+        return self._unresolved_imports
+
     @property
     def invalid(self) -> bool:
         return self._invalid
@@ -1407,6 +1478,9 @@ class Namespace:
             else:
                 raise DiagnosticsError("Unknown import type.")
 
+            if result is not None and result.library_doc.source_or_origin is None and value.name is not None:
+                self._unresolved_imports.add(value.name)
+
             if top_level and result is not None:
                 if result.library_doc.source is not None and result.library_doc.errors:
                     if any(err.source and Path(err.source).is_absolute() for err in result.library_doc.errors):
@@ -1475,6 +1549,9 @@ class Namespace:
         except (SystemExit, KeyboardInterrupt):
             raise
         except BaseException as e:
+            if value.name is not None:
+                self._unresolved_imports.add(value.name)
+
             if top_level:
                 self.append_diagnostics(
                     range=value.range,
@@ -1521,6 +1598,10 @@ class Namespace:
             lambda: f"loading imports for {self.source if top_level else source}",
             context_name="import",
         ):
+            imports = list(imports)
+
+            self._prefetch_imports(imports, base_dir, variables)
+
             for imp in imports:
                 if variables is None:
                     variables = self.get_suite_variables()
@@ -1718,6 +1799,99 @@ class Namespace:
 
         return variables
 
+    def _get_prefetchable_imports(
+        self,
+        imports: List[Import],
+        base_dir: str,
+        variables: Dict[str, Any],
+    ) -> List[Import]:
+        result: List[Import] = []
+
+        for value in imports:
+            # a variables file can define variables used by the following imports, they are only known after the
+            # ordered import has loaded it
+            if isinstance(value, VariablesImport):
+                break
+
+            if not isinstance(value, (LibraryImport, ResourceImport)) or value.name is None:
+                continue
+
+            # imports that can't be resolved yet would be loaded with a wrong name or wrong arguments
+            values = [value.name, *(value.args if isinstance(value, LibraryImport) else ())]
+            try:
+                resolved = [
+                    self.imports_manager.replace_variables_scalar(v, base_dir, variables, ignore_errors=True)
+                    for v in values
+                ]
+            except DataError:
+                continue
+
+            if all(not isinstance(r, str) or not contains_variable(r, "$@&%") for r in resolved):
+                result.append(value)
+
+        return result
+
+    def _prefetch_imports(
+        self,
+        imports: List[Import],
+        base_dir: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        # load the imports concurrently into the caches of the imports manager, the ordered import that follows
+        # only collects them, so diagnostics and keyword precedence stay in declaration order
+        if len(imports) < 2:
+            return
+
+        if variables is None:
+            variables = self.get_suite_variables()
+
+        prefetchable = self._get_prefetchable_imports(imports, base_dir, variables)
+        if len(prefetchable) < 2:
+            return
+
+        # an import is prefetched by the task or by the current thread, whichever claims it first, cancelling the
+        # task instead would also flag a task that is already running as cancelled
+        claims = [threading.Lock() for _ in prefetchable]
+
+        def _prefetch(index: int) -> None:
+            if not claims[index].acquire(blocking=False):
+                return
+
+            value = prefetchable[index]
+            assert value.name is not None
+            try:
+                if isinstance(value, LibraryImport):
+                    self._get_library_entry(
+                        value.name,
+                        value.args,
+                        value.alias,
+                        base_dir,
+                        sentinel=self,
+                        variables=variables,
+                    )
+                elif isinstance(value, ResourceImport):
+                    source = self.imports_manager.find_resource(value.name, base_dir, variables=variables)
+                    if not same_file(self.source, source):
+                        self._get_resource_entry(value.name, base_dir, variables=variables)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except DataError as e:
+                # e.g. a resource that does not exist, the ordered import raises it again and reports it at the import
+                error = str(e)
+                self._logger.debug(lambda: f"Prefetching import {value} failed: {error}", context_name="import")
+            except BaseException as e:
+                self._logger.exception(e, level=logging.WARNING, context_name="import")
+
+        with self._logger.measure_time(lambda: f"prefetching {len(prefetchable)} imports", context_name="import"):
+            tasks = [run_as_task(_prefetch, i) for i in range(len(prefetchable))]
+
+            # this can run in a task itself and resources import other resources, so waiting for queued tasks could
+            # block all workers of the pool, tasks not started yet are run in the current thread instead
+            for i in range(len(prefetchable)):
+                _prefetch(i)
+
+            wait(tasks)
+
     def _import_lib(self, library: str, variables: Optional[Dict[str, Any]] = None) -> Optional[LibraryEntry]:
         try:
             return self._get_library_entry(
@@ -1954,7 +2128,9 @@ class Namespace:
 
                 with self._logger.measure_time(lambda: f"analyzing document {self.source}", context_name="analyze"):
                     try:
-                        result = NamespaceAnalyzer(self.model, self, self.create_finder()).run()
+                        result = NamespaceAnalyzer(
+                            self.model, self, self.create_finder(), self._get_analyzer_block_cache()
+                        ).run()
 
                         self._diagnostics += result.diagnostics
                         self._keyword_references = result.keyword_references
@@ -1993,6 +2169,28 @@ class Namespace:
 
                 self.has_analysed(self)
 
+    def _get_analyzer_block_cache(self) -> Optional[AnalyzerBlockCache]:
+        # only documents that are edited are analyzed more than once
+        document = self.document
+        if document is None or not document.opened_in_editor:
+            return None
+
+        result: Optional[AnalyzerBlockCache] = document.get_data(AnalyzerBlockCache)
+        if result is None:
+            result = AnalyzerBlockCache()
+            document.set_data(AnalyzerBlockCache, result)
+
+        return result
+
+    def get_keyword_index(self) -> NamespaceKeywordIndex:
+        self.ensure_initialized()
+
+        with self._keyword_index_lock:
+            if self._keyword_index is None:
+                self._keyword_index = NamespaceKeywordIndex.create(self)
+
+            return self._keyword_index
+
     def get_finder(self) -> "KeywordFinder":
         if self._finder is None:
             self._finder = self.create_finder()
@@ -1,11 +1,12 @@
 import ast
+import copy
 import functools
 import os
 import re
 import token as python_token
 from collections import defaultdict
 from concurrent.futures import CancelledError
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from io import StringIO
 from pathlib import Path
 from tokenize import TokenError, generate_tokens
@@ -13,7 +14,7 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional,
 
 from robot.errors import VariableError
 from robot.parsing.lexer.tokens import Token
-from robot.parsing.model.blocks import File, Keyword, TestCase, VariableSection
+from robot.parsing.model.blocks import File, Keyword, KeywordSection, TestCase, TestCaseSection, VariableSection
 from robot.parsing.model.statements import (
     Arguments,
     Fixture,
@@ -31,7 +32,7 @@ from robot.parsing.model.statements import (
 )
 from robot.utils.escaping import unescape
 from robot.variables.finders import NOT_FOUND, NumberFinder
-from robotcode.core.concurrent import check_current_task_canceled
+from robotcode.core.concurrent import RLock, check_current_task_canceled
 from robotcode.core.lsp.types import (
     CodeDescription,
     Diagnostic,
@@ -106,6 +107,63 @@ class AnalyzerResult:
     # TODO Tag references
 
 
+def _get_node_key(node: ast.AST, base_line: int = 0) -> int:
+    return hash(
+        tuple(
+            (t.type, t.value, t.lineno - base_line, t.col_offset, t.error)
+            for n in ast.walk(node)
+            if isinstance(n, Statement)
+            for t in n.tokens
+        )
+    )
+
+
+def _shift_range(range: Range, delta: int) -> Range:
+    return Range(
+        start=Position(line=range.start.line + delta, character=range.start.character),
+        end=Position(line=range.end.line + delta, character=range.end.character),
+    )
+
+
+@dataclass
+class CachedBlock:
+    line_no: int
+    end_line_no: int
+    result: AnalyzerResult
+
+
+class AnalyzerBlockCache:
+    # the results of the last analysis of every test case and keyword of a document, they are reused as long as
+    # the block itself and everything outside of the test cases and keywords is unchanged, blocks are keyed by
+    # their content relative to the first line of the block, so they can be moved by inserting or removing lines
+    def __init__(self) -> None:
+        self._lock = RLock(default_timeout=120, name="AnalyzerBlockCache.lock")
+        self._context: Any = None
+        self._blocks: Dict[Tuple[type, int], CachedBlock] = {}
+        self._keywords: List[KeywordDoc] = []
+
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def get_blocks(self, context: Any) -> Tuple[Dict[Tuple[type, int], CachedBlock], List[KeywordDoc]]:
+        with self._lock:
+            if self._context is None or self._context != context:
+                return {}, []
+            return self._blocks, self._keywords
+
+    def update(self, context: Any, blocks: Dict[Tuple[type, int], CachedBlock], keywords: List[KeywordDoc]) -> None:
+        with self._lock:
+            self._context = context
+            self._blocks = blocks
+            self._keywords = keywords
+
+    def clear(self) -> None:
+        with self._lock:
+            self._context = None
+            self._blocks = {}
+            self._keywords = []
+
+
 class NamespaceAnalyzer(Visitor):
     _logger = LoggingDescriptor()
 
@@ -114,12 +172,17 @@ class NamespaceAnalyzer(Visitor):
         model: ast.AST,
         namespace: "Namespace",
         finder: KeywordFinder,
+        block_cache: Optional[AnalyzerBlockCache] = None,
     ) -> None:
         super().__init__()
 
         self._model = model
         self._namespace = namespace
         self._finder = finder
+        self._block_cache = block_cache
+        self._cached_blocks: Dict[Tuple[type, int], CachedBlock] = {}
+        self._cached_keywords: List[KeywordDoc] = []
+        self._analyzed_blocks: Dict[Tuple[type, int], CachedBlock] = {}
 
         self._current_testcase_or_keyword_name: Optional[str] = None
         self._current_keyword_doc: Optional[KeywordDoc] = None
@@ -159,8 +222,19 @@ class NamespaceAnalyzer(Visitor):
                     self._visit_VariableSection(node)
 
         self._suite_variables = self._variables.copy()
+
+        context = None
+        if self._block_cache is not None and isinstance(self._model, File):
+            context = (self._namespace.get_analysis_fingerprint(), self._get_context_key(self._model))
+            self._cached_blocks, self._cached_keywords = self._block_cache.get_blocks(context)
+
         try:
             self.visit(self._model)
+
+            if context is not None and self._block_cache is not None:
+                self._block_cache.update(
+                    context, self._analyzed_blocks, list(self._namespace_lib_doc.keywords.keywords)
+                )
         except (SystemExit, KeyboardInterrupt, CancelledError):
             raise
         except BaseException as e:
@@ -182,6 +256,230 @@ class NamespaceAnalyzer(Visitor):
             self._tag_definitions,
         )
 
+    @staticmethod
+    def _get_context_key(model: File) -> Tuple[int, ...]:
+        # everything outside of the test case and keyword sections keeps its position, so cached results can refer
+        # to it, the headers and comments of the block sections move with the blocks
+        return tuple(
+            _get_node_key(node, node.lineno if isinstance(section, (TestCaseSection, KeywordSection)) else 0)
+            for section in model.sections
+            for node in (section.header, *section.body)
+            if node is not None and not isinstance(node, (TestCase, Keyword))
+        )
+
+    @functools.cached_property
+    def _block_lines(self) -> List[Tuple[int, int]]:
+        if not isinstance(self._model, File):
+            return []
+
+        return [
+            (node.lineno, node.end_lineno)
+            for section in self._model.sections
+            for node in section.body
+            if isinstance(node, (TestCase, Keyword))
+        ]
+
+    def _visit_block(self, node: Union[TestCase, Keyword], analyze: Callable[[Any], None]) -> None:
+        key: Optional[Tuple[type, int]] = None
+        if self._block_cache is not None:
+            key = (type(node), _get_node_key(node, node.lineno))
+
+            cached = self._cached_blocks.get(key)
+            if cached is not None:
+                result = self._rebase_block_result(cached, node.lineno - cached.line_no)
+                self._merge_block_result(result)
+                self._analyzed_blocks[key] = CachedBlock(node.lineno, node.end_lineno, result)
+                return
+
+        saved = (
+            self._diagnostics,
+            self._keyword_references,
+            self._variable_references,
+            self._local_variable_assignments,
+            self._namespace_references,
+            self._test_case_definitions,
+            self._tag_definitions,
+        )
+
+        self._diagnostics = []
+        self._keyword_references = defaultdict(set)
+        self._variable_references = defaultdict(set)
+        self._local_variable_assignments = defaultdict(set)
+        self._namespace_references = defaultdict(set)
+        self._test_case_definitions = []
+        self._tag_definitions = []
+        try:
+            analyze(node)
+
+            result = AnalyzerResult(
+                self._diagnostics,
+                self._keyword_references,
+                self._variable_references,
+                self._local_variable_assignments,
+                self._namespace_references,
+                self._test_case_definitions,
+                self._tag_definitions,
+            )
+        finally:
+            (
+                self._diagnostics,
+                self._keyword_references,
+                self._variable_references,
+                self._local_variable_assignments,
+                self._namespace_references,
+                self._test_case_definitions,
+                self._tag_definitions,
+            ) = saved
+
+        self._merge_block_result(result)
+        if key is not None and self._is_relocatable(result, node):
+            self._analyzed_blocks[key] = CachedBlock(node.lineno, node.end_lineno, result)
+
+    @functools.cached_property
+    def _document_uris(self) -> Set[str]:
+        return {self._namespace.document_uri, str(Uri.from_path(self._namespace.source))}
+
+    def _get_result_lines(self, result: AnalyzerResult) -> Iterator[int]:
+        source = self._namespace.source
+        uris = self._document_uris
+
+        for d in result.diagnostics:
+            yield d.range.start.line + 1
+            for info in d.related_information or []:
+                if info.location.uri in uris:
+                    yield info.location.range.start.line + 1
+
+        for references in (result.keyword_references, result.variable_references, result.namespace_references):
+            for locations in references.values():
+                yield from (loc.range.start.line + 1 for loc in locations if loc.uri in uris)
+
+        for var, ranges in result.local_variable_assignments.items():
+            yield from (r.start.line + 1 for r in ranges)
+
+        for entity in (
+            *result.variable_references.keys(),
+            *result.local_variable_assignments.keys(),
+            *result.test_case_definitions,
+            *result.tag_definitions,
+        ):
+            if entity.source == source:
+                yield entity.line_no
+
+    def _is_relocatable(self, result: AnalyzerResult, node: Union[TestCase, Keyword]) -> bool:
+        # a result that refers to another test case or keyword can't be moved together with its own block
+        return all(
+            node.lineno <= line <= node.end_lineno or not any(start <= line <= end for start, end in self._block_lines)
+            for line in self._get_result_lines(result)
+        )
+
+    @functools.cached_property
+    def _own_keywords(self) -> Dict[int, KeywordDoc]:
+        # the fingerprint of the context contains the own keywords in order, so the keywords of the cached results
+        # and the current keywords are the same except for their positions
+        return {id(old): new for old, new in zip(self._cached_keywords, self._namespace_lib_doc.keywords.keywords)}
+
+    def _rebase_block_result(self, cached: CachedBlock, delta: int) -> AnalyzerResult:
+        source = self._namespace.source
+        uris = self._document_uris
+        entities: Dict[int, Any] = {}
+
+        def in_block(line: int) -> bool:
+            return cached.line_no <= line <= cached.end_line_no
+
+        def rebase_range(range: Range) -> Range:
+            return _shift_range(range, delta) if delta and in_block(range.start.line + 1) else range
+
+        def rebase_location(location: Location) -> Location:
+            if location.uri not in uris:
+                return location
+            return Location(location.uri, rebase_range(location.range))
+
+        def rebase_diagnostic(diagnostic: Diagnostic) -> Diagnostic:
+            # always copy the diagnostic, the diagnostics modifiers changes the diagnostics in place
+            return replace(
+                diagnostic,
+                range=rebase_range(diagnostic.range),
+                related_information=(
+                    [
+                        DiagnosticRelatedInformation(rebase_location(info.location), info.message)
+                        for info in diagnostic.related_information
+                    ]
+                    if diagnostic.related_information is not None
+                    else None
+                ),
+            )
+
+        def rebase_entity(entity: Any) -> Any:
+            result = entities.get(id(entity))
+            if result is not None:
+                return result
+
+            changes: Dict[str, Any] = {}
+            if delta and entity.source == source and in_block(entity.line_no):
+                changes["line_no"] = entity.line_no + delta
+                changes["end_line_no"] = entity.end_line_no + delta
+
+                name_token = getattr(entity, "name_token", None)
+                if name_token is not None:
+                    changes["name_token"] = Token(
+                        name_token.type,
+                        name_token.value,
+                        name_token.lineno + delta,
+                        name_token.col_offset,
+                        name_token.error,
+                    )
+
+            if isinstance(entity, ArgumentDefinition) and entity.keyword_doc is not None:
+                keyword_doc = self._own_keywords.get(id(entity.keyword_doc), entity.keyword_doc)
+                if keyword_doc is not entity.keyword_doc:
+                    changes["keyword_doc"] = keyword_doc
+
+            result = replace(entity, **changes) if changes else entity
+            entities[id(entity)] = result
+            return result
+
+        return AnalyzerResult(
+            [rebase_diagnostic(d) for d in cached.result.diagnostics],
+            {
+                # cached results refers to the keywords of the previous version of this document
+                self._own_keywords.get(id(kw), kw): {rebase_location(loc) for loc in locations}
+                for kw, locations in cached.result.keyword_references.items()
+            },
+            {
+                rebase_entity(var): {rebase_location(loc) for loc in locations}
+                for var, locations in cached.result.variable_references.items()
+            },
+            {
+                rebase_entity(var): {rebase_range(r) for r in ranges}
+                for var, ranges in cached.result.local_variable_assignments.items()
+            },
+            {
+                entry: {rebase_location(loc) for loc in locations}
+                for entry, locations in cached.result.namespace_references.items()
+            },
+            [rebase_entity(d) for d in cached.result.test_case_definitions],
+            [rebase_entity(d) for d in cached.result.tag_definitions],
+        )
+
+    def _merge_block_result(self, result: AnalyzerResult) -> None:
+        if self._block_cache is not None:
+            # the diagnostics modifiers changes the diagnostics in place, keep the cached ones unchanged
+            self._diagnostics.extend(copy.copy(d) for d in result.diagnostics)
+        else:
+            self._diagnostics.extend(result.diagnostics)
+
+        for kw, locations in result.keyword_references.items():
+            self._keyword_references[kw].update(locations)
+        for var, locations in result.variable_references.items():
+            self._variable_references[var].update(locations)
+        for var, ranges in result.local_variable_assignments.items():
+            self._local_variable_assignments[var].update(ranges)
+        for entry, locations in result.namespace_references.items():
+            self._namespace_references[entry].update(locations)
+
+        self._test_case_definitions.extend(result.test_case_definitions)
+        self._tag_definitions.extend(result.tag_definitions)
+
     def _visit_VariableSection(self, node: VariableSection) -> None:  # noqa: N802
         for v in node.body:
             if isinstance(v, Variable):
@@ -614,9 +912,10 @@ class NamespaceAnalyzer(Visitor):
             if not allow_variables and not is_not_variable_token(keyword_token):
                 return None
 
-            result = self._finder.find_keyword(keyword, raise_keyword_error=False)
+            find_result = self._finder.find_keyword_result(keyword, raise_keyword_error=False)
+            result = find_result.keyword
 
-            if result is not None and self._finder.result_bdd_prefix:
+            if result is not None and find_result.bdd_prefix:
                 keyword_token = ModelHelper.strip_bdd_prefix(self._namespace, keyword_token)
 
             kw_range = range_from_token(keyword_token)
@@ -646,7 +945,7 @@ class NamespaceAnalyzer(Visitor):
 
             if kw_namespace and lib_entry is not None and lib_range is not None:
                 entries = [lib_entry]
-                if self._finder.multiple_keywords_result is not None:
+                if find_result.multiple_keywords is not None:
                     entries = next(
                         (v for k, v in (self._namespace.get_namespaces()).items() if k == kw_namespace),
                         entries,
@@ -655,7 +954,7 @@ class NamespaceAnalyzer(Visitor):
                     self._namespace_references[entry].add(Location(self._namespace.document_uri, lib_range))
 
             if not ignore_errors_if_contains_variables or is_not_variable_token(keyword_token):
-                for e in self._finder.diagnostics:
+                for e in find_result.diagnostics:
                     self._append_diagnostics(
                         range=kw_range,
                         message=e.message,
@@ -664,8 +963,8 @@ class NamespaceAnalyzer(Visitor):
                     )
 
             if result is None:
-                if self._finder.multiple_keywords_result is not None:
-                    for d in self._finder.multiple_keywords_result:
+                if find_result.multiple_keywords is not None:
+                    for d in find_result.multiple_keywords:
                         self._keyword_references[d].add(Location(self._namespace.document_uri, kw_range))
             else:
                 self._keyword_references[result].add(Location(self._namespace.document_uri, kw_range))
@@ -1043,6 +1342,9 @@ class NamespaceAnalyzer(Visitor):
         self._analyze_assign_statement(node)
 
     def visit_TestCase(self, node: TestCase) -> None:  # noqa: N802
+        self._visit_block(node, self._analyze_test_case)
+
+    def _analyze_test_case(self, node: TestCase) -> None:
         if not node.name:
             name_token = node.header.get_token(Token.TESTCASE_NAME)
             self._append_diagnostics(
@@ -1088,6 +1390,9 @@ class NamespaceAnalyzer(Visitor):
         return self._namespace.get_library_doc()
 
     def visit_Keyword(self, node: Keyword) -> None:  # noqa: N802
+        self._visit_block(node, self._analyze_keyword)
+
+    def _analyze_keyword(self, node: Keyword) -> None:
         if node.name:
             name_token = node.header.get_token(Token.KEYWORD_NAME)
             self._current_keyword_doc = ModelHelper.get_keyword_definition_at_token(self._namespace_lib_doc, name_token)
@@ -1429,7 +1734,8 @@ class NamespaceAnalyzer(Visitor):
             keyword = template.value
             keyword, args = self._format_template(keyword, args)
 
-            result = self._finder.find_keyword(keyword)
+            find_result = self._finder.find_keyword_result(keyword)
+            result = find_result.keyword
             if result is not None:
                 try:
                     if result.arguments_spec is not None:
@@ -1449,7 +1755,7 @@ class NamespaceAnalyzer(Visitor):
                         code=type(e).__qualname__,
                     )
 
-            for d in self._finder.diagnostics:
+            for d in find_result.diagnostics:
                 self._append_diagnostics(
                     range=range_from_node(node, skip_non_data=True),
                     message=d.message,
@@ -1459,11 +1765,27 @@ class NamespaceAnalyzer(Visitor):
 
         self.generic_visit(node)
 
+    def _add_tag_definitions(self, node: Statement) -> None:
+        for token in node.get_tokens(Token.ARGUMENT):
+            if token.value:
+                self._tag_definitions.append(
+                    TagDefinition(
+                        line_no=token.lineno,
+                        col_offset=token.col_offset,
+                        end_line_no=token.lineno,
+                        end_col_offset=token.end_col_offset,
+                        source=self._namespace.source,
+                        name=token.value,
+                    )
+                )
+
     def visit_DefaultTags(self, node: Statement) -> None:  # noqa: N802
         self._analyze_statement_variables(node, DiagnosticSeverity.HINT)
+        self._add_tag_definitions(node)
 
     def visit_ForceTags(self, node: Statement) -> None:  # noqa: N802
         self._analyze_statement_variables(node, DiagnosticSeverity.HINT)
+        self._add_tag_definitions(node)
 
         if get_robot_version() >= (6, 0):
             tag = node.get_token(Token.FORCE_TAGS)
@@ -1478,6 +1800,7 @@ class NamespaceAnalyzer(Visitor):
 
     def visit_TestTags(self, node: Statement) -> None:  # noqa: N802
         self._analyze_statement_variables(node, DiagnosticSeverity.HINT)
+        self._add_tag_definitions(node)
 
         if get_robot_version() >= (6, 0):
             tag = node.get_token(Token.FORCE_TAGS)
@@ -1505,8 +1828,13 @@ class NamespaceAnalyzer(Visitor):
     def visit_MultiValue(self, node: Statement) -> None:  # noqa: N802
         self._visit_settings_statement(node, DiagnosticSeverity.HINT)
 
+    def visit_KeywordTags(self, node: Statement) -> None:  # noqa: N802
+        self._visit_settings_statement(node, DiagnosticSeverity.HINT)
+        self._add_tag_definitions(node)
+
     def visit_Tags(self, node: Statement) -> None:  # noqa: N802
         self._visit_settings_statement(node, DiagnosticSeverity.HINT)
+        self._add_tag_definitions(node)
 
         if (6, 0) < get_robot_version() < (7, 0):
             for tag in node.get_tokens(Token.ARGUMENT):
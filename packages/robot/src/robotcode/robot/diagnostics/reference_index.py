@@ -0,0 +1,141 @@
+from typing import Any, Dict, FrozenSet, Generic, Hashable, Iterable, Set, Tuple, TypeVar
+
+from robotcode.core.concurrent import RLock
+
+from ..utils.match import normalize
+from .entities import VariableDefinition
+from .library_doc import KeywordDoc
+
+_TKey = TypeVar("_TKey", bound=Hashable)
+
+KeywordKey = Tuple[Any, ...]
+VariableKey = Tuple[Any, ...]
+
+
+def keyword_key(keyword: KeywordDoc) -> KeywordKey:
+    # plain tuples can be pickled and compared across processes, unlike the entities themselves,
+    # a key may match more keywords than the equality of the entity does, that is fine for a candidate
+    return (
+        keyword.name,
+        keyword.longname,
+        keyword.source,
+        keyword.line_no,
+        keyword.col_offset,
+        keyword.type,
+        keyword.libname,
+        keyword.libtype,
+    )
+
+
+def variable_key(variable: VariableDefinition) -> VariableKey:
+    return (variable.name, variable.type.value, variable.source, variable.line_no, variable.col_offset)
+
+
+class ReferenceCandidates:
+    # documents that are not indexed yet may contain a reference, so they are always a candidate
+    def __init__(self, indexed: FrozenSet[str], hits: FrozenSet[str]) -> None:
+        self.indexed = indexed
+        self.hits = hits
+
+    def __contains__(self, uri: str) -> bool:
+        return uri in self.hits or uri not in self.indexed
+
+
+class _InvertedIndex(Generic[_TKey]):
+    def __init__(self) -> None:
+        self._documents: Dict[_TKey, Set[str]] = {}
+
+    def add(self, uri: str, keys: Iterable[_TKey]) -> None:
+        for key in keys:
+            documents = self._documents.get(key, None)
+            if documents is None:
+                self._documents[key] = documents = set()
+            documents.add(uri)
+
+    def remove(self, uri: str, keys: Iterable[_TKey]) -> None:
+        for key in keys:
+            documents = self._documents.get(key, None)
+            if documents is None:
+                continue
+
+            documents.discard(uri)
+            if not documents:
+                del self._documents[key]
+
+    def get(self, key: _TKey) -> FrozenSet[str]:
+        return frozenset(self._documents.get(key, ()))
+
+
+class ReferenceIndex:
+    def __init__(self) -> None:
+        self._lock = RLock(default_timeout=120, name="ReferenceIndex.lock")
+
+        self._keywords: _InvertedIndex[KeywordKey] = _InvertedIndex()
+        self._variables: _InvertedIndex[VariableKey] = _InvertedIndex()
+        self._tags: _InvertedIndex[str] = _InvertedIndex()
+
+        self._document_keys: Dict[str, Tuple[FrozenSet[KeywordKey], FrozenSet[VariableKey], FrozenSet[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._document_keys)
+
+    def is_indexed(self, uri: str) -> bool:
+        with self._lock:
+            return uri in self._document_keys
+
+    def update_document(
+        self,
+        uri: str,
+        keywords: Iterable[KeywordDoc],
+        variables: Iterable[VariableDefinition],
+        tags: Iterable[str],
+    ) -> None:
+        self.update_document_keys(
+            uri, (keyword_key(kw) for kw in keywords), (variable_key(var) for var in variables), tags
+        )
+
+    def update_document_keys(
+        self,
+        uri: str,
+        keywords: Iterable[KeywordKey],
+        variables: Iterable[VariableKey],
+        tags: Iterable[str],
+    ) -> None:
+        keys = (frozenset(keywords), frozenset(variables), frozenset(normalize(tag) for tag in tags))
+
+        with self._lock:
+            self._remove_document(uri)
+
+            self._keywords.add(uri, keys[0])
+            self._variables.add(uri, keys[1])
+            self._tags.add(uri, keys[2])
+
+            self._document_keys[uri] = keys
+
+    def remove_document(self, uri: str) -> None:
+        with self._lock:
+            self._remove_document(uri)
+
+    def _remove_document(self, uri: str) -> None:
+        keys = self._document_keys.pop(uri, None)
+        if keys is None:
+            return
+
+        self._keywords.remove(uri, keys[0])
+        self._variables.remove(uri, keys[1])
+        self._tags.remove(uri, keys[2])
+
+    def keyword_candidates(self, keyword: KeywordDoc) -> ReferenceCandidates:
+        with self._lock:
+            return ReferenceCandidates(frozenset(self._document_keys), self._keywords.get(keyword_key(keyword)))
+
+    def variable_candidates(self, variable: VariableDefinition) -> ReferenceCandidates:
+        with self._lock:
+            return ReferenceCandidates(frozenset(self._document_keys), self._variables.get(variable_key(variable)))
+
+    def tag_candidates(self, tag: str, is_normalized: bool = False) -> ReferenceCandidates:
+        if not is_normalized:
+            tag = normalize(tag)
+
+        with self._lock:
+            return ReferenceCandidates(frozenset(self._document_keys), self._tags.get(tag))
@@ -0,0 +1,263 @@
+import importlib
+import importlib.machinery
+import multiprocessing as mp
+import os
+import queue
+import site
+import sys
+import sysconfig
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, cast
+
+from robotcode.core.utils.logging import LoggingDescriptor
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_JOBS_PER_WORKER = 100
+DEFAULT_MAX_WORKER_MEMORY = 1024
+WARMUP_TIME_OUT = 60
+
+_KEEP_MODULE_PREFIXES = ("robot.", "robotcode.")
+
+
+def default_worker_count() -> int:
+    return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+_warm_modules: Set[str] = set()
+
+
+def _initialize_worker() -> None:
+    import robot.libdocpkg
+    import robot.libraries.BuiltIn
+    import robot.running
+    import robot.variables  # noqa: F401
+
+    from . import library_doc  # noqa: F401
+
+    _warm_modules.update(sys.modules.keys())
+
+
+def _get_installed_paths() -> Tuple[str, ...]:
+    paths = {sysconfig.get_path(name) for name in ("stdlib", "platstdlib", "purelib", "platlib")}
+    if hasattr(site, "getsitepackages"):
+        paths.update(site.getsitepackages())
+    if site.ENABLE_USER_SITE:
+        paths.add(site.getusersitepackages())
+
+    return tuple(os.path.join(os.path.normcase(os.path.abspath(p)), "") for p in paths if p)
+
+
+_installed_paths: Optional[Tuple[str, ...]] = None
+
+
+def _is_reloadable_module(module: Optional[ModuleType]) -> bool:
+    # only modules of the user's own libraries are imported again by the next job, so a changed library is not
+    # served from a stale module, installed and extension modules can't be initialized twice in a process
+    global _installed_paths
+
+    file = getattr(module, "__file__", None)
+    if not file or file.endswith(tuple(importlib.machinery.EXTENSION_SUFFIXES)):
+        return False
+
+    if _installed_paths is None:
+        _installed_paths = _get_installed_paths()
+
+    return not os.path.normcase(os.path.abspath(file)).startswith(_installed_paths)
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+def _get_memory_usage() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+
+    try:
+        import resource
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss // (1024 * 1024) if sys.platform == "darwin" else max_rss // 1024
+    except ImportError:
+        return None
+
+
+def _run_job(func: Callable[..., _T], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Tuple[_T, Optional[int]]:
+    old_cwd = os.getcwd()
+    old_path = list(sys.path)
+    old_environ = dict(os.environ)
+    old_modules = set(sys.modules.keys())
+
+    importlib.invalidate_caches()
+    try:
+        return func(*args, **kwargs), _get_memory_usage()
+    finally:
+        for name in set(sys.modules.keys()) - old_modules - _warm_modules:
+            if not name.startswith(_KEEP_MODULE_PREFIXES) and _is_reloadable_module(sys.modules.get(name)):
+                sys.modules.pop(name, None)
+
+        sys.path[:] = old_path
+
+        if os.environ != old_environ:
+            os.environ.clear()
+            os.environ.update(old_environ)
+
+        try:
+            os.chdir(old_cwd)
+        except OSError:
+            pass
+
+
+class _Worker:
+    def __init__(self) -> None:
+        self.executor = ProcessPoolExecutor(
+            max_workers=1, mp_context=mp.get_context("spawn"), initializer=_initialize_worker
+        )
+        self.jobs = 0
+        self.warmed_up: Future[int] = self.executor.submit(_warmup)
+
+    def submit(self, func: Callable[..., _T], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> "Future[Any]":
+        self.jobs += 1
+        return self.executor.submit(_run_job, func, args, kwargs)
+
+    def shutdown(self, kill: bool = False) -> None:
+        if kill:
+            processes = getattr(self.executor, "_processes", None) or {}
+            for p in list(processes.values()):
+                try:
+                    p.kill()
+                except (OSError, AttributeError):
+                    pass
+        try:
+            self.executor.shutdown(wait=False)
+        except RuntimeError:
+            pass
+
+
+class LibraryWorkerPool:
+    _logger = LoggingDescriptor()
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_jobs_per_worker: Optional[int] = None,
+        max_worker_memory: Optional[int] = None,
+    ) -> None:
+        if max_jobs_per_worker is None:
+            max_jobs_per_worker = DEFAULT_MAX_JOBS_PER_WORKER
+        if max_worker_memory is None:
+            max_worker_memory = DEFAULT_MAX_WORKER_MEMORY
+
+        self.max_workers = max_workers if max_workers is not None and max_workers > 0 else default_worker_count()
+        # a limit of 0 disables recycling
+        self.max_jobs_per_worker = max_jobs_per_worker if max_jobs_per_worker > 0 else None
+        self.max_worker_memory = max_worker_memory if max_worker_memory > 0 else None
+
+        self._lock = threading.RLock()
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._workers: List[_Worker] = []
+        self._is_shutdown = False
+
+    @property
+    def worker_count(self) -> int:
+        with self._lock:
+            return len(self._workers)
+
+    def start(self) -> None:
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                self._idle.put(self._create_worker())
+
+    def _create_worker(self) -> _Worker:
+        if self._is_shutdown:
+            raise RuntimeError("Cannot schedule new jobs after shutdown.")
+
+        worker = _Worker()
+        self._workers.append(worker)
+
+        return worker
+
+    def _acquire_worker(self) -> _Worker:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._workers) < self.max_workers:
+                return self._create_worker()
+
+        while True:
+            try:
+                return self._idle.get(timeout=1)
+            except queue.Empty:
+                if self._is_shutdown:
+                    raise RuntimeError("Cannot schedule new jobs after shutdown.")
+
+    def _release_worker(self, worker: _Worker, discard: bool = False, kill: bool = False) -> None:
+        with self._lock:
+            if discard or self._is_shutdown:
+                if worker in self._workers:
+                    self._workers.remove(worker)
+                worker.shutdown(kill=kill)
+
+                if self._is_shutdown:
+                    return
+
+                # keep the pool warm, the replacement spawns in the background
+                worker = self._create_worker()
+
+        self._idle.put(worker)
+
+    def submit(self, func: Callable[..., _T], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> _T:
+        if self._is_shutdown:
+            raise RuntimeError("Cannot schedule new jobs after shutdown.")
+
+        worker = self._acquire_worker()
+        discard = False
+        kill = False
+        try:
+            if not worker.warmed_up.done():
+                try:
+                    worker.warmed_up.result(WARMUP_TIME_OUT)
+                except TimeoutError:
+                    self._logger.debug(lambda: "Timeout while warming up worker, kill worker.")
+                    discard = kill = True
+                    raise
+
+            try:
+                result, memory = cast(Tuple[_T, Optional[int]], worker.submit(func, args, kwargs).result(timeout))
+            except TimeoutError:
+                self._logger.debug(lambda: f"Timeout in worker job {func!r}, kill worker.")
+                discard = kill = True
+                raise
+
+            if self.max_jobs_per_worker is not None and worker.jobs >= self.max_jobs_per_worker:
+                self._logger.debug(lambda: f"Recycle worker after {worker.jobs} jobs.")
+                discard = True
+            elif self.max_worker_memory is not None and memory is not None and memory > self.max_worker_memory:
+                self._logger.debug(lambda: f"Recycle worker, memory usage {memory} MB exceeds limit.")
+                discard = True
+
+            return result
+        except BrokenProcessPool:
+            discard = True
+            raise
+        finally:
+            self._release_worker(worker, discard, kill)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._is_shutdown = True
+            workers = self._workers
+            self._workers = []
+
+        for worker in workers:
+            worker.shutdown(kill=True)
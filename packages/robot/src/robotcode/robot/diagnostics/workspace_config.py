@@ -4,6 +4,8 @@ from typing import Dict, List, Optional
 
 from robotcode.core.workspace import ConfigBase, config_section
 
+from .data_cache import CacheStorage
+
 
 class RpaMode(Enum):
     DEFAULT = "default"
@@ -49,6 +51,11 @@ class CacheConfig(ConfigBase):
     ignored_libraries: List[str] = field(default_factory=list)
     ignored_variables: List[str] = field(default_factory=list)
     ignore_arguments_for_library: List[str] = field(default_factory=list)
+    library_workers: Optional[int] = None
+    library_worker_max_jobs: Optional[int] = None
+    library_worker_max_memory: Optional[int] = None
+    storage: Optional[CacheStorage] = None
+    shared_cache: Optional[bool] = None
 
 
 @config_section("robotcode.analysis.robot")
@@ -0,0 +1,109 @@
+import time
+from typing import List
+
+import pytest
+
+from robotcode.core.utils.caching import SimpleLRUCache
+
+
+def test_get_should_call_function_only_once_per_key() -> None:
+    calls: List[int] = []
+
+    def func(v: int) -> int:
+        calls.append(v)
+        return v * 2
+
+    cache = SimpleLRUCache()
+
+    assert cache.get(func, 1) == 2
+    assert cache.get(func, 1) == 2
+    assert cache.get(func, 2) == 4
+    assert calls == [1, 2]
+    assert cache.has(1)
+    assert not cache.has(3)
+
+
+def test_least_recently_used_entry_should_be_evicted() -> None:
+    cache = SimpleLRUCache(max_items=2)
+
+    cache.get(lambda v: v, 1)
+    cache.get(lambda v: v, 2)
+    cache.get(lambda v: v, 1)
+    cache.get(lambda v: v, 3)
+
+    assert cache.has(1)
+    assert not cache.has(2)
+    assert cache.has(3)
+
+
+def test_size_should_stay_bounded_if_evicted_keys_are_requested_again() -> None:
+    cache = SimpleLRUCache(max_items=3)
+
+    for _ in range(3):
+        for i in range(10):
+            cache.get(lambda v: v, i)
+
+    assert len(cache) == 3
+    assert cache.statistics.evictions == 27
+
+
+def test_statistics_should_count_hits_and_misses() -> None:
+    cache = SimpleLRUCache(max_items=None)
+
+    cache.get(lambda v: v, 1)
+    cache.get(lambda v: v, 1)
+    cache.get(lambda v: v, 2)
+
+    statistics = cache.statistics
+    assert statistics.hits == 1
+    assert statistics.misses == 2
+    assert statistics.evictions == 0
+    assert statistics.size == 2
+
+
+def test_entries_should_expire_after_ttl() -> None:
+    cache = SimpleLRUCache(ttl=0.05)
+
+    cache.get(lambda v: v, 1)
+    assert cache.has(1)
+
+    time.sleep(0.1)
+
+    assert not cache.has(1)
+    cache.get(lambda v: v, 1)
+    assert cache.statistics.misses == 2
+
+
+def test_entries_should_be_evicted_by_weight() -> None:
+    cache = SimpleLRUCache(max_items=None, max_weight=10, weigher=len)
+
+    cache.get(lambda v: v * "a", 4)
+    cache.get(lambda v: v * "a", 5)
+    assert cache.statistics.weight == 9
+
+    cache.get(lambda v: v * "a", 3)
+
+    assert not cache.has(4)
+    assert cache.has(5)
+    assert cache.has(3)
+    assert cache.statistics.weight == 8
+
+
+def test_failed_call_should_not_be_cached() -> None:
+    cache = SimpleLRUCache()
+
+    def fail() -> None:
+        raise ValueError("fail")
+
+    with pytest.raises(ValueError, match="fail"):
+        cache.get(fail)
+
+    assert not cache.has()
+    assert len(cache) == 0
+
+
+def test_keyword_arguments_should_be_part_of_the_key() -> None:
+    cache = SimpleLRUCache()
+
+    assert cache.get(lambda v: v, v=1) == 1
+    assert cache.get(lambda v: v, v=2) == 2
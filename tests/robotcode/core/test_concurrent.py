@@ -0,0 +1,104 @@
+import threading
+from concurrent.futures import CancelledError
+from typing import Iterator, List
+
+import pytest
+
+from robotcode.core.concurrent import (
+    TaskPool,
+    TaskPriority,
+    check_current_task_canceled,
+)
+
+
+@pytest.fixture
+def pool() -> Iterator[TaskPool]:
+    result = TaskPool(max_workers=1, starvation_timeout=0.1, idle_timeout=5)
+    try:
+        yield result
+    finally:
+        result.shutdown()
+
+
+def test_tasks_should_run_in_a_bounded_number_of_threads(pool: TaskPool) -> None:
+    threads = [pool.submit(TaskPriority.NORMAL, threading.get_ident).result(10) for _ in range(5)]
+
+    assert len(set(threads)) == 1
+    assert threading.get_ident() not in threads
+    assert pool.statistics.workers == 1
+
+
+def test_queued_tasks_should_run_by_priority(pool: TaskPool) -> None:
+    started = threading.Event()
+    release = threading.Event()
+    order: List[str] = []
+
+    def block() -> None:
+        started.set()
+        release.wait(10)
+
+    blocker = pool.submit(TaskPriority.NORMAL, block)
+    started.wait(10)
+
+    tasks = [
+        pool.submit(TaskPriority.BACKGROUND, order.append, "background"),
+        pool.submit(TaskPriority.NORMAL, order.append, "normal"),
+        pool.submit(TaskPriority.INTERACTIVE, order.append, "interactive"),
+    ]
+    assert pool.statistics.queue_depth == 3
+
+    release.set()
+    blocker.result(10)
+    for task in tasks:
+        task.result(10)
+
+    assert order == ["interactive", "normal", "background"]
+
+
+def test_waiting_for_a_queued_task_should_not_deadlock(pool: TaskPool) -> None:
+    def outer() -> int:
+        return pool.submit(TaskPriority.NORMAL, lambda: 42).result(10)
+
+    assert pool.submit(TaskPriority.NORMAL, outer).result(10) == 42
+    assert pool.statistics.workers == 2
+
+
+def test_cancel_should_be_visible_in_the_running_task(pool: TaskPool) -> None:
+    started = threading.Event()
+
+    def wait_for_cancel() -> None:
+        started.set()
+        check_current_task_canceled(10)
+
+    task = pool.submit(TaskPriority.NORMAL, wait_for_cancel)
+    started.wait(10)
+    task.cancel()
+
+    with pytest.raises(CancelledError):
+        task.result(10)
+
+
+def test_statistics_should_count_tasks(pool: TaskPool) -> None:
+    for _ in range(3):
+        pool.submit(TaskPriority.BACKGROUND, lambda: None).result(10)
+
+    statistics = pool.statistics
+    assert statistics.submitted == 3
+    assert statistics.queue_depth == 0
+    assert statistics.max_wait_time >= statistics.average_wait_time >= 0
+
+
+def test_wait_for_interactive_tasks_should_block_until_they_are_done(pool: TaskPool) -> None:
+    release = threading.Event()
+
+    task = pool.submit(TaskPriority.INTERACTIVE, release.wait, 10)
+
+    assert pool.has_interactive_tasks
+    assert not pool.wait_for_interactive_tasks(0.05)
+
+    release.set()
+    task.result(10)
+
+    assert pool.wait_for_interactive_tasks(1)
+    assert not pool.has_interactive_tasks
+    assert pool.statistics.max_interactive_latency >= 0.05
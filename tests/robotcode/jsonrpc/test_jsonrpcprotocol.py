@@ -1,8 +1,9 @@
 import asyncio
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Hashable, List, Optional, cast
 
 import pytest
 
+from robotcode.core.concurrent import get_task_pool
 from robotcode.core.lsp.types import MessageActionItem
 from robotcode.core.utils.dataclasses import as_dict, as_json
 from robotcode.jsonrpc2.protocol import (
@@ -10,6 +11,7 @@ from robotcode.jsonrpc2.protocol import (
     JsonRPCErrorObject,
     JsonRPCErrors,
     JsonRPCMessage,
+    JsonRPCNotification,
     JsonRPCProtocol,
     JsonRPCRequest,
     JsonRPCResponse,
@@ -84,6 +86,49 @@ async def test_receive_a_batch_request_should_work() -> None:
     assert protocol.handled_messages == message
 
 
+@pytest.mark.asyncio
+async def test_receive_several_messages_in_one_chunk_should_work() -> None:
+    protocol = DummyJsonRPCProtocol(None)
+
+    messages = [
+        JsonRPCRequest(id=1, method="doSomething", params={}),
+        JsonRPCRequest(id=2, method="doSomethingElse", params={"text": "äöü😀"}),
+    ]
+
+    data = b""
+    for message in messages:
+        json_message = as_json(message).encode("utf-8")
+        data += (
+            f"Content-Length: {len(json_message)}\r\n"
+            "Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n\r\n".encode("ascii")
+        ) + json_message
+
+    await protocol.data_received_async(data)
+
+    assert protocol.handled_messages == messages
+
+
+@pytest.mark.asyncio
+async def test_receive_a_message_split_into_small_chunks_should_work() -> None:
+    protocol = DummyJsonRPCProtocol(None)
+
+    messages = [
+        JsonRPCRequest(id=1, method="doSomething", params={"text": "x" * 1000}),
+        JsonRPCRequest(id=2, method="doSomething", params={}),
+    ]
+
+    data = b""
+    for message in messages:
+        json_message = as_json(message).encode("utf-8")
+        data += f"Content-Length: {len(json_message)}\r\n\r\n".encode("ascii") + json_message
+
+    for i in range(0, len(data), 3):
+        await protocol.data_received_async(data[i : i + 3])
+
+    assert protocol.handled_messages == messages
+    assert len(protocol._message_buf) == 0
+
+
 @pytest.mark.asyncio
 async def test_receive_invalid_jsonmessage_should_throw_send_an_error() -> None:
     protocol = DummyJsonRPCProtocol(None)
@@ -242,3 +287,58 @@ async def test_receive_response_with_generic_dict_should_return_unchanged() -> N
     a = r.result(10)
 
     assert a == [as_dict(MessageActionItem(title="hi there"))]
+
+
+class RecordingTransport(asyncio.WriteTransport):
+    def __init__(self) -> None:
+        super().__init__()
+        self.written: List[bytes] = []
+
+    def write(self, data: Any) -> None:
+        self.written.append(bytes(data))
+
+
+class SupersedingJsonRPCProtocol(JsonRPCProtocol):
+    def _get_superseding_key(self, message: JsonRPCMessage) -> Optional[Hashable]:
+        if isinstance(message, JsonRPCNotification) and message.method == "progress":
+            return message.method
+        return None
+
+
+@pytest.mark.asyncio
+async def test_send_message_should_batch_writes_and_drop_superseded_messages() -> None:
+    protocol = SupersedingJsonRPCProtocol()
+    transport = RecordingTransport()
+    protocol.connection_made(transport)
+
+    protocol.send_notification("progress", {"value": 1})
+    protocol.send_notification("other", {"value": 2})
+    protocol.send_notification("progress", {"value": 3})
+    protocol.send_notification("other", {"value": 4})
+
+    await asyncio.sleep(0.1)
+
+    assert len(transport.written) == 1
+
+    receiver = DummyJsonRPCProtocol(None)
+    await receiver.data_received_async(transport.written[0])
+
+    notifications = [m for m in receiver.handled_messages if isinstance(m, JsonRPCNotification)]
+    assert [(m.method, m.params["value"]) for m in notifications] == [("other", 2), ("progress", 3), ("other", 4)]
+
+
+@pytest.mark.asyncio
+async def test_only_interactive_threaded_requests_should_run_as_interactive_tasks() -> None:
+    protocol = DummyJsonRPCProtocol(None)
+
+    def has_interactive_tasks() -> bool:
+        return get_task_pool().has_interactive_tasks
+
+    protocol.registry.add_method("interactive", has_interactive_tasks, threaded=True, interactive=True)
+    protocol.registry.add_method("other", has_interactive_tasks, threaded=True)
+
+    await protocol.handle_request(JsonRPCRequest(id=1, method="interactive", params=None))
+    assert protocol.sended_message == JsonRPCResponse(id=1, result=True)
+
+    await protocol.handle_request(JsonRPCRequest(id=2, method="other", params=None))
+    assert protocol.sended_message == JsonRPCResponse(id=2, result=False)
@@ -0,0 +1,45 @@
+import asyncio
+import os
+import sys
+import threading
+from typing import List
+
+import pytest
+
+from robotcode.jsonrpc2.server import JsonRPCServer
+
+
+class DummyJsonRPCServer(JsonRPCServer[asyncio.Protocol]):
+    def create_protocol(self) -> asyncio.Protocol:
+        return asyncio.Protocol()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the stdio reader blocks in read on windows")
+@pytest.mark.asyncio
+async def test_close_should_unblock_a_stdio_reader_waiting_on_a_pipe() -> None:
+    read_fd, write_fd = os.pipe()
+    received: List[bytes] = []
+    data_event = threading.Event()
+
+    def data_received(data: bytes) -> None:
+        received.append(data)
+        data_event.set()
+
+    server = DummyJsonRPCServer()
+    stop_event = server._stdio_stop_event = threading.Event()
+
+    with os.fdopen(read_fd, "rb") as rfile:
+        thread = threading.Thread(target=server._read_stdio, args=(rfile, stop_event, data_received), daemon=True)
+        thread.start()
+        try:
+            os.write(write_fd, b"data")
+            assert data_event.wait(5)
+            assert received == [b"data"]
+
+            server.close()
+
+            thread.join(5)
+            assert not thread.is_alive()
+            assert server._stdio_wakeup_fd is None
+        finally:
+            os.close(write_fd)
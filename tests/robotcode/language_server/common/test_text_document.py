@@ -340,3 +340,87 @@ third
     del dummy
 
     assert len(document._cache) == 0
+
+
+def test_apply_incremental_change_should_update_only_the_changed_lines() -> None:
+    document = TextDocument(
+        document_uri="file:///test.robot",
+        language_id="robotframework",
+        version=1,
+        text="first\nsecond\nthird\n",
+    )
+    lines = document.get_lines()
+
+    document.apply_incremental_change(
+        2,
+        Range(start=Position(line=1, character=3), end=Position(line=2, character=2)),
+        "ond\nnew\nth",
+    )
+
+    assert document.text() == "first\nsecond\nnew\nthird\n"
+    assert document.get_lines() == ["first\n", "second\n", "new\n", "third\n"]
+    assert document.get_lines()[0] is lines[0]
+    assert lines == ["first\n", "second\n", "third\n"]
+
+
+def test_apply_incremental_change_should_join_cr_lf_line_breaks() -> None:
+    document = TextDocument(
+        document_uri="file:///test.robot",
+        language_id="robotframework",
+        version=1,
+        text="first\r\nsecond\r\n",
+    )
+
+    document.apply_incremental_change(
+        2,
+        Range(start=Position(line=0, character=5), end=Position(line=1, character=0)),
+        "\r",
+    )
+    document.apply_incremental_change(
+        3,
+        Range(start=Position(line=1, character=0), end=Position(line=1, character=0)),
+        "\n",
+    )
+
+    assert document.text() == "first\r\nsecond\r\n"
+    assert document.get_lines() == ["first\r\n", "second\r\n"]
+
+
+def test_utf16_positions_should_be_converted_with_multibyte_chars() -> None:
+    document = TextDocument(
+        document_uri="file:///test.robot",
+        language_id="robotframework",
+        version=1,
+        text="a😀b\nc\n",
+    )
+
+    assert document.position_to_utf16(Position(line=0, character=2)) == Position(line=0, character=3)
+    assert document.position_from_utf16(Position(line=0, character=3)) == Position(line=0, character=2)
+    assert document.position_from_utf16(Position(line=0, character=2)) == Position(line=0, character=1)
+    assert document.position_from_utf16(Position(line=1, character=5)) == Position(line=1, character=2)
+    assert document.ranges_to_utf16(
+        [
+            Range(start=Position(line=0, character=1), end=Position(line=0, character=3)),
+            Range(start=Position(line=1, character=0), end=Position(line=1, character=1)),
+        ]
+    ) == [
+        Range(start=Position(line=0, character=1), end=Position(line=0, character=4)),
+        Range(start=Position(line=1, character=0), end=Position(line=1, character=1)),
+    ]
+
+
+def test_utf16_positions_should_be_updated_after_incremental_change() -> None:
+    document = TextDocument(
+        document_uri="file:///test.robot",
+        language_id="robotframework",
+        version=1,
+        text="abc\ndef\n",
+    )
+    assert document.position_to_utf16(Position(line=1, character=3)) == Position(line=1, character=3)
+
+    document.apply_incremental_change(
+        2, Range(start=Position(line=1, character=0), end=Position(line=1, character=0)), "😀"
+    )
+
+    assert document.position_to_utf16(Position(line=1, character=4)) == Position(line=1, character=5)
+    assert document.position_to_utf16(Position(line=0, character=3)) == Position(line=0, character=3)
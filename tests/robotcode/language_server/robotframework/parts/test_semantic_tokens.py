@@ -1,9 +1,12 @@
+import dataclasses
 import functools
 from pathlib import Path
+from typing import List
 
 import pytest
 import yaml
 
+from robotcode.core.lsp.types import Position, Range, SemanticTokens, SemanticTokensDelta
 from robotcode.core.text_document import TextDocument
 from robotcode.language_server.robotframework.protocol import (
     RobotLanguageServerProtocol,
@@ -37,4 +40,80 @@ def test(
         test_document,
     )
 
-    regtest.write(yaml.dump({"result": result}))
+    assert isinstance(result, SemanticTokens)
+    assert result.result_id is not None
+
+    regtest.write(yaml.dump({"result": dataclasses.replace(result, result_id=None)}))
+
+
+def test_full_delta_should_return_edits_to_the_previous_result(protocol: RobotLanguageServerProtocol) -> None:
+    document = protocol.documents._append_document(
+        (base_path / "__semantic_tokens_delta__.robot").as_uri(),
+        "robotframework",
+        "*** Test Cases ***\nfirst\n    Log    hello\n\nsecond\n    No Operation\n",
+        1,
+    )
+    try:
+        semantic_tokens = protocol.robot_semantic_tokens
+
+        full = semantic_tokens.collect_full(semantic_tokens, document)
+        assert isinstance(full, SemanticTokens)
+        assert full.result_id is not None
+
+        unchanged = semantic_tokens.collect_full_delta(semantic_tokens, document, full.result_id)
+        assert isinstance(unchanged, SemanticTokensDelta)
+        assert unchanged.edits == []
+
+        document.apply_incremental_change(2, Range(Position(3, 0), Position(3, 0)), "    Log    world\n")
+
+        delta = semantic_tokens.collect_full_delta(semantic_tokens, document, full.result_id)
+        assert isinstance(delta, SemanticTokensDelta)
+        assert delta.result_id != full.result_id
+        assert len(delta.edits) == 1
+
+        data: List[int] = list(full.data)
+        for edit in delta.edits:
+            data[edit.start : edit.start + edit.delete_count] = edit.data or []
+
+        assert data == semantic_tokens._collect(document, None).data  # type: ignore[union-attr]
+
+        unknown = semantic_tokens.collect_full_delta(semantic_tokens, document, "unknown")
+        assert isinstance(unknown, SemanticTokens)
+        assert unknown.data == data
+    finally:
+        protocol.documents.close_document(document, True)
+
+
+def _decode(data: List[int]) -> List[List[int]]:
+    result: List[List[int]] = []
+    line = 0
+    col = 0
+    for i in range(0, len(data), 5):
+        delta_line, delta_col, length, token_type, modifiers = data[i : i + 5]
+        col = col + delta_col if delta_line == 0 else delta_col
+        line += delta_line
+        result.append([line, col, length, token_type, modifiers])
+    return result
+
+
+def test_range_should_only_contain_tokens_in_the_range(protocol: RobotLanguageServerProtocol) -> None:
+    document = protocol.documents._append_document(
+        (base_path / "__semantic_tokens_range__.robot").as_uri(),
+        "robotframework",
+        "*** Test Cases ***\nfirst\n    Log    hello\n\nsecond\n    No Operation\n    Log    world\n\n"
+        "third\n    Fail    bye\n\n*** Keywords ***\nmy keyword\n    No Operation\n",
+        1,
+    )
+    try:
+        semantic_tokens = protocol.robot_semantic_tokens
+
+        full = semantic_tokens.collect_full(semantic_tokens, document)
+        assert isinstance(full, SemanticTokens)
+
+        result = semantic_tokens.collect_range(semantic_tokens, document, Range(Position(4, 0), Position(7, 0)))
+        assert isinstance(result, SemanticTokens)
+
+        assert _decode(result.data) == [t for t in _decode(full.data) if 4 <= t[0] < 7]
+        assert _decode(result.data)
+    finally:
+        protocol.documents.close_document(document, True)
@@ -0,0 +1,118 @@
+import dataclasses
+import threading
+from pathlib import Path
+from typing import Any, List, cast
+
+import pytest
+
+from robotcode.core.concurrent import run_as_interactive_task
+from robotcode.core.text_document import TextDocument
+from robotcode.language_server.common.parts.diagnostics import DiagnosticsCollectType
+from robotcode.language_server.robotframework.analysis_worker import DocumentAnalysisResult
+from robotcode.language_server.robotframework.configuration import AnalysisConfig
+from robotcode.language_server.robotframework.protocol import (
+    RobotLanguageServerProtocol,
+)
+from robotcode.robot.diagnostics.workspace_config import CacheConfig
+
+data_path = Path(Path(__file__).parent, "data/tests/hover.robot")
+
+
+def test_workspace_diagnostics_should_pause_for_interactive_requests(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    diagnostics = protocol.diagnostics
+    document = protocol.documents.get_or_open_document(data_path, "robotframework")
+
+    analyzed: List[TextDocument] = []
+    document_analyzed = threading.Event()
+    loop_started = threading.Event()
+    analyse_document = diagnostics._analyse_document
+
+    def record(doc: TextDocument) -> Any:
+        analyzed.append(doc)
+        document_analyzed.set()
+        return analyse_document(doc)
+
+    def on_analyze(sender: Any) -> None:
+        loop_started.set()
+
+    monkeypatch.setattr(diagnostics, "_analyse_document", record)
+    monkeypatch.setattr(diagnostics, "_max_interactive_pause", 30)
+    diagnostics.on_workspace_diagnostics_analyze.add(on_analyze)
+
+    release = threading.Event()
+    request = run_as_interactive_task(release.wait, 30)
+    try:
+        diagnostics.force_refresh_document(document, refresh=False)
+
+        assert loop_started.wait(30)
+        assert not document_analyzed.wait(0.5)
+        assert analyzed == []
+
+        release.set()
+        request.result(30)
+
+        assert document_analyzed.wait(30)
+        assert analyzed == [document]
+    finally:
+        release.set()
+        diagnostics.on_workspace_diagnostics_analyze.remove(on_analyze)
+
+
+def test_closed_documents_should_be_analyzed_in_worker_processes(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    (tmp_path / "keywords.resource").write_text("*** Keywords ***\nDo Something\n    No Operation\n")
+    for name in ("first.robot", "second.robot"):
+        (tmp_path / name).write_text(
+            "*** Settings ***\nResource    keywords.resource\n\n"
+            "*** Test Cases ***\nFirst\n    Do Something\n    Do Nothing\n"
+        )
+
+    config = dataclasses.replace(protocol.workspace.get_configuration(AnalysisConfig), workers=2)
+    monkeypatch.setitem(protocol.workspace._settings_cache, (None, AnalysisConfig.__config_section__), config)
+
+    resource = protocol.documents.get_or_open_document(tmp_path / "keywords.resource", "robotframework")
+    documents = [
+        protocol.documents.get_or_open_document(tmp_path / name, "robotframework")
+        for name in ("first.robot", "second.robot")
+    ]
+    try:
+        tasks = protocol.robot_diagnostics.analyze_in_workers(None, documents)
+
+        assert tasks is not None
+        assert set(tasks) == set(documents)
+        for task in tasks.values():
+            task.result(120)
+
+        for document in documents:
+            assert document.get_data(DocumentAnalysisResult) is not None
+            assert protocol.documents_cache.get_only_initialized_namespace(document) is None
+
+            result = protocol.robot_diagnostics.collect_namespace_diagnostics(
+                None, document, DiagnosticsCollectType.NORMAL
+            )
+            assert [d.code for d in result.diagnostics or []] == ["KeywordNotFound"]
+
+        keyword = next(iter(protocol.documents_cache.get_namespace(resource).get_library_doc().keywords.values()))
+        candidates = protocol.documents_cache.reference_index.keyword_candidates(keyword)
+        assert all(str(document.uri) in candidates.hits for document in documents)
+
+        resource.apply_full_change(None, "*** Keywords ***\nDo Nothing\n    No Operation\n")
+
+        assert all(document.get_data(DocumentAnalysisResult) is None for document in documents)
+        assert not any(protocol.documents_cache.reference_index.is_indexed(str(d.uri)) for d in documents)
+    finally:
+        for document in [resource, *documents]:
+            protocol.documents.close_document(document, True)
+
+
+def test_analysis_workers_should_load_libraries_in_a_single_library_worker(
+    protocol: RobotLanguageServerProtocol,
+) -> None:
+    config = protocol.robot_diagnostics._create_analysis_worker_config()
+
+    assert config.analysis_config.cache.library_workers == 1
+    assert config.folders
+    assert all(cast(CacheConfig, folder.configs[CacheConfig]).library_workers == 1 for folder in config.folders)
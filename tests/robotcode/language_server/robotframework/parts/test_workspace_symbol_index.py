@@ -0,0 +1,52 @@
+import pickle
+
+from robotcode.core.lsp.types import Range, SymbolKind
+from robotcode.language_server.robotframework.parts.workspace_symbols import (
+    DocumentWorkspaceSymbols,
+    WorkspaceSymbolEntry,
+    WorkspaceSymbolIndex,
+)
+
+
+def _entry(name: str) -> WorkspaceSymbolEntry:
+    return WorkspaceSymbolEntry(name, SymbolKind.FUNCTION, Range.zero())
+
+
+def test_search_should_rank_exact_prefix_substring_and_subsequence_matches() -> None:
+    index = WorkspaceSymbolIndex()
+    index.update_document(
+        "file:///a.robot",
+        None,
+        [_entry("Log Many Things"), _entry("Do Log"), _entry("Log"), _entry("Login"), _entry("Close Browser")],
+    )
+
+    assert [e.name for _, e in index.search("log")] == ["Log", "Login", "Log Many Things", "Do Log"]
+    assert [e.name for _, e in index.search("lmt")] == ["Log Many Things"]
+    assert index.search("xyz") == []
+
+
+def test_search_should_cap_the_number_of_results() -> None:
+    index = WorkspaceSymbolIndex()
+    index.update_document("file:///a.robot", None, [_entry(f"Keyword {i}") for i in range(100)])
+
+    result = index.search("keyword", 10)
+
+    assert len(result) == 10
+    assert [e.name for _, e in result][:3] == ["Keyword 0", "Keyword 1", "Keyword 2"]
+
+
+def test_loaded_documents_should_not_replace_analysed_ones() -> None:
+    index = WorkspaceSymbolIndex()
+    index.update_document("file:///a.robot", None, [_entry("New")])
+
+    loaded = pickle.loads(
+        pickle.dumps(
+            [
+                DocumentWorkspaceSymbols("file:///a.robot", None, [_entry("Old")]),
+                DocumentWorkspaceSymbols("file:///b.robot", None, [_entry("Other")]),
+            ]
+        )
+    )
+    index.update_documents(loaded)
+
+    assert sorted(e.name for _, e in index.search("")) == ["New", "Other"]
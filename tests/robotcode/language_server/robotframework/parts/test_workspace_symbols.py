@@ -1,4 +1,5 @@
 import dataclasses
+from pathlib import Path
 from typing import List, Union, cast
 
 import pytest
@@ -6,6 +7,8 @@ import yaml
 
 from robotcode.core.lsp.types import Location, SymbolInformation, WorkspaceSymbol
 from robotcode.core.uri import Uri
+from robotcode.language_server.robotframework.analysis_worker import DocumentAnalysisResult
+from robotcode.language_server.robotframework.configuration import AnalysisConfig
 from robotcode.language_server.robotframework.protocol import (
     RobotLanguageServerProtocol,
 )
@@ -46,3 +49,43 @@ def test(
             }
         )
     )
+
+
+def test_documents_analyzed_in_worker_processes_should_be_indexed(
+    protocol: RobotLanguageServerProtocol, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    (tmp_path / "worker_keywords.resource").write_text("*** Keywords ***\nWorker Keyword\n    No Operation\n")
+    (tmp_path / "worker_suite.robot").write_text(
+        "*** Settings ***\nResource    worker_keywords.resource\n\n"
+        "*** Test Cases ***\nWorker Test\n    Worker Keyword\n"
+    )
+
+    config = dataclasses.replace(protocol.workspace.get_configuration(AnalysisConfig), workers=2)
+    monkeypatch.setitem(protocol.workspace._settings_cache, (None, AnalysisConfig.__config_section__), config)
+
+    documents = [
+        protocol.documents.get_or_open_document(tmp_path / name, "robotframework")
+        for name in ("worker_keywords.resource", "worker_suite.robot")
+    ]
+    try:
+        tasks = protocol.robot_diagnostics.analyze_in_workers(None, documents)
+
+        assert tasks is not None
+        for task in tasks.values():
+            task.result(120)
+
+        for document in documents:
+            assert document.get_data(DocumentAnalysisResult) is not None
+            assert protocol.documents_cache.get_only_initialized_namespace(document) is None
+
+        result = protocol.robot_workspace_symbols.collect(protocol.robot_workspace_symbols, query="worker")
+
+        assert result is not None
+        assert sorted(
+            (Uri(v.location.uri).to_path().name, v.name)
+            for v in result
+            if Uri(v.location.uri).to_path().parent == tmp_path
+        ) == [("worker_keywords.resource", "Worker Keyword"), ("worker_suite.robot", "Worker Test")]
+    finally:
+        for document in documents:
+            protocol.documents.close_document(document, True)
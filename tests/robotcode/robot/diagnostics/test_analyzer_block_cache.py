@@ -0,0 +1,195 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+import pytest
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.text_document import TextDocument
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.entities import ArgumentDefinition
+from robotcode.robot.diagnostics.namespace import Namespace
+from robotcode.robot.diagnostics.namespace_analyzer import AnalyzerBlockCache, AnalyzerResult, NamespaceAnalyzer
+
+SOURCE = """\
+*** Settings ***
+Library    Collections
+
+*** Variables ***
+${A}    1
+
+*** Test Cases ***
+First
+    Do Something    ${A}
+    Log    ${unknown}
+
+Second
+    [Tags]    smoke
+    ${list}    Create List    1    2
+    Append To List    ${list}    3
+
+*** Keywords ***
+Do Something
+    [Arguments]    ${x}
+    Log    ${x}
+    Unknown Keyword
+"""
+
+
+@pytest.fixture
+def helper(tmp_path: Path) -> DocumentsCacheHelper:
+    workspace = Workspace(Uri.from_path(tmp_path), [WorkspaceFolder(tmp_path.name, Uri.from_path(tmp_path))])
+    return DocumentsCacheHelper(workspace, workspace.documents, FileWatcherManagerDummy(), None, None)
+
+
+@pytest.fixture
+def document(tmp_path: Path) -> TextDocument:
+    path = tmp_path / "test.robot"
+    path.write_text(SOURCE)
+
+    result = TextDocument(str(Uri.from_path(path)), SOURCE, "robotframework", 1)
+    result.opened_in_editor = True
+    return result
+
+
+def _dump(result: Any) -> Tuple[Any, ...]:
+    return (
+        [(d.range, d.message, d.severity, d.code) for d in result.diagnostics],
+        {(k.name, k.line_no, k.source): sorted(str(v) for v in v) for k, v in result.keyword_references.items()},
+        {k: sorted(str(v) for v in v) for k, v in result.variable_references.items()},
+        {k: sorted(str(v) for v in v) for k, v in result.local_variable_assignments.items()},
+        {k: sorted(str(v) for v in v) for k, v in result.namespace_references.items()},
+        result.test_case_definitions,
+        result.tag_definitions,
+    )
+
+
+def _analyze(namespace: Namespace, monkeypatch: pytest.MonkeyPatch) -> AnalyzerResult:
+    results: List[AnalyzerResult] = []
+    run = NamespaceAnalyzer.run
+
+    def record(self: NamespaceAnalyzer) -> AnalyzerResult:
+        results.append(run(self))
+        return results[-1]
+
+    with monkeypatch.context() as m:
+        m.setattr(NamespaceAnalyzer, "run", record)
+        namespace.analyze()
+
+    return results[0]
+
+
+def _analyze_without_cache(namespace: Namespace) -> AnalyzerResult:
+    return NamespaceAnalyzer(namespace.model, namespace, namespace.create_finder()).run()
+
+
+def _count_analyzed_blocks(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    analyzed: List[str] = []
+
+    def wrap(name: str) -> None:
+        original = getattr(NamespaceAnalyzer, name)
+
+        def analyze(self: NamespaceAnalyzer, node: Any) -> None:
+            analyzed.append(node.name)
+            original(self, node)
+
+        monkeypatch.setattr(NamespaceAnalyzer, name, analyze)
+
+    wrap("_analyze_test_case")
+    wrap("_analyze_keyword")
+    return analyzed
+
+
+def test_only_the_changed_block_should_be_analyzed_again(
+    helper: DocumentsCacheHelper, document: TextDocument, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    analyzed = _count_analyzed_blocks(monkeypatch)
+
+    _analyze(helper.get_namespace(document), monkeypatch)
+    assert analyzed == ["First", "Second", "Do Something"]
+    assert len(document.get_data(AnalyzerBlockCache)) == 3
+
+    analyzed.clear()
+    document.apply_full_change(None, SOURCE.replace("${list}    3", "${list}    4"))
+    namespace = helper.get_namespace(document)
+    result = _analyze(namespace, monkeypatch)
+
+    assert analyzed == ["Second"]
+    assert _dump(result) == _dump(_analyze_without_cache(namespace))
+
+
+def test_cached_results_should_refer_to_the_current_keywords(
+    helper: DocumentsCacheHelper, document: TextDocument, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _analyze(helper.get_namespace(document), monkeypatch)
+
+    document.apply_full_change(None, SOURCE.replace("Log    ${unknown}", "Log    ${A}"))
+    namespace = helper.get_namespace(document)
+    result = _analyze(namespace, monkeypatch)
+
+    own_keyword = next(iter(namespace.get_library_doc().keywords.keywords))
+    assert any(k is own_keyword and v for k, v in result.keyword_references.items())
+    assert _dump(result) == _dump(_analyze_without_cache(namespace))
+
+
+@pytest.mark.parametrize(
+    ("changed", "expected"),
+    [
+        (SOURCE.replace("    Log    ${unknown}\n", "    Log    ${unknown}\n    No Operation\n"), ["First"]),
+        (SOURCE.replace("    Log    ${unknown}\n", ""), ["First"]),
+        (SOURCE.replace("    [Tags]    smoke\n", "    [Tags]    smoke\n\n    # comment\n"), ["Second"]),
+    ],
+)
+def test_moved_blocks_should_not_be_analyzed_again(
+    helper: DocumentsCacheHelper,
+    document: TextDocument,
+    monkeypatch: pytest.MonkeyPatch,
+    changed: str,
+    expected: List[str],
+) -> None:
+    _analyze(helper.get_namespace(document), monkeypatch)
+
+    analyzed = _count_analyzed_blocks(monkeypatch)
+    document.apply_full_change(None, changed)
+    namespace = helper.get_namespace(document)
+    result = _analyze(namespace, monkeypatch)
+
+    assert analyzed == expected
+    assert _dump(result) == _dump(_analyze_without_cache(namespace))
+
+    own_keyword = next(iter(namespace.get_library_doc().keywords.keywords))
+    assert any(k is own_keyword and v for k, v in result.keyword_references.items())
+    assert all(v.keyword_doc is own_keyword for v in result.variable_references if isinstance(v, ArgumentDefinition))
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        SOURCE.replace("${A}    1", "${B}    1"),
+        SOURCE.replace("Library    Collections", "Library    String"),
+        SOURCE.replace("    [Arguments]    ${x}", "    [Arguments]    ${x}    ${y}=1"),
+    ],
+)
+def test_changed_context_should_analyze_all_blocks(
+    helper: DocumentsCacheHelper, document: TextDocument, monkeypatch: pytest.MonkeyPatch, changed: str
+) -> None:
+    _analyze(helper.get_namespace(document), monkeypatch)
+
+    analyzed = _count_analyzed_blocks(monkeypatch)
+    document.apply_full_change(None, changed)
+    namespace = helper.get_namespace(document)
+    result = _analyze(namespace, monkeypatch)
+
+    assert analyzed == ["First", "Second", "Do Something"]
+    assert _dump(result) == _dump(_analyze_without_cache(namespace))
+
+
+def test_documents_not_opened_in_an_editor_should_not_cache_blocks(
+    helper: DocumentsCacheHelper, document: TextDocument, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    document.opened_in_editor = False
+
+    _analyze(helper.get_namespace(document), monkeypatch)
+
+    assert document.get_data(AnalyzerBlockCache) is None
@@ -0,0 +1,208 @@
+import os
+import pickle
+import sqlite3
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from robotcode.robot.diagnostics import data_cache
+from robotcode.robot.diagnostics.data_cache import (
+    CacheSection,
+    CacheStorage,
+    JsonDataCache,
+    PickleDataCache,
+    SqliteDataCache,
+    create_data_cache,
+)
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> SqliteDataCache:
+    return SqliteDataCache(tmp_path / "cache")
+
+
+def test_sqlite_cache_should_read_saved_data(cache: SqliteDataCache) -> None:
+    assert not cache.cache_data_exists(CacheSection.LIBRARY, "BuiltIn.spec")
+
+    cache.save_cache_data(CacheSection.LIBRARY, "BuiltIn.spec", LibraryDoc(name="BuiltIn"))
+
+    assert cache.cache_data_exists(CacheSection.LIBRARY, "BuiltIn.spec")
+    assert not cache.cache_data_exists(CacheSection.VARIABLES, "BuiltIn.spec")
+    assert cache.read_cache_data(CacheSection.LIBRARY, "BuiltIn.spec", LibraryDoc).name == "BuiltIn"
+    assert list(cache.cache_dir.iterdir()) != []
+    assert (cache.cache_dir / ".gitignore").exists()
+
+    with pytest.raises(TypeError):
+        cache.read_cache_data(CacheSection.LIBRARY, "BuiltIn.spec", str)
+
+    with pytest.raises(KeyError):
+        cache.read_cache_data(CacheSection.LIBRARY, "Unknown.spec", LibraryDoc)
+
+
+def test_sqlite_cache_should_be_shared_between_connections(cache: SqliteDataCache) -> None:
+    other = SqliteDataCache(cache.cache_dir)
+
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "first")
+    assert other.read_cache_data(CacheSection.LIBRARY, "a", str) == "first"
+
+    other.save_cache_data(CacheSection.LIBRARY, "a", "second")
+    assert cache.read_cache_data(CacheSection.LIBRARY, "a", str) == "second"
+
+    other.close()
+
+
+def test_sqlite_cache_should_ignore_entries_of_other_versions(
+    cache: SqliteDataCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+
+    monkeypatch.setattr(SqliteDataCache, "FORMAT_VERSION", SqliteDataCache.FORMAT_VERSION + 1)
+
+    assert not cache.cache_data_exists(CacheSection.LIBRARY, "a")
+    assert cache.prune() == 1
+    assert cache.stats().entries == 0
+
+
+def test_sqlite_cache_stats_and_prune(cache: SqliteDataCache) -> None:
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+    cache.save_cache_data(CacheSection.LIBRARY, "b", "data")
+    cache.save_cache_data(CacheSection.VARIABLES, "c", "data")
+
+    stats = cache.stats()
+    assert stats.entries == 3
+    assert stats.size > 0
+    assert stats.sections == {CacheSection.LIBRARY.value: 2, CacheSection.VARIABLES.value: 1}
+
+    assert cache.prune(max_age=60) == 0
+
+    time.sleep(0.01)
+    assert cache.prune(max_age=0, sections=[CacheSection.VARIABLES]) == 1
+    assert cache.stats().sections == {CacheSection.LIBRARY.value: 2}
+
+
+def test_sqlite_cache_should_reopen_after_close(cache: SqliteDataCache) -> None:
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+    cache.close()
+
+    assert cache.read_cache_data(CacheSection.LIBRARY, "a", str) == "data"
+
+
+@pytest.mark.parametrize(
+    ("storage", "cache_type"),
+    [
+        (CacheStorage.PICKLE, PickleDataCache),
+        (CacheStorage.JSON, JsonDataCache),
+        (CacheStorage.SQLITE, SqliteDataCache),
+    ],
+)
+def test_create_data_cache_should_select_the_storage(tmp_path: Path, storage: CacheStorage, cache_type: type) -> None:
+    assert type(create_data_cache(storage, tmp_path)) is cache_type
+
+
+def test_sqlite_cache_prune_should_remove_the_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = SqliteDataCache(tmp_path, track_access=True)
+
+    for name in ("a", "b", "c"):
+        cache.save_cache_data(CacheSection.LIBRARY, name, "x" * 1000)
+        time.sleep(0.01)
+
+    cache.read_cache_data(CacheSection.LIBRARY, "a", str)
+    entry_size = cache.stats().size // 3
+
+    assert cache.prune(max_size=entry_size * 2) == 1
+    assert not cache.cache_data_exists(CacheSection.LIBRARY, "b")
+    assert cache.cache_data_exists(CacheSection.LIBRARY, "a")
+    assert cache.cache_data_exists(CacheSection.LIBRARY, "c")
+
+
+def test_sqlite_cache_prune_should_only_count_the_size_of_the_given_sections(tmp_path: Path) -> None:
+    cache = SqliteDataCache(tmp_path, track_access=True)
+
+    cache.save_cache_data(CacheSection.VARIABLES, "vars", "x" * 1000)
+    time.sleep(0.01)
+    cache.save_cache_data(CacheSection.LIBRARY, "lib", "x" * 1000)
+    entry_size = cache.stats().size // 2
+
+    assert cache.prune(max_size=entry_size, sections=[CacheSection.VARIABLES]) == 0
+    assert cache.cache_data_exists(CacheSection.VARIABLES, "vars")
+    assert cache.cache_data_exists(CacheSection.LIBRARY, "lib")
+
+
+def test_sqlite_cache_used_size_should_not_count_freed_pages(cache: SqliteDataCache) -> None:
+    for name in ("a", "b", "c"):
+        cache.save_cache_data(CacheSection.LIBRARY, name, os.urandom(10000))
+
+    size = cache.used_size()
+    assert size >= cache.stats().size
+
+    cache.prune(max_size=0)
+
+    assert cache.stats().size == 0
+    assert cache.used_size() < size - 20000
+
+
+def test_sqlite_cache_should_use_a_write_ahead_log_on_local_file_systems(cache: SqliteDataCache) -> None:
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+
+    assert cache.journal_mode == "wal"
+
+
+def test_sqlite_cache_should_not_use_a_write_ahead_log_on_network_file_systems(
+    cache: SqliteDataCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_cache, "_is_remote_path", lambda path: True)
+
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+
+    assert cache.journal_mode == "delete"
+    assert cache.read_cache_data(CacheSection.LIBRARY, "a", str) == "data"
+    assert not (cache.cache_dir / (SqliteDataCache.FILE_NAME + "-wal")).exists()
+
+
+def test_sqlite_cache_should_migrate_a_database_without_access_times(tmp_path: Path) -> None:
+    tmp_path.mkdir(exist_ok=True)
+    with closing(sqlite3.connect(str(tmp_path / SqliteDataCache.FILE_NAME))) as connection:
+        connection.execute(
+            "CREATE TABLE entries (section TEXT NOT NULL, name TEXT NOT NULL, version INTEGER NOT NULL, "
+            "data BLOB NOT NULL, modified REAL NOT NULL, PRIMARY KEY (section, name)) WITHOUT ROWID"
+        )
+        connection.execute(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+            (CacheSection.LIBRARY.value, "a", SqliteDataCache.FORMAT_VERSION, zlib.compress(pickle.dumps("old")), 1),
+        )
+        connection.commit()
+
+    cache = SqliteDataCache(tmp_path, track_access=True)
+
+    assert cache.read_cache_data(CacheSection.LIBRARY, "a", str) == "old"
+
+    cache.save_cache_data(CacheSection.LIBRARY, "b", "new")
+
+    assert cache.read_cache_data(CacheSection.LIBRARY, "b", str) == "new"
+    assert cache.prune(max_size=10000) == 0
+    cache.close()
+
+    with closing(sqlite3.connect(str(tmp_path / SqliteDataCache.FILE_NAME))) as connection:
+        assert connection.execute("PRAGMA user_version").fetchone()[0] == SqliteDataCache.SCHEMA_VERSION
+
+
+def test_sqlite_cache_should_write_access_times_in_batches(tmp_path: Path) -> None:
+    cache = SqliteDataCache(tmp_path, track_access=True)
+    cache.save_cache_data(CacheSection.LIBRARY, "a", "data")
+
+    def get_accessed() -> float:
+        with closing(sqlite3.connect(str(cache.cache_file))) as connection:
+            return float(connection.execute("SELECT accessed FROM entries WHERE name = 'a'").fetchone()[0])
+
+    saved = get_accessed()
+    time.sleep(0.01)
+
+    cache.read_cache_data(CacheSection.LIBRARY, "a", str)
+    assert get_accessed() == saved
+
+    cache.close()
+    assert get_accessed() > saved
@@ -0,0 +1,137 @@
+import gc
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.lsp.types import FileChangeType, FileEvent
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.import_graph import ImportGraph
+from robotcode.robot.diagnostics.namespace import Namespace
+
+
+def test_importers_should_be_found_transitively(tmp_path: Path) -> None:
+    suite, first, second, other = (str(tmp_path / n) for n in ("suite.robot", "a.resource", "b.resource", "o.robot"))
+
+    graph = ImportGraph()
+    graph.update({suite: [first], first: [second], other: [first]})
+
+    assert graph.get_importers([second]) == {first, suite, other}
+    assert graph.get_importers([second], transitive=False) == {first}
+    assert graph.get_importers([suite]) == set()
+    assert graph.get_reverse_graph() == {first: sorted([suite, other]), second: [first]}
+
+
+def test_updated_imports_should_replace_the_previous_imports(tmp_path: Path) -> None:
+    suite, first, second = (str(tmp_path / n) for n in ("suite.robot", "a.resource", "b.resource"))
+
+    graph = ImportGraph()
+    graph.update({suite: [first, second]})
+    graph.update({suite: [second]})
+
+    assert graph.get_importers([first]) == set()
+    assert graph.get_importers([second]) == {suite}
+
+    graph.update({suite: []})
+
+    assert graph.get_reverse_graph() == {}
+
+
+def test_cyclic_imports_should_not_loop(tmp_path: Path) -> None:
+    first, second = (str(tmp_path / n) for n in ("a.resource", "b.resource"))
+
+    graph = ImportGraph()
+    graph.update({first: [second], second: [first]})
+
+    assert graph.get_importers([first]) == {first, second}
+
+
+FILES = {
+    "suite.robot": "*** Settings ***\nResource    a.resource\n",
+    "a.resource": "*** Settings ***\nResource    b.resource\n",
+    "b.resource": "*** Keywords ***\nDo Something\n    No Operation\n",
+    "other.robot": "*** Settings ***\nLibrary    Collections\n",
+    "missing.robot": "*** Settings ***\nResource    new.resource\nLibrary    new_lib\n",
+}
+
+
+def _read_document_text(sender: Any, uri: Uri) -> Optional[str]:
+    return uri.to_path().read_text()
+
+
+@pytest.fixture
+def helper(tmp_path: Path) -> DocumentsCacheHelper:
+    for name, text in FILES.items():
+        (tmp_path / name).write_text(text)
+
+    workspace = Workspace(Uri.from_path(tmp_path), [WorkspaceFolder(tmp_path.name, Uri.from_path(tmp_path))])
+    workspace.documents.on_read_document_text.add(_read_document_text)
+
+    return DocumentsCacheHelper(workspace, workspace.documents, FileWatcherManagerDummy(), None, None)
+
+
+def _initialize_namespaces(helper: DocumentsCacheHelper, tmp_path: Path) -> Dict[str, Namespace]:
+    result = {}
+    for name in FILES:
+        document = helper.documents_manager.get_or_open_document(tmp_path / name)
+        result[name] = helper.get_namespace(document)
+        result[name].ensure_initialized()
+
+    return result
+
+
+def test_changed_resource_should_invalidate_only_its_importers(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _initialize_namespaces(helper, tmp_path)
+    imports_manager = helper.get_imports_manager(namespaces["suite.robot"].document)  # type: ignore[arg-type]
+
+    assert imports_manager.get_importers([str(tmp_path / "b.resource")]) == {
+        str(tmp_path / "a.resource"),
+        str(tmp_path / "suite.robot"),
+    }
+
+    imports_manager.did_change_watched_files(
+        None, [FileEvent(str(Uri.from_path(tmp_path / "b.resource")), FileChangeType.CHANGED)]
+    )
+
+    assert namespaces["suite.robot"].invalid
+    assert namespaces["a.resource"].invalid
+    assert not namespaces["b.resource"].invalid
+    assert not namespaces["other.robot"].invalid
+
+
+@pytest.mark.parametrize("name", ["new.resource", "new_lib.py", "new_lib/__init__.py"])
+def test_created_file_should_invalidate_only_namespaces_with_unresolved_imports(
+    helper: DocumentsCacheHelper, tmp_path: Path, name: str
+) -> None:
+    namespaces = _initialize_namespaces(helper, tmp_path)
+
+    helper.documents_manager.did_create_uri(None, str(Uri.from_path(tmp_path / "unrelated.resource")))
+
+    assert not any(n.invalid for n in namespaces.values())
+
+    helper.documents_manager.did_create_uri(None, str(Uri.from_path(tmp_path / name)))
+
+    assert namespaces["missing.robot"].invalid
+    assert not any(n.invalid for k, n in namespaces.items() if k != "missing.robot")
+
+
+def test_namespaces_of_released_documents_should_be_removed(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _initialize_namespaces(helper, tmp_path)
+    imports_manager = helper.get_imports_manager(namespaces["suite.robot"].document)  # type: ignore[arg-type]
+
+    other = str(tmp_path / "other.robot")
+    assert other in imports_manager._namespaces
+
+    namespaces["other.robot"].document.clear()  # type: ignore[union-attr]
+    namespaces["suite.robot"].invalidate()
+    namespaces.clear()
+    gc.collect()
+
+    document = helper.documents_manager.get_or_open_document(tmp_path / "suite.robot")
+    helper.get_namespace(document).ensure_initialized()
+
+    assert other not in imports_manager._namespaces
+    assert all(imports_manager._namespaces.values())
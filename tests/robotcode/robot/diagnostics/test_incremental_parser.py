@@ -0,0 +1,171 @@
+import ast
+import io
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+from robot.api import Token, get_tokens
+from robot.parsing.model.statements import Statement
+from robot.parsing.parser.parser import _get_model
+
+from robotcode.robot.diagnostics.incremental_parser import IncrementalParser
+from robotcode.robot.utils import get_robot_version
+
+SOURCE = """\
+*** Settings ***
+Library    Collections
+
+*** Variables ***
+${A}    1
+
+*** Test Cases ***
+First
+    Log    ${A}
+    FOR    ${i}    IN RANGE    2
+        Log    ${i}
+    END
+
+Second
+    [Tags]    smoke
+    # a comment
+    IF    $A    Log    inline
+
+*** Keywords ***
+Do Something
+    [Arguments]    ${x}
+    Log    ${x}
+"""
+
+
+def _lex(data_only: bool) -> Any:
+    def lex(text: str) -> List[Token]:
+        with io.StringIO(text) as content:
+            return list(get_tokens(content, data_only=data_only))
+
+    return lex
+
+
+def _parse(tokens: List[Token]) -> ast.AST:
+    def get(source: str, data_only: bool = False, lang: Any = None) -> Iterator[Token]:
+        yield from tokens
+
+    if get_robot_version() >= (6, 0):
+        return _get_model(get, "test.robot", False, None, None)  # type: ignore[no-any-return]
+    return _get_model(get, "test.robot", False, None)  # type: ignore[no-any-return]
+
+
+def _dump_tokens(tokens: List[Token]) -> List[Tuple[Any, ...]]:
+    return [(t.type, t.value, t.lineno, t.col_offset, t.error) for t in tokens]
+
+
+def _dump_model(node: Any) -> Any:
+    if isinstance(node, Statement):
+        return (type(node).__name__, _dump_tokens(list(node.tokens)), node.errors)
+
+    return (
+        type(node).__name__,
+        getattr(node, "errors", ()),
+        [
+            [_dump_model(v) for v in value] if isinstance(value, list) else _dump_model(value)
+            for value in (getattr(node, f, None) for f in node._fields)
+            if isinstance(value, (list, ast.AST))
+        ],
+    )
+
+
+def _parse_with(parser: IncrementalParser, lines: List[str], data_only: bool) -> Tuple[List[Token], ast.AST]:
+    tokens = parser.get_tokens(lines, _lex(data_only))
+    return tokens, parser.get_model(tokens, _parse)
+
+
+@pytest.mark.parametrize("data_only", [False, True])
+@pytest.mark.parametrize("line", [4, 5, *range(7, 18), *range(19, 22)])
+def test_single_line_edit_should_produce_the_same_result_as_a_full_parse(line: int, data_only: bool) -> None:
+    lines = SOURCE.splitlines(True)
+    parser = IncrementalParser()
+    _parse_with(parser, lines, data_only)
+
+    lines = list(lines)
+    lines[line] = lines[line].rstrip("\n") + "    changed\n"
+    tokens, model = _parse_with(parser, lines, data_only)
+
+    expected_tokens = _lex(data_only)("".join(lines))
+    assert parser.last_change is not None
+    assert _dump_tokens(tokens) == _dump_tokens(expected_tokens)
+    assert _dump_model(model) == _dump_model(_parse(expected_tokens))
+
+
+@pytest.mark.parametrize("data_only", [False, True])
+def test_inserted_and_removed_lines_should_shift_the_following_blocks(data_only: bool) -> None:
+    lines = SOURCE.splitlines(True)
+    parser = IncrementalParser()
+    _parse_with(parser, lines, data_only)
+
+    for new_lines in (
+        [*lines[:9], "    Log    new\n", "\n", "New Test\n", *lines[9:]],
+        [*lines[:14], *lines[16:]],
+    ):
+        tokens, model = _parse_with(parser, new_lines, data_only)
+
+        expected_tokens = _lex(data_only)("".join(new_lines))
+        assert parser.last_change is not None
+        assert _dump_tokens(tokens) == _dump_tokens(expected_tokens)
+        assert _dump_model(model) == _dump_model(_parse(expected_tokens))
+
+
+def test_unchanged_lines_should_reuse_tokens_and_model() -> None:
+    lines = SOURCE.splitlines(True)
+    parser = IncrementalParser()
+    tokens, model = _parse_with(parser, lines, False)
+
+    new_tokens, new_model = _parse_with(parser, list(lines), False)
+
+    assert new_tokens is tokens
+    assert new_model is model
+
+
+def test_blocks_before_the_edit_should_be_reused() -> None:
+    lines = SOURCE.splitlines(True)
+    parser = IncrementalParser()
+    _, model = _parse_with(parser, lines, True)
+
+    lines = list(lines)
+    lines[20] = "    Log    ${x}    changed\n"
+    _, new_model = _parse_with(parser, lines, True)
+
+    assert new_model is not model
+    assert new_model.sections[2].body[0] is model.sections[2].body[0]  # type: ignore[attr-defined]
+    assert new_model.sections[3].body[0] is not model.sections[3].body[0]  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize(
+    ("line", "text"),
+    [
+        (1, "Library    String\n"),
+        (6, "*** Keywords ***\n"),
+        (9, "*** Comments ***\n"),
+    ],
+)
+def test_changes_of_settings_or_headers_should_lex_the_whole_file(line: int, text: str) -> None:
+    lines = SOURCE.splitlines(True)
+    parser = IncrementalParser()
+    _parse_with(parser, lines, False)
+
+    lines = list(lines)
+    lines[line] = text
+    tokens, _ = _parse_with(parser, lines, False)
+
+    assert parser.last_change is None
+    assert _dump_tokens(tokens) == _dump_tokens(_lex(False)("".join(lines)))
+
+
+def test_files_with_a_test_template_should_always_be_lexed_completely() -> None:
+    lines = ["*** Settings ***\n", "Test Template    Log\n", "\n", *SOURCE.splitlines(True)[6:]]
+    parser = IncrementalParser()
+    _parse_with(parser, lines, False)
+
+    lines = list(lines)
+    lines[5] = "    Other    ${A}\n"
+    tokens, _ = _parse_with(parser, lines, False)
+
+    assert parser.last_change is None
+    assert _dump_tokens(tokens) == _dump_tokens(_lex(False)("".join(lines)))
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from robotcode.robot.diagnostics.entities import LibraryEntry
+from robotcode.robot.diagnostics.keyword_finder import KeywordIndex
+from robotcode.robot.diagnostics.library_doc import KeywordDoc, KeywordStore, LibraryDoc
+
+
+def _entry(name: str, *keywords: str, alias: Optional[str] = None) -> LibraryEntry:
+    library_doc = LibraryDoc(name=name)
+    library_doc.keywords = KeywordStore(
+        keywords=[
+            KeywordDoc(line_no=1, col_offset=0, end_line_no=1, end_col_offset=0, source=None, name=kw)
+            for kw in keywords
+        ]
+    )
+    return LibraryEntry(name=name, import_name=name, library_doc=library_doc, alias=alias)
+
+
+def test_iter_all_should_return_candidates_in_import_order() -> None:
+    first = _entry("First", "Do ${something}", "Open Browser")
+    second = _entry("Second", "open_browser", "Close Browser")
+    index = KeywordIndex([first, second])
+
+    assert [(e.name, k.name) for e, k in index.iter_all("Open Browser")] == [
+        ("First", "Open Browser"),
+        ("Second", "open_browser"),
+    ]
+    assert [(e.name, k.name) for e, k in index.iter_all("Do Close Browser")] == [("First", "Do ${something}")]
+    assert list(index.iter_all("Unknown")) == []
+
+
+def test_iter_owners_should_use_alias_and_normalized_names() -> None:
+    first = _entry("First", "Keyword")
+    second = _entry("Second", "Keyword", alias="My Alias")
+    index = KeywordIndex([first, second])
+
+    assert list(index.iter_owners("first")) == [first]
+    assert list(index.iter_owners("MyAlias")) == [second]
+    assert list(index.iter_owners("Second")) == []
@@ -0,0 +1,156 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.lsp.types import FileChangeType, FileEvent
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.errors import Error
+from robotcode.robot.diagnostics.imports_manager import ImportsManager
+from robotcode.robot.diagnostics.keyword_finder import KeywordFindResult, KeywordLookupCache
+from robotcode.robot.diagnostics.namespace import Namespace
+
+FILES = {
+    "first.robot": "*** Settings ***\nLibrary    first_lib.py\nLibrary    second_lib.py\n",
+    "second.robot": "*** Settings ***\nLibrary    first_lib.py\nLibrary    second_lib.py\n",
+    "other.robot": "*** Settings ***\nLibrary    second_lib.py\nLibrary    first_lib.py\n",
+    "first_lib.py": "def same_keyword():\n    pass\n\n\ndef first_keyword():\n    pass\n",
+    "second_lib.py": "def same_keyword():\n    pass\n\n\ndef second_keyword():\n    pass\n",
+}
+
+
+def _read_document_text(sender: Any, uri: Uri) -> Optional[str]:
+    return uri.to_path().read_text()
+
+
+@pytest.fixture
+def helper(tmp_path: Path) -> DocumentsCacheHelper:
+    for name, text in FILES.items():
+        (tmp_path / name).write_text(text)
+
+    workspace = Workspace(Uri.from_path(tmp_path), [WorkspaceFolder(tmp_path.name, Uri.from_path(tmp_path))])
+    workspace.documents.on_read_document_text.add(_read_document_text)
+
+    return DocumentsCacheHelper(workspace, workspace.documents, FileWatcherManagerDummy(), None, None)
+
+
+def _get_namespaces(helper: DocumentsCacheHelper, tmp_path: Path) -> Dict[str, Namespace]:
+    result = {}
+    for name in FILES:
+        if name.endswith(".robot"):
+            document = helper.documents_manager.get_or_open_document(tmp_path / name)
+            result[name] = helper.get_namespace(document)
+            result[name].ensure_initialized()
+
+    return result
+
+
+def _get_lookup_cache(namespace: Namespace) -> KeywordLookupCache:
+    return namespace.imports_manager.get_keyword_lookup_cache(namespace.get_keyword_index())
+
+
+def _get_imports_manager(helper: DocumentsCacheHelper, namespace: Namespace) -> ImportsManager:
+    return helper.get_imports_manager(namespace.document)  # type: ignore[arg-type]
+
+
+def test_namespaces_with_equal_imports_should_share_a_lookup_cache(
+    helper: DocumentsCacheHelper, tmp_path: Path
+) -> None:
+    namespaces = _get_namespaces(helper, tmp_path)
+
+    cache = _get_lookup_cache(namespaces["first.robot"])
+
+    assert _get_lookup_cache(namespaces["second.robot"]) is cache
+    assert _get_lookup_cache(namespaces["other.robot"]) is not cache
+
+    namespaces["first.robot"].find_keyword("First Keyword")
+
+    assert cache.get("First Keyword") is not None
+    assert len(cache) == 1
+    assert namespaces["second.robot"].find_keyword("First Keyword") is namespaces["first.robot"].find_keyword(
+        "First Keyword"
+    )
+    assert len(cache) == 1
+
+
+def test_other_search_order_should_use_another_lookup_cache(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _get_namespaces(helper, tmp_path)
+
+    cache = _get_lookup_cache(namespaces["first.robot"])
+
+    namespaces["second.robot"]._search_order = ("second_lib",)
+
+    assert _get_lookup_cache(namespaces["second.robot"]) is not cache
+
+    first = namespaces["first.robot"].get_finder().find_keyword_result("Same Keyword")
+    second = namespaces["second.robot"].get_finder().find_keyword_result("Same Keyword")
+
+    assert first.keyword is None
+    assert second.keyword is not None
+    assert second.keyword.source == str(tmp_path / "second_lib.py")
+
+
+def test_changed_library_should_use_another_lookup_cache(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _get_namespaces(helper, tmp_path)
+
+    cache = _get_lookup_cache(namespaces["first.robot"])
+    assert namespaces["first.robot"].get_finder().find_keyword_result("New Keyword").keyword is None
+
+    (tmp_path / "first_lib.py").write_text(FILES["first_lib.py"] + "\n\ndef new_keyword():\n    pass\n")
+    _get_imports_manager(helper, namespaces["first.robot"]).did_change_watched_files(
+        None, [FileEvent(str(Uri.from_path(tmp_path / "first_lib.py")), FileChangeType.CHANGED)]
+    )
+
+    namespace = helper.get_namespace(namespaces["first.robot"].document)  # type: ignore[arg-type]
+    namespace.ensure_initialized()
+
+    assert _get_lookup_cache(namespace) is not cache
+    assert namespace.get_finder().find_keyword_result("New Keyword").keyword is not None
+
+
+def test_canceled_search_should_be_cached_with_its_diagnostics(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _get_namespaces(helper, tmp_path)
+
+    first = namespaces["first.robot"].get_finder().find_keyword_result("Same Keyword")
+
+    cached = _get_lookup_cache(namespaces["first.robot"]).get("Same Keyword")
+    assert cached is not None
+    assert cached.canceled
+
+    second = namespaces["second.robot"].get_finder().find_keyword_result("Same Keyword")
+
+    for result in (first, second):
+        assert result.keyword is None
+        assert [d.code for d in result.diagnostics] == [Error.MULTIPLE_KEYWORDS]
+        assert result.multiple_keywords is not None
+        assert sorted(kw.source or "" for kw in result.multiple_keywords) == [
+            str(tmp_path / "first_lib.py"),
+            str(tmp_path / "second_lib.py"),
+        ]
+
+    assert second == first
+
+
+def test_concurrent_lookups_should_return_the_same_results(helper: DocumentsCacheHelper, tmp_path: Path) -> None:
+    namespaces = _get_namespaces(helper, tmp_path)
+    names = ["First Keyword", "Second Keyword", "Same Keyword", "first_lib.Same Keyword", "Unknown", "Log"] * 20
+
+    # the caches are weakly referenced by the imports manager
+    cache = _get_lookup_cache(namespaces["first.robot"])
+
+    def find(namespace: Namespace) -> List[KeywordFindResult]:
+        finder = namespace.create_finder()
+        return [finder.find_keyword_result(name) for name in names]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(find, [namespaces["first.robot"], namespaces["second.robot"]] * 8))
+
+    expected = [namespaces["first.robot"].create_finder().find_keyword_result(name) for name in names]
+
+    assert all(r == expected for r in results)
+    assert _get_lookup_cache(namespaces["second.robot"]) is cache
+    assert len(cache) == len(set(names))
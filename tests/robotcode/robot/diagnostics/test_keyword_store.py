@@ -0,0 +1,83 @@
+import pickle
+
+import pytest
+
+from robotcode.robot.diagnostics.library_doc import KeywordDoc, KeywordError, KeywordMatcher, KeywordStore
+
+
+def _keyword(name: str) -> KeywordDoc:
+    return KeywordDoc(line_no=1, col_offset=0, end_line_no=1, end_col_offset=0, source="test.resource", name=name)
+
+
+@pytest.fixture
+def store() -> KeywordStore:
+    return KeywordStore(
+        source="test.resource",
+        source_type="RESOURCE",
+        keywords=[
+            _keyword("Open Browser"),
+            _keyword("Open ${thing} Browser"),
+            _keyword("Close Browser"),
+            _keyword("Do ${something}"),
+            _keyword("close_browser"),
+        ],
+    )
+
+
+def test_get_item_should_find_keyword_by_normalized_name(store: KeywordStore) -> None:
+    assert store["open browser"].name == "Open Browser"
+    assert store["OpenBrowser"].name == "Open Browser"
+
+
+def test_get_item_should_find_embedded_keyword(store: KeywordStore) -> None:
+    assert store["Do Something Special"].name == "Do ${something}"
+
+
+def test_get_item_should_raise_key_error_if_not_found(store: KeywordStore) -> None:
+    with pytest.raises(KeyError):
+        store["Unknown Keyword"]
+
+
+def test_get_item_should_raise_keyword_error_for_multiple_matches(store: KeywordStore) -> None:
+    with pytest.raises(KeywordError) as e:
+        store["Close Browser"]
+
+    assert e.value.multiple_keywords is not None
+    assert [k.name for k in e.value.multiple_keywords] == ["Close Browser", "close_browser"]
+
+
+def test_iter_all_should_keep_declaration_order(store: KeywordStore) -> None:
+    assert [k.name for k in store.iter_all("Open Firefox Browser")] == ["Open ${thing} Browser"]
+    assert [k.name for k in store.iter_all("Do Open Browser")] == ["Do ${something}"]
+    assert [k.name for k in store.iter_all("open browser")] == ["Open Browser"]
+
+
+def test_contains_should_support_strings_and_matchers(store: KeywordStore) -> None:
+    assert "Close Browser" in store
+    assert "Do it" in store
+    assert KeywordMatcher("Open Browser") in store
+    assert KeywordMatcher("Do ${something}") in store
+    assert KeywordMatcher("Open Browser", is_namespace=True) not in store
+    assert "Unknown" not in store
+    assert 1 not in store
+
+
+def test_index_should_be_updated_if_keywords_changed(store: KeywordStore) -> None:
+    assert "New Keyword" not in store
+
+    store.keywords.append(_keyword("New Keyword"))
+    assert store["new keyword"].name == "New Keyword"
+
+    store.keywords = [_keyword("Other Keyword")]
+    assert "New Keyword" not in store
+    assert "Other Keyword" in store
+
+
+def test_index_should_survive_pickling(store: KeywordStore) -> None:
+    assert "Open Browser" in store
+
+    restored = pickle.loads(pickle.dumps(store))
+
+    assert restored == store
+    assert restored["Open Browser"].name == "Open Browser"
+    assert restored["Do That"].name == "Do ${something}"
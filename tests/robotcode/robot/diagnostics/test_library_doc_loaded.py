@@ -0,0 +1,40 @@
+from pathlib import Path
+from typing import Any, List, Tuple
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics.data_cache import CacheSection
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.imports_manager import ImportsManager
+from robotcode.robot.diagnostics.library_doc import LibraryDoc
+
+
+def _create_imports_manager(root: Path) -> ImportsManager:
+    workspace = Workspace(Uri.from_path(root), [WorkspaceFolder(root.name, Uri.from_path(root))])
+    helper = DocumentsCacheHelper(workspace, workspace.documents, FileWatcherManagerDummy(), None, None)
+    return helper.create_imports_manager(Uri.from_path(root))
+
+
+def test_loaded_library_docs_should_report_whether_they_are_cached(tmp_path: Path) -> None:
+    (tmp_path / "vars.py").write_text("A = 1\n")
+
+    loaded: List[Tuple[CacheSection, str, bool]] = []
+
+    def on_loaded(sender: Any, section: CacheSection, doc: LibraryDoc, cached: bool, elapsed: float) -> None:
+        assert elapsed >= 0
+        loaded.append((section, doc.name, cached))
+
+    for _ in range(2):
+        imports_manager = _create_imports_manager(tmp_path)
+        imports_manager.library_doc_loaded.add(on_loaded)
+
+        imports_manager.get_libdoc_for_library_import("Collections", (), str(tmp_path))
+        imports_manager.get_libdoc_for_variables_import("vars.py", (), str(tmp_path))
+
+    assert loaded == [
+        (CacheSection.LIBRARY, "Collections", False),
+        (CacheSection.VARIABLES, "vars", False),
+        (CacheSection.LIBRARY, "Collections", True),
+        (CacheSection.VARIABLES, "vars", True),
+    ]
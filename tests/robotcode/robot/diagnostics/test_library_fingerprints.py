@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+
+from robotcode.robot.diagnostics.library_fingerprints import (
+    LibraryFingerprints,
+    get_distribution_key,
+    get_location_fingerprints,
+)
+
+
+@pytest.fixture
+def package(tmp_path: Path) -> Path:
+    result = tmp_path / "mylib"
+    (result / "sub").mkdir(parents=True)
+    (result / "__init__.py").write_text("")
+    (result / "sub" / "keywords.py").write_text("")
+    (result / "data.txt").write_text("")
+    return result
+
+
+def test_local_packages_should_use_the_mtimes_of_the_python_files(package: Path) -> None:
+    assert set(get_location_fingerprints(str(package))) == {
+        str(package / "__init__.py"),
+        str(package / "sub" / "keywords.py"),
+    }
+
+
+@pytest.mark.parametrize("top_level", [True, False])
+def test_installed_packages_should_use_the_distribution_record(package: Path, top_level: bool) -> None:
+    dist_info = package.parent / "mylib-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "RECORD").write_text("mylib/__init__.py,,\nmylib/sub/keywords.py,,\n")
+    if top_level:
+        (dist_info / "top_level.txt").write_text("mylib\n")
+
+    other_dist_info = package.parent / "other-1.0.dist-info"
+    other_dist_info.mkdir()
+    (other_dist_info / "RECORD").write_text("other/__init__.py,,\n")
+
+    fingerprints = get_location_fingerprints(str(package))
+    assert list(fingerprints) == [str(dist_info / "RECORD")]
+
+    (dist_info / "RECORD").write_text("mylib/__init__.py,,\nmylib/sub/keywords.py,,\nmylib/new.py,,\n")
+    assert get_location_fingerprints(str(package)) != fingerprints
+
+
+def test_fingerprints_should_be_remembered_until_a_file_changes(package: Path) -> None:
+    fingerprints = LibraryFingerprints()
+
+    first = fingerprints.get(str(package))
+    (package / "sub" / "new.py").write_text("")
+    assert fingerprints.get(str(package)) is first
+
+    fingerprints.invalidate([package.parent / "other" / "file.py"])
+    assert fingerprints.get(str(package)) is first
+
+    fingerprints.invalidate([package / "sub" / "new.py"])
+    assert str(package / "sub" / "new.py") in fingerprints.get(str(package))
+
+
+def test_distribution_key_should_identify_the_installed_distribution(package: Path) -> None:
+    assert get_distribution_key(str(package / "sub" / "keywords.py")) is None
+
+    dist_info = package.parent / "mylib-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "RECORD").write_text("mylib/__init__.py,,\n")
+    (package.parent / "single.py").write_text("")
+    single_dist_info = package.parent / "single-2.0.dist-info"
+    single_dist_info.mkdir()
+    (single_dist_info / "RECORD").write_text("single.py,,\n")
+
+    key = get_distribution_key(str(package / "sub" / "keywords.py"))
+    assert key is not None
+    assert key.startswith("mylib-1.0/")
+
+    single_key = get_distribution_key(str(package.parent / "single.py"))
+    assert single_key is not None
+    assert single_key.startswith("single-2.0/")
+
+    (dist_info / "RECORD").write_text("mylib/__init__.py,,\nmylib/other.py,,\n")
+    assert get_distribution_key(str(package / "__init__.py")) != key
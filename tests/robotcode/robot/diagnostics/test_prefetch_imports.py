@@ -0,0 +1,131 @@
+import threading
+from concurrent.futures import wait
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+
+import pytest
+
+from robotcode.core.concurrent import Task, is_current_task_cancelled, run_as_task
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics import namespace as namespace_module
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.namespace import Namespace
+
+FILES = {
+    "suite.robot": """\
+*** Settings ***
+Library    Collections
+Resource    first.resource
+Library    String
+Library    ${LIB_FROM_VARFILE}
+Resource    missing.resource
+Variables    vars.py
+Library    ${LIB_FROM_VARFILE}
+Resource    second.resource
+Library    ${UNKNOWN}
+""",
+    "first.resource": "*** Settings ***\nResource    second.resource\nLibrary    OperatingSystem\n",
+    "second.resource": "*** Keywords ***\nDo Something\n    No Operation\n",
+    "vars.py": "LIB_FROM_VARFILE = 'varfile_lib.py'\n",
+    "varfile_lib.py": "def varfile_keyword():\n    pass\n",
+}
+
+
+def _read_document_text(sender: Any, uri: Uri) -> Optional[str]:
+    return uri.to_path().read_text()
+
+
+def _create_namespace(tmp_path: Path) -> Namespace:
+    workspace = Workspace(Uri.from_path(tmp_path), [WorkspaceFolder(tmp_path.name, Uri.from_path(tmp_path))])
+    workspace.documents.on_read_document_text.add(_read_document_text)
+
+    helper = DocumentsCacheHelper(workspace, workspace.documents, FileWatcherManagerDummy(), None, None)
+    document = helper.documents_manager.get_or_open_document(tmp_path / "suite.robot")
+
+    return helper.get_namespace(document)
+
+
+def _get_results(namespace: Namespace) -> Tuple[List[Tuple[str, Optional[str]]], List[Tuple[int, str, str]]]:
+    namespace.ensure_initialized()
+
+    return (
+        [(e.name, e.library_doc.source) for e in namespace.get_import_entries().values()],
+        [(d.range.start.line, str(d.code), d.message) for d in namespace.get_import_diagnostics()],
+    )
+
+
+@pytest.fixture
+def suite_dir(tmp_path: Path) -> Path:
+    for name, text in FILES.items():
+        (tmp_path / name).write_text(text)
+
+    return tmp_path
+
+
+def test_prefetch_should_stop_at_variables_imports_and_skip_unresolved_names(suite_dir: Path) -> None:
+    namespace = _create_namespace(suite_dir)
+    imports = namespace.get_imports()
+
+    prefetchable = namespace._get_prefetchable_imports(imports, str(suite_dir), namespace.get_suite_variables())
+
+    assert [i.name for i in prefetchable] == ["Collections", "first.resource", "String", "missing.resource"]
+
+
+def test_prefetch_should_not_change_import_order_and_diagnostics(
+    suite_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with monkeypatch.context() as m:
+        m.setattr(Namespace, "_prefetch_imports", lambda *args, **kwargs: None)
+        sequential = _get_results(_create_namespace(suite_dir))
+
+    prefetched = _get_results(_create_namespace(suite_dir))
+
+    assert prefetched == sequential
+    assert [name for name, _ in prefetched[0]] == [
+        "Collections",
+        "first",
+        "second",
+        "OperatingSystem",
+        "String",
+        "vars",
+        "varfile_lib",
+    ]
+    assert [(line, code) for line, code, _ in prefetched[1]] == [
+        (4, "DataError"),
+        (5, "DataError"),
+        (8, "ResourceAlreadyImported"),
+        (9, "DataError"),
+    ]
+
+
+def test_running_prefetch_should_not_be_flagged_as_cancelled(suite_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    passed = threading.Event()
+    cancelled: List[bool] = []
+
+    def run_as_started_task(callable: Callable[..., Any], *args: Any) -> Task[Any]:
+        started = threading.Event()
+
+        def run() -> Any:
+            started.set()
+            # keep the task running until the current thread has run all imports the tasks have not claimed
+            passed.wait(30)
+            cancelled.append(is_current_task_cancelled())
+            return callable(*args)
+
+        task = run_as_task(run)
+        assert started.wait(30)
+        return task
+
+    def wait_passed(fs: Any) -> Any:
+        passed.set()
+        return wait(fs)
+
+    monkeypatch.setattr(namespace_module, "run_as_task", run_as_started_task)
+    monkeypatch.setattr(namespace_module, "wait", wait_passed)
+
+    namespace = _create_namespace(suite_dir)
+    namespace._prefetch_imports(namespace.get_imports(), str(suite_dir))
+
+    assert cancelled == [False, False, False, False]
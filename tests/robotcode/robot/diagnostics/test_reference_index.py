@@ -0,0 +1,77 @@
+import pickle
+
+from robotcode.robot.diagnostics.entities import VariableDefinition
+from robotcode.robot.diagnostics.library_doc import KeywordDoc, LibraryDoc
+from robotcode.robot.diagnostics.reference_index import ReferenceIndex, keyword_key, variable_key
+
+
+def _keyword(name: str) -> KeywordDoc:
+    return KeywordDoc(line_no=1, col_offset=0, end_line_no=1, end_col_offset=0, source="test.resource", name=name)
+
+
+def _variable(name: str) -> VariableDefinition:
+    return VariableDefinition(
+        line_no=1, col_offset=0, end_line_no=1, end_col_offset=0, source="test.resource", name=name, name_token=None
+    )
+
+
+def test_candidates_should_contain_only_hits_and_not_indexed_documents() -> None:
+    index = ReferenceIndex()
+    first = _keyword("First")
+
+    index.update_document("file:///a.robot", [first], [], [])
+    index.update_document("file:///b.robot", [_keyword("Second")], [], [])
+
+    candidates = index.keyword_candidates(first)
+
+    assert "file:///a.robot" in candidates
+    assert "file:///b.robot" not in candidates
+    assert "file:///not_indexed.robot" in candidates
+
+
+def test_update_should_replace_the_previous_keys_of_a_document() -> None:
+    index = ReferenceIndex()
+    variable = _variable("${var}")
+
+    index.update_document("file:///a.robot", [], [variable], ["Smoke Test"])
+    assert "file:///a.robot" in index.variable_candidates(variable)
+    assert "file:///a.robot" in index.tag_candidates("smoketest")
+
+    index.update_document("file:///a.robot", [], [], [])
+    assert "file:///a.robot" not in index.variable_candidates(variable)
+    assert "file:///a.robot" not in index.tag_candidates("SMOKE_TEST")
+
+
+def test_removed_document_should_be_a_candidate_again() -> None:
+    index = ReferenceIndex()
+
+    index.update_document("file:///a.robot", [], [], [])
+    assert "file:///a.robot" not in index.keyword_candidates(_keyword("First"))
+
+    index.remove_document("file:///a.robot")
+
+    assert not index.is_indexed("file:///a.robot")
+    assert "file:///a.robot" in index.keyword_candidates(_keyword("First"))
+    assert len(index) == 0
+
+
+def test_keys_from_other_processes_should_find_the_entities() -> None:
+    index = ReferenceIndex()
+    keyword = _keyword("First")
+    variable = _variable("${var}")
+
+    # a keyword loaded in another process belongs to another library doc, so it is never equal
+    other_keyword = pickle.loads(pickle.dumps(_keyword("First")))
+    other_keyword.parent = LibraryDoc(name="other")
+    assert other_keyword != keyword
+
+    index.update_document_keys(
+        "file:///a.robot",
+        pickle.loads(pickle.dumps([keyword_key(other_keyword)])),
+        pickle.loads(pickle.dumps([variable_key(_variable("${var}"))])),
+        [],
+    )
+
+    assert "file:///a.robot" in index.keyword_candidates(keyword)
+    assert "file:///a.robot" in index.variable_candidates(variable)
+    assert "file:///a.robot" not in index.keyword_candidates(_keyword("Second"))
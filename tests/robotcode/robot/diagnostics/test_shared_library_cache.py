@@ -0,0 +1,86 @@
+from pathlib import Path
+from typing import Any
+
+import platformdirs
+import pytest
+
+from robotcode.core.filewatcher import FileWatcherManagerDummy
+from robotcode.core.uri import Uri
+from robotcode.core.workspace import Workspace, WorkspaceFolder
+from robotcode.robot.diagnostics.data_cache import SqliteDataCache
+from robotcode.robot.diagnostics.document_cache_helper import DocumentsCacheHelper
+from robotcode.robot.diagnostics.imports_manager import ImportsManager
+from robotcode.robot.diagnostics.workspace_config import CacheConfig, WorkspaceAnalysisConfig
+
+
+def _create_imports_manager(root: Path) -> ImportsManager:
+    root.mkdir()
+    workspace = Workspace(Uri.from_path(root), [WorkspaceFolder(root.name, Uri.from_path(root))])
+    helper = DocumentsCacheHelper(
+        workspace,
+        workspace.documents,
+        FileWatcherManagerDummy(),
+        None,
+        WorkspaceAnalysisConfig(cache=CacheConfig(shared_cache=True)),
+    )
+    return helper.create_imports_manager(Uri.from_path(root))
+
+
+def test_installed_libraries_should_be_loaded_from_the_shared_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(platformdirs, "user_cache_dir", lambda *args, **kwargs: str(tmp_path / "user_cache"))
+
+    first = _create_imports_manager(tmp_path / "first")
+    assert first.shared_data_cache is not None
+    assert first.shared_data_cache.cache_dir == tmp_path / "user_cache" / "libdoc"
+
+    library_doc = first.get_libdoc_for_library_import("Collections", (), str(tmp_path / "first"))
+    assert not library_doc.errors
+    assert first.shared_data_cache.stats().entries == 1
+
+    second = _create_imports_manager(tmp_path / "second")
+
+    def no_worker_pool(self: ImportsManager) -> Any:
+        pytest.fail("the library should not be loaded in a worker process")
+
+    monkeypatch.setattr(ImportsManager, "worker_pool", property(no_worker_pool))
+
+    shared_doc = second.get_libdoc_for_library_import("Collections", (), str(tmp_path / "second"))
+    assert shared_doc.name == library_doc.name
+    assert [k.name for k in shared_doc.keywords] == [k.name for k in library_doc.keywords]
+
+
+def test_libraries_with_arguments_should_not_be_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(platformdirs, "user_cache_dir", lambda *args, **kwargs: str(tmp_path / "user_cache"))
+
+    imports_manager = _create_imports_manager(tmp_path / "root")
+    assert imports_manager.shared_data_cache is not None
+
+    imports_manager.get_libdoc_for_library_import("Telnet", ("timeout=5",), str(tmp_path / "root"))
+
+    assert imports_manager.shared_data_cache.stats().entries == 0
+
+
+def test_shared_cache_should_only_be_pruned_if_it_exceeds_the_max_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(platformdirs, "user_cache_dir", lambda *args, **kwargs: str(tmp_path / "user_cache"))
+
+    pruned = []
+
+    def prune(self: SqliteDataCache, *args: Any, **kwargs: Any) -> int:
+        pruned.append(kwargs.get("max_size"))
+        return 0
+
+    monkeypatch.setattr(SqliteDataCache, "prune", prune)
+
+    imports_manager = _create_imports_manager(tmp_path / "root")
+    imports_manager.get_libdoc_for_library_import("Collections", (), str(tmp_path / "root"))
+
+    assert pruned == []
+
+    imports_manager.shared_cache_max_size = 1
+    imports_manager.get_libdoc_for_library_import("String", (), str(tmp_path / "root"))
+
+    assert pruned == [1]
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+from concurrent.futures import TimeoutError
+from pathlib import Path
+from typing import Iterator, Set
+
+import pytest
+
+from robotcode.robot.diagnostics import worker_pool
+from robotcode.robot.diagnostics.worker_pool import LibraryWorkerPool
+
+
+def _get_pid() -> int:
+    return os.getpid()
+
+
+def _sleep(seconds: float) -> int:
+    time.sleep(seconds)
+    return os.getpid()
+
+
+@pytest.fixture
+def pool() -> Iterator[LibraryWorkerPool]:
+    result = LibraryWorkerPool(max_workers=2, max_jobs_per_worker=3, max_worker_memory=0)
+    try:
+        yield result
+    finally:
+        result.shutdown()
+
+
+def test_worker_is_reused_between_jobs(pool: LibraryWorkerPool) -> None:
+    pids = {pool.submit(_get_pid, timeout=60) for _ in range(2)}
+
+    assert os.getpid() not in pids
+    assert len(pids) == 1
+
+
+def test_worker_is_recycled_after_max_jobs(pool: LibraryWorkerPool) -> None:
+    pids = [pool.submit(_get_pid, timeout=60) for _ in range(4)]
+
+    assert pids[0] == pids[1] == pids[2]
+    assert pids[3] != pids[0]
+
+
+def test_timeout_only_kills_the_worker_of_the_job(pool: LibraryWorkerPool) -> None:
+    pool.start()
+
+    with pytest.raises(TimeoutError):
+        pool.submit(_sleep, 30, timeout=1)
+
+    assert pool.worker_count == 2
+    assert pool.submit(_sleep, 0, timeout=60) != os.getpid()
+
+
+def test_submit_after_shutdown_raises(pool: LibraryWorkerPool) -> None:
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit(_get_pid, timeout=60)
+
+
+def _import_modules(path: str) -> int:
+    sys.path.insert(0, path)
+
+    import colorsys  # noqa: F401
+
+    import my_worker_library  # type: ignore[import-not-found] # noqa: F401
+
+    return os.getpid()
+
+
+def _loaded_modules(*names: str) -> Set[str]:
+    return {name for name in names if name in sys.modules}
+
+
+def test_only_modules_of_own_libraries_are_removed_after_a_job(tmp_path: Path) -> None:
+    (tmp_path / "my_worker_library.py").write_text("VALUE = 1\n")
+
+    pool = LibraryWorkerPool(max_workers=1, max_jobs_per_worker=0, max_worker_memory=0)
+    try:
+        pid = pool.submit(_import_modules, str(tmp_path), timeout=60)
+
+        assert pool.submit(_get_pid, timeout=60) == pid
+        assert pool.submit(_loaded_modules, "colorsys", "my_worker_library", timeout=60) == {"colorsys"}
+    finally:
+        pool.shutdown()
+
+
+def test_worker_is_killed_if_warmup_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(worker_pool, "WARMUP_TIME_OUT", 0)
+
+    pool = LibraryWorkerPool(max_workers=1, max_jobs_per_worker=0, max_worker_memory=0)
+    try:
+        pool.start()
+        worker = pool._workers[0]
+
+        with pytest.raises(TimeoutError):
+            pool.submit(_get_pid, timeout=60)
+
+        assert worker not in pool._workers
+
+        monkeypatch.setattr(worker_pool, "WARMUP_TIME_OUT", 60)
+
+        assert pool.worker_count == 1
+        assert pool.submit(_get_pid, timeout=60) != os.getpid()
+    finally:
+        pool.shutdown()